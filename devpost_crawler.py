@@ -1308,28 +1308,22 @@ def save_hackathons_to_csv(hackathons: List[Dict[str, Any]], filename: str) -> N
         print("No hackathons to save")
         return
     
-    # Prepare data for CSV
-    cleaned_hackathons = []
-    for hackathon in hackathons:
-        # Convert any dict/list fields to JSON strings for CSV compatibility
-        cleaned_hackathon = {}
-        for key, value in hackathon.items():
-            if isinstance(value, (dict, list)):
-                cleaned_hackathon[key] = json.dumps(value)
-            else:
-                cleaned_hackathon[key] = value
-        cleaned_hackathons.append(cleaned_hackathon)
-    
     # Collect all fields from all hackathons
     fieldnames = set()
-    for hackathon in cleaned_hackathons:
+    for hackathon in hackathons:
         fieldnames.update(hackathon.keys())
+    fieldnames = sorted(fieldnames)
     
-    # Write to CSV
+    # Write to CSV one row at a time, converting any dict/list fields to JSON
+    # strings for CSV compatibility as each row is written
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=sorted(fieldnames))
-        writer.writeheader()
-        writer.writerows(cleaned_hackathons)
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        for hackathon in hackathons:
+            writer.writerow([
+                json.dumps(value) if isinstance(value, (dict, list)) else value
+                for value in (hackathon.get(field, '') for field in fieldnames)
+            ])
     
     print(f"Saved {len(hackathons)} hackathons to '{filename}'")
 
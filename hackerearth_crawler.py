@@ -925,33 +925,35 @@ async def crawl_hackerearth_hackathons():
             for _ in range(concurrency - 1):
                 pages.append(await context.new_page())
             
-            # Process hackathons in batches
+            # Hand pages out from a queue so every page starts on the next
+            # hackathon as soon as it is free, instead of waiting for the
+            # slowest page of a fixed batch
+            page_queue = asyncio.Queue()
+            for hackathon_page in pages:
+                page_queue.put_nowait(hackathon_page)
+            
+            async def scrape_one(url):
+                hackathon_page = await page_queue.get()
+                try:
+                    return await extract_hackathon_details(hackathon_page, url, listing_data)
+                finally:
+                    # Space out the requests made from each page to avoid rate limiting
+                    await smart_wait()
+                    page_queue.put_nowait(hackathon_page)
+            
+            results = await asyncio.gather(
+                *(scrape_one(url) for url in hackathon_links), return_exceptions=True
+            )
+            
+            # Process results
             all_hackathons = []
-            for i in range(0, len(hackathon_links), concurrency):
-                batch = hackathon_links[i:i+concurrency]
-                tasks = []
-                
-                for j, url in enumerate(batch):
-                    # Use the appropriate page from the pool
-                    hackathon_page = pages[j % len(pages)]
-                    
-                    # Create the task with listing data
-                    tasks.append(extract_hackathon_details(hackathon_page, url, listing_data))
-                
-                # Wait for all tasks in this batch to complete
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        print(f"Error during extraction: {result}")
-                    elif result:  # If not None
-                        all_hackathons.append(result)
-                
-                print(f"Processed batch {i//concurrency + 1}, total hackathons so far: {len(all_hackathons)}")
-                
-                # Add a small delay between batches to avoid rate limiting
-                await smart_wait(2, 4)
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Error during extraction: {result}")
+                elif result:  # If not None
+                    all_hackathons.append(result)
+            
+            print(f"Processed {len(hackathon_links)} hackathon pages, total hackathons: {len(all_hackathons)}")
             
             # Save results to CSV
             if all_hackathons:
@@ -2,6 +2,7 @@ import os
 import sys
 import uuid
 import json
+import orjson
 import pandas as pd
 import numpy as np
 import re
@@ -635,12 +636,152 @@ def validate_record(record, index):
     # Return True if record is valid
     return True
 
+def post_batch(supabase: Client, batch):
+    """Insert a batch into the hackathons table with an orjson-encoded body"""
+    # Encoding the body ourselves skips the stdlib json.dumps pass that
+    # table().insert() goes through, and return=minimal skips echoing rows back.
+    # Rows whose url is already in the table are skipped instead of failing the batch.
+    body = orjson.dumps(batch, option=orjson.OPT_SERIALIZE_NUMPY)
+    return supabase.postgrest.session.post(
+        '/hackathons',
+        params={'on_conflict': 'url'},
+        content=body,
+        headers={'Content-Type': 'application/json', 'Prefer': 'return=minimal,resolution=ignore-duplicates'}
+    )
+
+def records_iter(data_df):
+    """Yield (index, json_record) pairs, with None for records that fail conversion or validation"""
+    # Pull each column out as an object array once instead of boxing every
+    # row into a dict; object dtype keeps Timestamps/NaT and native ints
+    column_names = list(data_df.columns)
+    columns = {col: data_df[col].to_numpy(dtype=object) for col in column_names}
+    total_rows = len(data_df)
+
+    # Process each record individually so one bad row doesn't stop the rest
+    for i in range(total_rows):
+        record = {col: columns[col][i] for col in column_names}
+        try:
+            # Fix handling of empty arrays or lists
+            for field in ['tags', 'prizes_details']:
+                if field in record:
+                    # Convert numpy arrays and pandas series to lists
+                    if isinstance(record[field], (np.ndarray, pd.Series)):
+                        record[field] = list(record[field])
+                    # Ensure empty arrays are properly handled
+                    elif record[field] is None or (hasattr(record[field], '__len__') and len(record[field]) == 0):
+                        record[field] = []
+            
+            json_record = json_serializable_record(record)
+            
+            # Final check for date fields to ensure no "NaT" strings
+            for date_field in ['start_date', 'end_date', 'registration_deadline']:
+                if date_field in json_record and (json_record[date_field] == "NaT" or str(json_record[date_field]).strip() == "NaT"):
+                    print(f"  Fixing {date_field} with value 'NaT' in record {i}")
+                    json_record[date_field] = None
+            
+            # Validate the record
+            if not validate_record(json_record, i):
+                yield i, None
+                continue
+            
+            yield i, json_record
+        except Exception as e:
+            print(f"Error processing record {i}: {str(e)}")
+            print(f"Problematic record: {record}")
+            yield i, None
+
+def print_rls_help():
+    """Explain how to get past Row Level Security insert errors"""
+    print(f"Row Level Security Error: You don't have permission to insert records.")
+    print("To fix this, either:")
+    print("1. Add SUPABASE_SERVICE_KEY to your .env file (get it from Project Settings > API > service_role key)")
+    print("2. Modify RLS policies in Supabase dashboard to allow INSERT operations for your user")
+    print("Aborting remaining inserts.")
+
+def run_inserts(supabase: Client, records, total_records, batch_size=10):
+    """Insert converted records in batches and return an (inserted, failed) tuple"""
+    inserted = 0
+    failed = 0
+    converted = 0
+    batch_number = 0
+    batch = []
+    
+    def flush(batch, batch_number):
+        """Insert one batch, returning (ok, abort)"""
+        try:
+            response = post_batch(supabase, batch)
+            
+            # Check for errors
+            if response.is_error:
+                if '42501' in response.text:
+                    print_rls_help()
+                    return False, True
+                print(f"Error inserting batch {batch_number}: {response.text}")
+                return False, False
+            
+            print(f"Successfully inserted batch {batch_number} ({len(batch)} records)")
+            return True, False
+        except Exception as e:
+            error_msg = str(e)
+            if "row-level security" in error_msg.lower() or "42501" in error_msg:
+                print_rls_help()
+                return False, True
+            
+            print(f"Exception in batch {batch_number}: {error_msg}")
+            # Print the first record that caused the error for debugging
+            try:
+                # Safely convert to JSON string with fallback
+                record_str = json.dumps(batch[0], indent=2, default=str)[:500]
+                print(f"First record in batch: {record_str}...")
+            except:
+                print("Could not serialize record for display")
+            return False, False
+    
+    for _, record in records:
+        if record is None:
+            failed += 1
+            continue
+        
+        converted += 1
+        batch.append(record)
+        if len(batch) < batch_size:
+            continue
+        
+        batch_number += 1
+        ok, abort = flush(batch, batch_number)
+        if ok:
+            inserted += len(batch)
+        else:
+            failed += len(batch)
+        batch = []
+        if abort:
+            # Records that were never sent count as failed too
+            return inserted, total_records - inserted
+    
+    print(f"Successfully converted {converted} out of {total_records} records")
+    if converted == 0:
+        print("No valid records to insert after conversion.")
+    
+    # Insert whatever is left over from the last partial batch
+    if batch:
+        batch_number += 1
+        ok, _ = flush(batch, batch_number)
+        if ok:
+            inserted += len(batch)
+        else:
+            failed += len(batch)
+    
+    return inserted, failed
+
 def insert_data_to_supabase(supabase: Client, data_df, existing_urls=None):
-    """Insert data into Supabase, skipping duplicates"""
+    """Insert data into Supabase, skipping duplicates.
+    
+    Returns an (inserted, failed) tuple.
+    """
     # Safety check - ensure dataframe isn't empty
     if data_df.empty:
         print("Error: No data to process. The input dataframe is empty.")
-        return
+        return 0, 0
         
     # If we have existing URLs, filter out duplicates
     if existing_urls is not None:
@@ -649,7 +790,7 @@ def insert_data_to_supabase(supabase: Client, data_df, existing_urls=None):
     # If no new hackathons to add, return early
     if len(data_df) == 0:
         print("No new hackathons to insert. All are already in the database.")
-        return
+        return 0, 0
     
     # Explicitly handle NaT values in date columns before serialization
     print("Fixing NaT values in date columns...")
@@ -661,101 +802,14 @@ def insert_data_to_supabase(supabase: Client, data_df, existing_urls=None):
                 print(f"  Found {nat_count} NaT values in {date_col}")
             data_df[date_col] = data_df[date_col].where(~pd.isna(data_df[date_col]), None)
     
-    # Convert DataFrame to records safely
-    try:
-        print("Converting data to JSON-serializable format...")
-        records = data_df.to_dict(orient='records')
-        json_records = []
-        
-        # Process each record individually to catch and handle any errors
-        for i, record in enumerate(records):
-            try:
-                # Fix handling of empty arrays or lists
-                for field in ['tags', 'prizes_details']:
-                    if field in record:
-                        # Convert numpy arrays and pandas series to lists
-                        if isinstance(record[field], (np.ndarray, pd.Series)):
-                            record[field] = list(record[field])
-                        # Ensure empty arrays are properly handled
-                        elif record[field] is None or (hasattr(record[field], '__len__') and len(record[field]) == 0):
-                            record[field] = []
-                
-                json_record = json_serializable_record(record)
-                
-                # Final check for date fields to ensure no "NaT" strings
-                for date_field in ['start_date', 'end_date', 'registration_deadline']:
-                    if date_field in json_record and (json_record[date_field] == "NaT" or str(json_record[date_field]).strip() == "NaT"):
-                        print(f"  Fixing {date_field} with value 'NaT' in record {i}")
-                        json_record[date_field] = None
-                
-                # Validate the record
-                if not validate_record(json_record, i):
-                    continue
-                
-                json_records.append(json_record)
-            except Exception as e:
-                print(f"Error processing record {i}: {str(e)}")
-                print(f"Problematic record: {record}")
-                # Continue with other records
-        
-        print(f"Successfully converted {len(json_records)} out of {len(records)} records")
-        
-        if len(json_records) == 0:
-            print("No valid records to insert after conversion. Aborting.")
-            return
-    
-    except Exception as e:
-        print(f"Error during data conversion: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return
-    
-    # Insert data in batches to avoid timeout issues
-    BATCH_SIZE = 10
-    total_records = len(json_records)
-    successful = 0
+    # Records are converted lazily as the insert runner consumes them, so a
+    # bad record only costs itself rather than the whole import
+    print("Converting and inserting records in batches...")
+    total_records = len(data_df)
+    inserted, failed = run_inserts(supabase, records_iter(data_df), total_records)
     
-    for i in range(0, total_records, BATCH_SIZE):
-        batch = json_records[i:i+BATCH_SIZE]
-        try:
-            # Insert data into the hackathons table
-            response = supabase.table('hackathons').insert(batch).execute()
-            
-            # Check for errors
-            if hasattr(response, 'error') and response.error:
-                if '42501' in str(response.error):
-                    print(f"Row Level Security Error: You don't have permission to insert records.")
-                    print("To fix this, either:")
-                    print("1. Add SUPABASE_SERVICE_KEY to your .env file (get it from Project Settings > API > service_role key)")
-                    print("2. Modify RLS policies in Supabase dashboard to allow INSERT operations for your user")
-                    print("Aborting remaining inserts.")
-                    break
-                else:
-                    print(f"Error inserting batch {i//BATCH_SIZE + 1}: {response.error}")
-            else:
-                successful += len(batch)
-                print(f"Successfully inserted batch {i//BATCH_SIZE + 1} ({len(batch)} records)")
-        except Exception as e:
-            error_msg = str(e)
-            if "row-level security" in error_msg.lower() or "42501" in error_msg:
-                print(f"Row Level Security Error: You don't have permission to insert records.")
-                print("To fix this, either:")
-                print("1. Add SUPABASE_SERVICE_KEY to your .env file (get it from Project Settings > API > service_role key)")
-                print("2. Modify RLS policies in Supabase dashboard to allow INSERT operations for your user")
-                print("Aborting remaining inserts.")
-                break
-            else:
-                print(f"Exception in batch {i//BATCH_SIZE + 1}: {error_msg}")
-                # Print the first record that caused the error for debugging
-                if batch:
-                    try:
-                        # Safely convert to JSON string with fallback
-                        record_str = json.dumps(batch[0], indent=2, default=str)[:500]
-                        print(f"First record in batch: {record_str}...")
-                    except:
-                        print("Could not serialize record for display")
-    
-    print(f"Import complete. Successfully inserted {successful} out of {total_records} new records.")
+    print(f"Import complete. Successfully inserted {inserted} out of {total_records} new records ({failed} failed).")
+    return inserted, failed
 
 def main():
     try:
@@ -1,18 +1,21 @@
 import asyncio
+import atexit
 import csv
-import json
+import hashlib
+import io
+import orjson
 import os
+import random
 import time
 import re
 from datetime import datetime
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright, Error as PlaywrightError
-import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 from dotenv import load_dotenv
 import traceback
-import cloudinary
-import cloudinary.uploader
-import aiohttp
 
 # Load environment variables
 load_dotenv()
@@ -23,7 +26,10 @@ CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
 CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
 
 # Configure Cloudinary if credentials are available
+# The SDK is only imported when it will actually be used
 if CLOUDINARY_CLOUD_NAME and CLOUDINARY_API_KEY and CLOUDINARY_API_SECRET:
+    import cloudinary
+    import cloudinary.uploader
     cloudinary.config(
         cloud_name=CLOUDINARY_CLOUD_NAME,
         api_key=CLOUDINARY_API_KEY,
@@ -40,23 +46,153 @@ BASE_URL = "https://www.kaggle.com/competitions"
 DEFAULT_PARAMS = "?listOption=active"
 OUTPUT_CSV = f"kaggle_competitions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 REQUIRED_FIELDS = ["title", "start_date", "end_date", "prize_pool", "logo_url"]
+# Listing card fields that let a competition skip its detail pages. Records that take
+# the shortcut go without the detail-only fields (abstract, banner, timeline and the
+# prize breakdown)
+DETAIL_COMPLETE_FIELDS = ["title", "logo_url", "description", "prize", "deadline"]
 MAX_COMPETITIONS = 100
-DEBUG_MODE = True
+DEBUG_MODE = os.getenv("KAGGLE_DEBUG") == "1"  # Set KAGGLE_DEBUG=1 for screenshots and debug dumps
+DUMP_HTML = DEBUG_MODE and os.getenv("KAGGLE_DUMP_HTML") == "1"  # Full page HTML dumps are opt-in on top of that
+# Optional comma-separated competition slugs; when set, only those competitions get HTML dumps
+DUMP_HTML_IDS = {slug.strip() for slug in os.getenv("KAGGLE_DUMP_HTML_IDS", "").split(",") if slug.strip()}
 MAX_RETRIES = 3
 MIN_RATE_LIMIT_DELAY = 1
 MAX_RATE_LIMIT_DELAY = 3
 MAX_PAGES = 10  # Maximum number of pages to check
+RETRY_AFTER_RE = re.compile(r'Retry-After\W+(\d+(?:\.\d+)?)', re.IGNORECASE)
+COMPETITION_SLUG_RE = re.compile(r'/(?:competitions|c)/([A-Za-z0-9_\-]+)')
+CLOUDINARY_CONCURRENCY = 8  # Maximum number of Cloudinary uploads in flight
+# Shared competition link extractor, installed once per browser context so the
+# fallback paths call a ready-made function instead of re-sending the same script
+COMPETITION_LINKS_INIT_SCRIPT = """
+window.__extractCompetitionLinks = () => {
+    const SLUG_RE = /\\/(?:competitions|c)\\/([a-zA-Z0-9\\-_]+)/;
+    const seenSlugs = new Set();
+    const links = [];
+    
+    for (const a of document.querySelectorAll('a[href*="/c/"], a[href*="/competitions/"]')) {
+        const href = a.getAttribute('href');
+        // Filter out links to the competition listing page itself
+        if (href.includes('/competitions?') || 
+            href.includes('/competitions/list') ||
+            href.includes('listOption=')) {
+            continue;
+        }
+        
+        // Remove duplicates by slug so /c/x and /competitions/x/overview collapse into one URL
+        const match = href.match(SLUG_RE);
+        if (match && !seenSlugs.has(match[1])) {
+            seenSlugs.add(match[1]);
+            links.push('https://www.kaggle.com/competitions/' + match[1]);
+        }
+    }
+    
+    return links;
+};
+"""
+DETAIL_READY_SELECTOR = 'h1.competition-name, [class*="competition-header"]'
+DETAIL_READY_TIMEOUT = 8000
+# Candidate competition card selectors, in order of specificity
+COMPETITION_SELECTORS = (
+    '.competitions-list-view .competition-item',
+    '.competitions-list .competition-item',
+    '.competitionsContainer .competition-item',
+    '.competitions .competition-item',
+    '.competition-item',
+    '.competition-card',
+    'a[href*="/competitions/"]',
+    '.card, .card-item'
+)
+LISTING_CONCURRENCY = 3  # Number of listing pages crawled at the same time
+DETAIL_CONCURRENCY = 5  # Number of competition detail pages processed at the same time
+LISTING_NAVIGATION_TIMEOUT = 15000  # Milliseconds before a listing page is skipped
+# Listing scans only read img.src, never the image bytes. Stylesheets stay
+# enabled because the logo heuristics rely on rendered image sizes.
+LISTING_BLOCKED_RESOURCES = {"image", "font", "media"}
+# Kaggle's listing page loads its cards from this JSON endpoint, which already
+# carries each competition's dates and reward
+LISTING_API_MARKER = "ListCompetitions"
+
+# Third-party assets the detail extractors never read. The organizer avatar URL
+# comes from an inline background-image style, so it survives the block.
+DETAIL_BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet"}
+DETAIL_BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
 
 # Directory for screenshots and debug info
 os.makedirs("screenshots", exist_ok=True)
 os.makedirs("debug", exist_ok=True)
 
+# Extracted competition details from earlier runs, one JSON file per competition
+COMPETITION_CACHE_DIR = Path("cache/competitions")
+COMPETITION_CACHE_TTL = 24 * 60 * 60  # Seconds before a cached running competition is scraped again
+COMPETITION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Cookies and local storage saved at the end of a run, so the next run starts warm.
+# The file holds session cookies: it is git-ignored, and KAGGLE_STORAGE_STATE can
+# point it outside the repository instead
+STORAGE_STATE_FILE = os.getenv("KAGGLE_STORAGE_STATE", "cache/storage_state.json")
+
+# Cloudinary URLs of images uploaded by earlier runs, keyed by a hash of the source URL
+CLOUDINARY_CACHE_FILE = "debug/cloudinary_cache.json"
+
+def load_cloudinary_cache():
+    """Load the cache of already uploaded images from disk."""
+    try:
+        with open(CLOUDINARY_CACHE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def save_cloudinary_cache():
+    """Persist the cache of uploaded images so re-runs skip them."""
+    try:
+        with open(CLOUDINARY_CACHE_FILE, "wb") as f:
+            f.write(orjson.dumps(cloudinary_cache))
+    except OSError as e:
+        print(f"Error saving Cloudinary cache: {e}")
+
+@lru_cache(maxsize=4096)
+def cloudinary_cache_key(image_url):
+    """Short, stable cache key for an image URL."""
+    return hashlib.blake2b(image_url.encode("utf-8"), digest_size=16).hexdigest()
+
+cloudinary_cache = load_cloudinary_cache()
+atexit.register(save_cloudinary_cache)
+
+# Bounds concurrent uploads; the blocking Cloudinary SDK calls run in worker threads
+cloudinary_semaphore = asyncio.Semaphore(CLOUDINARY_CONCURRENCY)
+
+# Uploads currently running, keyed like the cache, so concurrent callers share one
+cloudinary_pending_uploads = {}
+
+# Shared HTTP session so image downloads reuse pooled connections
+http_session = None
+
+async def get_session():
+    """Return the shared aiohttp session, creating it on first use."""
+    global http_session
+    if http_session is None or http_session.closed:
+        # Only the Cloudinary fallback downloads images, so import aiohttp on first use
+        import aiohttp
+        http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+    return http_session
+
+async def close_session():
+    """Close the shared aiohttp session if it was opened."""
+    global http_session
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
 # Add delay between requests to avoid rate limiting
 async def smart_wait(min_delay=MIN_RATE_LIMIT_DELAY, max_delay=MAX_RATE_LIMIT_DELAY):
     """Wait for a random amount of time to avoid rate limiting."""
-    import random
     delay = random.uniform(min_delay, max_delay)
-    print(f"Waiting for {delay:.2f} seconds to avoid rate limiting...")
+    if DEBUG_MODE:
+        print(f"Waiting for {delay:.2f} seconds to avoid rate limiting...")
     await asyncio.sleep(delay)
 
 async def upload_image_to_cloudinary(image_url, competition_id, image_type):
@@ -73,91 +209,196 @@ async def upload_image_to_cloudinary(image_url, competition_id, image_type):
     if not CLOUDINARY_ENABLED or not image_url:
         return image_url
     
-    try:
-        print(f"Uploading {image_type} for {competition_id} to Cloudinary...")
-        
-        # Create a unique public_id based on competition and image type
-        public_id = f"kaggle_{image_type}_{competition_id}"
-        
-        # Remove any query parameters from URL for more reliable uploads
-        clean_url = image_url.split('?')[0]
-        
-        # Upload using Cloudinary's upload API
-        result = cloudinary.uploader.upload(
-            clean_url,
-            public_id=public_id,
-            folder="kaggle_images",
-            overwrite=True,
-            resource_type="auto"
+    # Create a unique public_id based on competition and image type
+    public_id = f"kaggle_{image_type}_{competition_id}"
+    
+    # Remove any query parameters from URL for more reliable uploads
+    clean_url = image_url.split('?')[0]
+    
+    # Skip the upload entirely if this image was already uploaded
+    cache_key = cloudinary_cache_key(clean_url)
+    if cache_key in cloudinary_cache:
+        if DEBUG_MODE:
+            print(f"Using cached Cloudinary URL for {image_type} of {competition_id}")
+        return cloudinary_cache[cache_key]
+    
+    # Competitions that share a logo wait on the upload already in flight
+    # instead of uploading the same image again
+    pending = cloudinary_pending_uploads.get(cache_key)
+    if pending is None:
+        pending = asyncio.ensure_future(
+            upload_uncached_image(image_url, clean_url, cache_key, public_id, image_type)
         )
+        cloudinary_pending_uploads[cache_key] = pending
+        pending.add_done_callback(lambda _: cloudinary_pending_uploads.pop(cache_key, None))
+    elif DEBUG_MODE:
+        print(f"Waiting for in-flight upload of {image_type} for {competition_id}")
+    return await pending
+
+async def upload_uncached_image(image_url, clean_url, cache_key, public_id, image_type):
+    """Upload an image that is not in the cache yet and record its Cloudinary URL."""
+    async with cloudinary_semaphore:
+        try:
+            if DEBUG_MODE:
+                print(f"Uploading {image_type} {public_id} to Cloudinary...")
+        
+            # Upload using Cloudinary's upload API without blocking the event loop
+            result = await asyncio.to_thread(
+                cloudinary.uploader.upload,
+                clean_url,
+                public_id=public_id,
+                folder="kaggle_images",
+                overwrite=True,
+                resource_type="auto"
+            )
         
-        # Return the secure URL
-        cloudinary_url = result['secure_url']
-        print(f"Uploaded {image_type} to Cloudinary: {cloudinary_url}")
-        return cloudinary_url
+            # Return the secure URL
+            cloudinary_url = result['secure_url']
+            cloudinary_cache[cache_key] = cloudinary_url
+            print(f"Uploaded {image_type} to Cloudinary: {cloudinary_url}")
+            return cloudinary_url
     
-    except Exception as e:
-        print(f"Error uploading {image_type} to Cloudinary: {e}")
-        # Try a second approach with aiohttp for images that might need special handling
-        try:
-            async with aiohttp.ClientSession() as session:
+        except Exception as e:
+            print(f"Error uploading {image_type} to Cloudinary: {e}")
+            # Try a second approach with aiohttp for images that might need special handling
+            try:
+                session = await get_session()
                 async with session.get(image_url) as response:
                     if response.status == 200:
-                        # Create a temporary file
-                        temp_file = f"temp_{competition_id}_{image_type}.jpg"
-                        with open(temp_file, 'wb') as f:
-                            f.write(await response.read())
-                        
-                        # Upload the file
-                        result = cloudinary.uploader.upload(
-                            temp_file,
+                        # Upload the downloaded bytes straight from memory
+                        data = await response.read()
+                        result = await asyncio.to_thread(
+                            cloudinary.uploader.upload,
+                            io.BytesIO(data),
                             public_id=public_id,
                             folder="kaggle_images",
                             overwrite=True,
                             resource_type="auto"
                         )
                         
-                        # Clean up temp file
-                        if os.path.exists(temp_file):
-                            os.remove(temp_file)
-                            
                         cloudinary_url = result['secure_url']
+                        cloudinary_cache[cache_key] = cloudinary_url
                         print(f"Uploaded {image_type} to Cloudinary using alternative method: {cloudinary_url}")
                         return cloudinary_url
-        except Exception as inner_e:
-            print(f"Alternative upload method also failed: {inner_e}")
+            except Exception as inner_e:
+                print(f"Alternative upload method also failed: {inner_e}")
         
-        return image_url  # Return original URL as fallback
+            return image_url  # Return original URL as fallback
 
-async def retry_with_backoff(coroutine, max_retries=MAX_RETRIES, start_delay=5):
-    """Retry a coroutine with exponential backoff for rate limiting"""
+async def retry_with_backoff(func, *args, max_retries=MAX_RETRIES, start_delay=5, **kwargs):
+    """Call func(*args, **kwargs) with jittered exponential backoff for rate limiting.
+
+    A fresh coroutine is created on every attempt, so retries never await an
+    already-exhausted coroutine.
+    """
     retries = 0
-    delay = start_delay
     
-    while retries < max_retries:
+    while True:
         try:
-            return await coroutine
+            return await func(*args, **kwargs)
         except PlaywrightError as e:
-            if "429" in str(e) or "Too Many Requests" in str(e) or "timeout" in str(e).lower():
+            message = str(e)
+            if "429" in message or "Too Many Requests" in message or "timeout" in message.lower():
                 retries += 1
                 if retries >= max_retries:
                     print(f"Max retries ({max_retries}) reached, giving up.")
                     raise
                 
-                wait_time = delay * (2 ** (retries - 1))  # Exponential backoff
-                print(f"Rate limited or timeout (attempt {retries}/{max_retries}). Waiting {wait_time} seconds...")
+                # Prefer the server's Retry-After hint, otherwise back off exponentially with jitter
+                retry_after = RETRY_AFTER_RE.search(message)
+                if retry_after:
+                    wait_time = float(retry_after.group(1))
+                else:
+                    wait_time = min(60, start_delay * (2 ** (retries - 1))) + random.uniform(0, 1)
+                print(f"Rate limited or timeout (attempt {retries}/{max_retries}). Waiting {wait_time:.2f} seconds...")
                 await asyncio.sleep(wait_time)
             else:
                 raise
 
 async def take_screenshot(page, filename):
     """Take a screenshot for debugging purposes"""
+    # A viewport JPEG is far cheaper to encode than a full-page PNG
+    filename = os.path.splitext(filename)[0] + ".jpg"
     try:
-        await page.screenshot(path=f"screenshots/{filename}")
+        await page.screenshot(path=f"screenshots/{filename}", full_page=False, type="jpeg", quality=60)
         print(f"Screenshot saved to screenshots/{filename}")
     except Exception as e:
         print(f"Error taking screenshot: {e}")
 
+async def write_debug_file(path, content):
+    """Write a debug dump from a worker thread so it doesn't block the event loop"""
+    await asyncio.to_thread(Path(path).parent.mkdir, parents=True, exist_ok=True)
+    if isinstance(content, bytes):
+        await asyncio.to_thread(Path(path).write_bytes, content)
+    else:
+        await asyncio.to_thread(Path(path).write_text, content, encoding="utf-8")
+
+async def dump_page_html(page, path, competition_id=None):
+    """Save the page's HTML for debugging when KAGGLE_DUMP_HTML is enabled"""
+    if not DUMP_HTML:
+        return
+    # Serializing the live DOM is expensive, so skip competitions outside the whitelist
+    if competition_id is not None and DUMP_HTML_IDS and competition_id not in DUMP_HTML_IDS:
+        return
+    html_content = await page.evaluate("document.documentElement.outerHTML")
+    data = html_content.encode("utf-8", errors="replace")
+    del html_content
+    await asyncio.to_thread(Path(path).parent.mkdir, parents=True, exist_ok=True)
+    await asyncio.to_thread(Path(path).write_bytes, data)
+    print(f"Saved HTML content to {path}")
+
+@lru_cache(maxsize=4096)
+def slug_from_url(url):
+    """Return the competition slug from a Kaggle competition URL, or None."""
+    match = COMPETITION_SLUG_RE.search(url)
+    return match.group(1) if match else None
+
+@lru_cache(maxsize=4096)
+def competition_id_from_url(url):
+    """Return the competition slug, or the last path segment for URLs that have none."""
+    return slug_from_url(url) or url.rsplit('/', 1)[-1]
+
+@lru_cache(maxsize=4096)
+def normalize_competition_url(url):
+    """Return the canonical https://www.kaggle.com/competitions/<slug> form of a competition URL."""
+    slug = slug_from_url(url)
+    if not slug:
+        return url
+    return f"{BASE_URL}/{slug}"
+
+def parse_competition_date(value):
+    """Parse a timeline date such as 'March 15, 2025', or return None."""
+    for date_format in ("%B %d, %Y", "%b %d, %Y"):
+        try:
+            return datetime.strptime(value, date_format)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+def load_cached_competition(competition_id):
+    """Return cached details for a competition, or None if missing or stale.
+    
+    Ended competitions no longer change, so their cache entries never expire.
+    """
+    cache_path = COMPETITION_CACHE_DIR / f"{competition_id}.json"
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        competition = orjson.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    
+    end_date = parse_competition_date(competition.get("end_date"))
+    if end_date and end_date < datetime.now():
+        return competition
+    return competition if age < COMPETITION_CACHE_TTL else None
+
+def save_cached_competition(competition_id, competition):
+    """Store extracted details so the next run can skip this competition."""
+    try:
+        (COMPETITION_CACHE_DIR / f"{competition_id}.json").write_bytes(orjson.dumps(competition))
+    except OSError as e:
+        print(f"Error caching competition {competition_id}: {e}")
+
 async def extract_competition_links(page):
     """Extract links to individual competition pages from the listing page."""
     print(f"Extracting competition links from: {page.url}")
@@ -167,10 +408,7 @@ async def extract_competition_links(page):
         await take_screenshot(page, "competition_listing.png")
         
         # Also save the HTML for debugging
-        html_content = await page.content()
-        with open("debug/competition_listing.html", "w", encoding="utf-8") as f:
-            f.write(html_content)
-        print("Saved HTML content for debugging")
+        await dump_page_html(page, "debug/competition_listing.html")
         
         # Extract and save a detailed analysis of the page structure for debugging
         structure_analysis = await page.evaluate("""() => {
@@ -213,478 +451,238 @@ async def extract_competition_links(page):
         }""");
         
         # Save the structure analysis
-        with open("debug/page_structure_analysis.json", "w", encoding="utf-8") as f:
-            json.dump(structure_analysis, f, indent=2)
+        await write_debug_file("debug/page_structure_analysis.json", orjson.dumps(structure_analysis, option=orjson.OPT_INDENT_2))
         print("Saved page structure analysis for debugging")
     
     try:
-        # Wait for the page to load completely
-        await page.wait_for_load_state("networkidle", timeout=30000)
+        # Wait for the competition cards rather than a quiet network, which
+        # can take many seconds on Kaggle even after the cards are painted
+        try:
+            await page.wait_for_selector('a[href*="/competitions/"]', state="attached", timeout=15000)
+        except PlaywrightTimeoutError:
+            print("Timed out waiting for competition links, continuing anyway")
         
         # Try to identify the structure of the page first
         print("Analyzing page structure...")
         
-        # Check for different potential selectors in order of specificity
-        selectors = [
-            '.competitions-list-view .competition-item',
-            '.competitions-list .competition-item',
-            '.competitionsContainer .competition-item',
-            '.competitions .competition-item',
-            '.competition-item',
-            '.competition-card',
-            'a[href*="/competitions/"]',
-            '.card, .card-item'
-        ]
-        
+        # Count every candidate in one round-trip and keep the first that matches
         used_selector = None
-        for selector in selectors:
-            try:
-                count = await page.evaluate(f'document.querySelectorAll("{selector}").length')
+        try:
+            counts = await page.evaluate("""(selectors) => selectors.map(selector => {
+                try {
+                    return document.querySelectorAll(selector).length;
+                } catch (e) {
+                    return 0;
+                }
+            })""", list(COMPETITION_SELECTORS))
+            for selector, count in zip(COMPETITION_SELECTORS, counts):
                 if count > 0:
                     print(f"Found {count} elements with selector: {selector}")
                     used_selector = selector
                     break
-            except Exception as e:
-                print(f"Error checking selector '{selector}': {e}")
-                continue
+        except Exception as e:
+            print(f"Error checking selectors: {e}")
         
         if not used_selector:
             print("Could not find competition elements with known selectors.")
             print("Attempting to extract any links to competition pages...")
             
-            # Extract all links that look like competition links
-            competition_links = await page.evaluate("""() => {
-                const links = Array.from(document.querySelectorAll('a[href*="/c/"], a[href*="/competitions/"]'))
-                    .filter(a => {
-                        const href = a.getAttribute('href');
-                        // Filter out links to the competition listing page itself
-                        return href && 
-                               !href.includes('/competitions?') && 
-                               !href.includes('/competitions/list') &&
-                               !href.includes('listOption=');
-                    })
-                    .map(a => {
-                        // Ensure full URLs
-                        let href = a.getAttribute('href');
-                        if (href.startsWith('/')) {
-                            href = 'https://www.kaggle.com' + href;
-                        }
-                        return href;
-                    });
-                
-                // Remove duplicates
-                return [...new Set(links)];
-            }""")
-            
-            print(f"Found {len(competition_links)} competition links by URL pattern")
+            # Give lazy-loaded card images a moment to reach the DOM before scanning
+            try:
+                await page.wait_for_function(
+                    "document.querySelectorAll('a[href*=\"/competitions/\"] img').length > 5",
+                    timeout=5000
+                )
+            except PlaywrightTimeoutError:
+                pass
             
-            # Scan DOM for the EXACT structure mentioned by the user for logo extraction
-            exact_pattern_logo_results = await page.evaluate("""() => {
-                // Map to store competition URLs and their logos
-                const logoMap = {};
-                const debugInfo = {
-                    sc_divs_count: 0,
-                    sc_divs_with_img: 0,
-                    logos_found: 0,
-                    html_samples: []
-                };
-                
-                // First find all divs that match the sc-* pattern
-                const scDivs = document.querySelectorAll('div[class*="sc-"]');
-                debugInfo.sc_divs_count = scDivs.length;
+            # One fused DOM scan collects the competition links and picks the
+            # best logo candidate for each of them in a single round-trip
+            scan_results = await page.evaluate("""() => {
+                // Compiled once per evaluate instead of per call
+                const SLUG_RE = /\\/(?:competitions|c)\\/([a-zA-Z0-9\\-_]+)/;
+                const LOGO_HINT_RE = /logo|thumb|icon|badges/;
                 
-                // Look specifically for the pattern <div class="sc-kJZLhT jvoaUf"><img src="..."></div>
-                scDivs.forEach(div => {
-                    const imgElement = div.querySelector('img');
-                    if (imgElement && imgElement.src) {
-                        debugInfo.sc_divs_with_img++;
-                        
-                        // Sample some HTML for debugging
-                        if (debugInfo.html_samples.length < 5) {
-                            debugInfo.html_samples.push({
-                                divClass: div.className,
-                                imgSrc: imgElement.src,
-                                outerHTML: div.outerHTML.substring(0, 200) // Limit size
-                            });
-                        }
-                        
-                        // Find the closest parent that is a link to a competition
-                        let current = div;
-                        let found = false;
-                        
-                        // Look up to 5 levels up
-                        for (let i = 0; i < 5 && current && !found; i++) {
-                            // Check if the current element is an anchor to a competition
-                            if (current.tagName === 'A' && 
-                                current.href && 
-                                (current.href.includes('/competitions/') || current.href.includes('/c/'))) {
-                                
-                                let href = current.href;
-                                // Store the logo URL
-                                logoMap[href] = imgElement.src;
-                                debugInfo.logos_found++;
-                                found = true;
-                                break;
-                            }
-                            
-                            // Move up to parent
-                            current = current.parentElement;
-                        }
+                // Function to extract the competition slug from a URL, memoized per URL
+                const slugCache = new Map();
+                function getCompetitionSlugFromUrl(url) {
+                    if (!url) return null;
+                    if (!slugCache.has(url)) {
+                        const match = url.match(SLUG_RE);
+                        slugCache.set(url, match ? match[1] : null);
                     }
-                });
+                    return slugCache.get(url);
+                }
                 
-                return {
-                    logoMap,
-                    debugInfo
+                const competitionLinks = [];
+                const seenSlugs = new Set();
+                // slug -> {src, rank}, lower rank means a more reliable logo source
+                const logoBySlug = new Map();
+                const debugStats = {
+                    anchors: 0,
+                    images: 0,
+                    exact_pattern: 0,
+                    likely_logo: 0,
+                    inside_anchor: 0,
+                    nearby_image: 0
                 };
-            }""");
-            
-            print(f"Exact pattern search results: {exact_pattern_logo_results['debugInfo']}")
-            if exact_pattern_logo_results['debugInfo']['logos_found'] > 0:
-                print(f"Found {exact_pattern_logo_results['debugInfo']['logos_found']} logos with exact pattern!")
-                # Print some samples for debugging
-                for i, sample in enumerate(exact_pattern_logo_results['debugInfo']['html_samples']):
-                    print(f"Sample {i+1}: {sample['divClass']} -> {sample['imgSrc'][:60]}...")
-            
-            # Try an entirely different approach: full DOM scan for logos
-            scan_results = await page.evaluate("""() => {
-                // Create a map to store competition slugs and their logos
-                const competitionLogoMap = {};
                 
-                // Function to extract the competition slug from a URL
-                function getCompetitionSlugFromUrl(url) {
-                    if (!url) return null;
-                    const match = url.match(/\\/competitions\\/([a-zA-Z0-9-_]+)/);
-                    return match ? match[1] : null;
+                function offerLogo(slug, src, rank) {
+                    const current = logoBySlug.get(slug);
+                    if (!current || rank < current.rank) {
+                        logoBySlug.set(slug, {src, rank});
+                    }
                 }
                 
-                // 1. First scan: Find all images and check if they're near competition links
-                const allImages = document.querySelectorAll('img');
+                // Map every element to the first competition anchor in its subtree with one
+                // upward pass per anchor, stopping where an earlier anchor already claimed it
+                const anchorWithin = new WeakMap();
+                for (const anchor of document.querySelectorAll('a[href*="/competitions/"], a[href*="/c/"]')) {
+                    if (!getCompetitionSlugFromUrl(anchor.href)) continue;
+                    for (let node = anchor; node && !anchorWithin.has(node); node = node.parentElement) {
+                        anchorWithin.set(node, anchor);
+                    }
+                }
                 
-                for (const img of allImages) {
-                    // Skip if no src
-                    if (!img.src) continue;
-                    
-                    // Skip very small images (less than 20px)
-                    if (img.width < 20 || img.height < 20) continue;
-                    
-                    // Look for competition links nearby - traverse up
+                // Nearest competition anchor: an enclosing one, or one inside a close ancestor
+                function findCompetitionAnchor(img) {
                     let current = img.parentElement;
-                    let foundCompetitionSlug = null;
-                    
-                    // Check up to 5 levels up
                     for (let i = 0; i < 5 && current; i++) {
-                        // If we find an anchor with competition URL
-                        const anchors = current.querySelectorAll('a[href*="/competitions/"]');
-                        for (const anchor of anchors) {
-                            const slug = getCompetitionSlugFromUrl(anchor.href);
-                            if (slug) {
-                                foundCompetitionSlug = slug;
-                                break;
-                            }
-                        }
-                        
-                        // Also check the element itself if it's an anchor
-                        if (current.tagName === 'A' && current.href && current.href.includes('/competitions/')) {
-                            const slug = getCompetitionSlugFromUrl(current.href);
-                            if (slug) {
-                                foundCompetitionSlug = slug;
-                                break;
-                            }
-                        }
-                        
-                        if (foundCompetitionSlug) break;
+                        const anchor = anchorWithin.get(current);
+                        if (anchor) return anchor;
                         current = current.parentElement;
                     }
-                    
-                    if (foundCompetitionSlug) {
-                        // Check if it looks like a logo
-                        const isLikelyLogo = 
-                            img.src.includes('logo') || 
-                            img.src.includes('thumb') || 
-                            img.src.includes('icon') ||
-                            img.src.includes('badges') ||
-                            (img.width <= 100 && img.height <= 100) ||
-                            img.width === img.height; // Square images are often logos
-                        
-                        if (isLikelyLogo) {
-                            competitionLogoMap[foundCompetitionSlug] = img.src;
-                        }
-                    }
+                    return null;
                 }
                 
-                // 2. Second scan: Look specifically for cards and then any images inside them
-                const possibleCards = document.querySelectorAll('div[class*="card"], div[class*="item"], div[class*="container"]');
-                
-                for (const card of possibleCards) {
-                    // Check if the card contains a competition link
-                    const competitionLinks = card.querySelectorAll('a[href*="/competitions/"]');
-                    if (competitionLinks.length === 0) continue;
+                // Walk competition anchors and images together in document order
+                const nodes = document.querySelectorAll('a[href*="/c/"], a[href*="/competitions/"], img');
+                for (const el of nodes) {
+                    if (el.tagName === 'A') {
+                        debugStats.anchors++;
+                        const href = el.getAttribute('href');
+                        // Filter out links to the competition listing page itself
+                        if (!href || 
+                            href.includes('/competitions?') || 
+                            href.includes('/competitions/list') ||
+                            href.includes('listOption=')) {
+                            continue;
+                        }
+                        // One canonical URL per competition, however the anchor spells it
+                        const slug = getCompetitionSlugFromUrl(href);
+                        if (slug && !seenSlugs.has(slug)) {
+                            seenSlugs.add(slug);
+                            competitionLinks.push('https://www.kaggle.com/competitions/' + slug);
+                        }
+                        continue;
+                    }
                     
-                    // Get the competition slug
-                    const href = competitionLinks[0].href;
-                    const slug = getCompetitionSlugFromUrl(href);
-                    if (!slug) continue;
+                    // Skip if no src
+                    const src = el.src;
+                    if (!src) continue;
+                    debugStats.images++;
                     
-                    // Already found a logo for this competition
-                    if (competitionLogoMap[slug]) continue;
+                    const anchor = findCompetitionAnchor(el);
+                    if (!anchor) continue;
+                    const slug = getCompetitionSlugFromUrl(anchor.href);
+                    const insideAnchor = anchor.contains(el);
+                    const parentClass = el.parentElement ? String(el.parentElement.className) : '';
                     
-                    // Look for images in this card
-                    const images = card.querySelectorAll('img');
-                    if (images.length > 0) {
-                        // Prioritize images that look like logos
-                        let logoFound = false;
-                        
-                        for (const img of images) {
-                            if (!img.src) continue;
-                            
-                            const isLikelyLogo = 
-                                img.src.includes('logo') || 
-                                img.src.includes('thumb') || 
-                                img.src.includes('icon') ||
-                                img.src.includes('badges') ||
-                                (img.width <= 100 && img.height <= 100) ||
-                                img.width === img.height; // Square images are often logos
-                            
-                            if (isLikelyLogo) {
-                                competitionLogoMap[slug] = img.src;
-                                logoFound = true;
-                                break;
-                            }
-                        }
-                        
-                        // If no logo-like image was found, use the first image
-                        if (!logoFound && images[0].src) {
-                            competitionLogoMap[slug] = images[0].src;
-                        }
+                    // Intrinsic size doesn't depend on layout; fall back to the rendered size
+                    // when the image hasn't loaded
+                    const width = el.naturalWidth || el.width;
+                    const height = el.naturalHeight || el.height;
+                    const isLikelyLogo = 
+                        LOGO_HINT_RE.test(src) ||
+                        (width <= 100 && height <= 100) ||
+                        width === height; // Square images are often logos
+                    
+                    if (insideAnchor && parentClass.includes('sc-')) {
+                        // The <div class="sc-..."><img src="..."></div> wrapper inside the card link
+                        offerLogo(slug, src, 0);
+                        debugStats.exact_pattern++;
+                    } else if (isLikelyLogo && width >= 20 && height >= 20) {
+                        offerLogo(slug, src, 1);
+                        debugStats.likely_logo++;
+                    } else if (insideAnchor) {
+                        offerLogo(slug, src, 2);
+                        debugStats.inside_anchor++;
+                    } else {
+                        offerLogo(slug, src, 3);
+                        debugStats.nearby_image++;
                     }
                 }
                 
-                // Convert from slug-based map to URL-based map
-                const result = {};
-                for (const [slug, logoUrl] of Object.entries(competitionLogoMap)) {
-                    const fullUrl = `https://www.kaggle.com/competitions/${slug}`;
-                    result[fullUrl] = logoUrl;
+                // Map each competition link to the best logo found for its slug
+                const logoMap = {};
+                for (const link of competitionLinks) {
+                    const slug = getCompetitionSlugFromUrl(link);
+                    const logo = slug ? logoBySlug.get(slug) : null;
+                    if (logo) {
+                        logoMap[link] = logo.src;
+                    }
                 }
+                debugStats.logos_found = Object.keys(logoMap).length;
                 
                 return {
-                    logoMap: result,
-                    stats: {
-                        totalLogosFound: Object.keys(result).length
-                    }
+                    competitionLinks,
+                    logoMap,
+                    debugStats
                 };
             }""")
             
-            print(f"Full DOM scan found logos for {scan_results['stats']['totalLogosFound']} competitions")
+            competition_links = scan_results['competitionLinks']
+            combined_logo_map = scan_results['logoMap']
+            print(f"Found {len(competition_links)} competition links by URL pattern")
+            print(f"Fused DOM scan results: {scan_results['debugStats']}")
             
-            # Extract logo images from the first approach
-            logo_images = await page.evaluate("""() => {
-                // For direct mapping from URLs to logos
-                const logoMap = {};
-                
-                // Find all competition card elements or containers
-                const competitionCards = document.querySelectorAll('a[href*="/competitions/"]');
+            # Create minimal placeholder data for these links
+            competition_data = []
+            for link in competition_links:
+                # Use the competition slug as a title placeholder
+                slug = competition_id_from_url(link)
                 
-                competitionCards.forEach(card => {
-                    try {
-                        // Get the URL (key)
-                        let href = card.getAttribute('href');
-                        if (href.startsWith('/')) {
-                            href = 'https://www.kaggle.com' + href;
-                        }
-                        
-                        // APPROACH 1: Look for the specific structure mentioned by the user
-                        // <div class="sc-kJZLhT jvoaUf"><img src="...">
-                        const logoWrapper = card.querySelector('div[class*="sc-"]');
-                        if (logoWrapper) {
-                            const img = logoWrapper.querySelector('img');
-                            if (img && img.src) {
-                                // Ensure absolute URL
-                                let imgSrc = img.src;
-                                if (imgSrc.startsWith('/')) {
-                                    imgSrc = 'https://www.kaggle.com' + imgSrc;
-                                }
-                                logoMap[href] = imgSrc;
-                                return; // Found logo, skip other approaches
-                            }
-                        }
-                        
-                        // APPROACH 2: Look for any nested img elements with classes that might be logos
-                        const logoImgs = card.querySelectorAll('img[class*="sc-"]');
-                        if (logoImgs.length > 0 && logoImgs[0].src) {
-                            // Ensure absolute URL
-                            let imgSrc = logoImgs[0].src;
-                            if (imgSrc.startsWith('/')) {
-                                imgSrc = 'https://www.kaggle.com' + imgSrc;
-                            }
-                            logoMap[href] = imgSrc;
-                            return; // Found logo, skip other approaches
-                        }
-                        
-                        // APPROACH 3: Look for any image that might be a logo (thumb, small size, etc.)
-                        const imgs = card.querySelectorAll('img');
-                        for (const img of imgs) {
-                            if (img.src) {
-                                // Check for logo indicators in the src URL
-                                if (img.src.includes('logo') || 
-                                    img.src.includes('thumb') || 
-                                    img.src.includes('icon') || 
-                                    (img.width > 0 && img.width < 100) ||  // Small images are likely logos
-                                    (img.height > 0 && img.height < 100)) {
-                                    // Ensure absolute URL
-                                    let imgSrc = img.src;
-                                    if (imgSrc.startsWith('/')) {
-                                        imgSrc = 'https://www.kaggle.com' + imgSrc;
-                                    }
-                                    logoMap[href] = imgSrc;
-                                    break;
-                                }
-                            }
-                        }
-                        
-                        // APPROACH 4: Fall back to any image if nothing else worked
-                        if (!logoMap[href] && imgs.length > 0 && imgs[0].src) {
-                            // Ensure absolute URL
-                            let imgSrc = imgs[0].src;
-                            if (imgSrc.startsWith('/')) {
-                                imgSrc = 'https://www.kaggle.com' + imgSrc;
-                            }
-                            logoMap[href] = imgSrc;
-                        }
-                    } catch (e) {
-                        console.error('Error extracting logo for card:', e);
-                    }
-                });
+                logo_url = combined_logo_map.get(link, "")
+                if logo_url and DEBUG_MODE:
+                    print(f"Found logo for {slug}: {logo_url[:60]}...")
                 
-                // Log the results for debugging
-                console.log('Found logos for', Object.keys(logoMap).length, 'competitions');
-                return logoMap;
-            }""")
+                competition_data.append({
+                    "url": link,
+                    "title": slug,
+                    "logo_url": logo_url  # Add logo URL if found
+                })
             
-            # Combine all the approaches to extract logos
-            combined_logo_map = {}
+            return competition_links, competition_data
+        
+        # Scroll to load all competitions 
+        previous_height = 0
+        current_height = await page.evaluate("document.body.scrollHeight")
+        scroll_attempts = 0
+        max_scroll_attempts = 20
+        
+        while previous_height != current_height and scroll_attempts < max_scroll_attempts:
+            previous_height = current_height
             
-            # 1. First add the logos from the exact pattern search
-            if exact_pattern_logo_results['logoMap']:
-                for url, logo in exact_pattern_logo_results['logoMap'].items():
-                    # Ensure full URL
-                    if url.startswith('/'):
-                        url = "https://www.kaggle.com" + url
-                    combined_logo_map[url] = logo
-                
-                print(f"Added {len(exact_pattern_logo_results['logoMap'])} logos from exact pattern matching")
+            # Scroll to the bottom of the page
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            if DEBUG_MODE:
+                print(f"Scroll attempt {scroll_attempts+1}: Previous height: {previous_height}, scrolling down...")
             
-            # 2. Add logos from the DOM scan
-            if scan_results['logoMap']:
-                for url, logo in scan_results['logoMap'].items():
-                    if url not in combined_logo_map:
-                        combined_logo_map[url] = logo
-                
-                print(f"Added {len(scan_results['logoMap'])} logos from DOM scanning")
+            # Wait for new content to grow the page, giving up after the old fixed delay
+            try:
+                await page.wait_for_function(
+                    "(previousHeight) => document.body.scrollHeight > previousHeight",
+                    arg=previous_height,
+                    timeout=3000
+                )
+            except PlaywrightTimeoutError:
+                print("No new content loaded, stopping scroll")
+                break
             
-            # 3. Add logos from the direct approach
-            if logo_images:
-                for url, logo in logo_images.items():
-                    if url not in combined_logo_map:
-                        combined_logo_map[url] = logo
-                
-                print(f"Added {len(logo_images)} logos from direct approach")
-            
-            # 4. Direct scan for storage.googleapis.com URLs which contain Kaggle logo patterns
-            storage_google_results = await page.evaluate("""() => {
-                const logoMap = {};
-                const imgElements = document.querySelectorAll('img[src*="storage.googleapis.com"][src*="logos"], img[src*="storage.googleapis.com"][src*="thumb"], img[src*="thumb76_76.png"]');
-                
-                // For each matching image, find the competition link it's associated with
-                imgElements.forEach(img => {
-                    // Skip if no src
-                    if (!img.src) return;
-                    
-                    // Make sure we use the direct URL without any modifications
-                    const imgSrc = img.src;
-                    
-                    // Find nearest competition link - go up the DOM tree
-                    let current = img.parentElement;
-                    let foundCompetitionLink = null;
-                    
-                    // Check up to 5 levels up
-                    for (let i = 0; i < 5 && current; i++) {
-                        if (current.tagName === 'A' && 
-                            current.href && 
-                            (current.href.includes('/competitions/') || current.href.includes('/c/'))) {
-                            
-                            foundCompetitionLink = current.href;
-                            break;
-                        }
-                        
-                        // Also check for any child links
-                        const childLinks = current.querySelectorAll('a[href*="/competitions/"]');
-                        if (childLinks.length > 0) {
-                            foundCompetitionLink = childLinks[0].href;
-                            break;
-                        }
-                        
-                        current = current.parentElement;
-                    }
-                    
-                    // If we found a competition link, save the image URL
-                    if (foundCompetitionLink) {
-                        // Make sure the competition link is absolute
-                        if (foundCompetitionLink.startsWith('/')) {
-                            foundCompetitionLink = 'https://www.kaggle.com' + foundCompetitionLink;
-                        }
-                        logoMap[foundCompetitionLink] = imgSrc;
-                        console.log('Found logo URL:', imgSrc);
-                    }
-                });
-                
-                return {
-                    logoMap,
-                    count: Object.keys(logoMap).length
-                };
-            }""");
-            
-            print(f"Found {storage_google_results['count']} logos from storage.googleapis.com URLs")
-            
-            # Add these to the combined map
-            for url, logo in storage_google_results['logoMap'].items():
-                if url not in combined_logo_map:
-                    combined_logo_map[url] = logo
-            
-            # Create minimal placeholder data for these links
-            competition_data = []
-            for link in competition_links:
-                logo_url = combined_logo_map.get(link, "")
-                if logo_url:
-                    print(f"Found logo for {link.split('/')[-1]}: {logo_url[:60]}...")
-                
-                competition_data.append({
-                    "url": link,
-                    "title": link.split('/').pop(),  # Use the last part of the URL as a title placeholder
-                    "logo_url": logo_url  # Add logo URL if found
-                })
-            
-            return competition_links, competition_data
-        
-        # Scroll to load all competitions 
-        previous_height = 0
-        current_height = await page.evaluate("document.body.scrollHeight")
-        scroll_attempts = 0
-        max_scroll_attempts = 20
-        
-        while previous_height != current_height and scroll_attempts < max_scroll_attempts:
-            previous_height = current_height
-            
-            # Scroll to the bottom of the page
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            print(f"Scroll attempt {scroll_attempts+1}: Previous height: {previous_height}, scrolling down...")
-            
-            # Wait for potential new content to load
-            await asyncio.sleep(3)
-            
-            # Check the new height
-            current_height = await page.evaluate("document.body.scrollHeight")
-            print(f"New height: {current_height}")
+            # Check the new height
+            current_height = await page.evaluate("document.body.scrollHeight")
+            if DEBUG_MODE:
+                print(f"New height: {current_height}")
             
             scroll_attempts += 1
         
@@ -694,106 +692,117 @@ async def extract_competition_links(page):
         
         # Enhanced logo extraction based on the provided HTML structure
         # Extract competition links and basic information using the identified selector
-        competition_data = await page.evaluate(f"""(selector) => {{
+        competition_data = await page.evaluate("""(selector) => {
             const competitions = [];
             
+            // Card field selectors, defined once for every card
+            const TITLE_SELECTOR = '.competition-name, .card-title, h3, h4';
+            const LINK_SELECTOR = 'a[href*="/c/"], a[href*="/competitions/"]';
+            const DESCRIPTION_SELECTOR = '.competition-description, .description, p';
+            const TAGS_SELECTOR = '.competition-tags, .tags';
+            const TAG_SELECTOR = '.badge, .tag';
+            const DEADLINE_SELECTOR = '.competition-deadline, .deadline, [data-deadline]';
+            const PRIZE_SELECTOR = '.prizes-awarded, .prize, [data-prize]';
+            const TEAMS_SELECTOR = '.team-count, .teams';
+            const ORGANIZER_SELECTOR = '.competition-organizer, .organizer';
+            const LOGO_WRAPPER_SELECTOR = '[class*="sc-"]';
+            const LOGO_IMAGE_SELECTOR = 'img[src*="logos"], img[src*="thumb"], .competition-logo img, img.competition-image';
+            
             // Select all competition card elements
             const competitionCards = document.querySelectorAll(selector);
             console.log('Found ' + competitionCards.length + ' competition cards');
             
             // Extract data from each card
-            competitionCards.forEach(card => {{
+            competitionCards.forEach(card => {
                 // Try multiple ways to get the title
                 let title = '';
-                let titleElement = card.querySelector('.competition-name, .card-title, h3, h4');
-                if (titleElement) {{
+                let titleElement = card.querySelector(TITLE_SELECTOR);
+                if (titleElement) {
                     title = titleElement.textContent.trim();
-                }}
+                }
                 
                 // Try multiple ways to get the link
                 let url = '';
-                let linkElement = card.querySelector('a[href*="/c/"], a[href*="/competitions/"]');
-                if (linkElement) {{
+                let linkElement = card.querySelector(LINK_SELECTOR);
+                if (linkElement) {
                     url = linkElement.href;
-                }} else if (card.tagName === 'A') {{
+                } else if (card.tagName === 'A') {
                     url = card.href;
-                }}
+                }
                 
                 // Try to get description
                 let description = '';
-                let descElement = card.querySelector('.competition-description, .description, p');
-                if (descElement) {{
+                let descElement = card.querySelector(DESCRIPTION_SELECTOR);
+                if (descElement) {
                     description = descElement.textContent.trim();
-                }}
+                }
                 
                 // Try to get tags
                 let tags = [];
-                let tagsElement = card.querySelector('.competition-tags, .tags');
-                if (tagsElement) {{
-                    tags = Array.from(tagsElement.querySelectorAll('.badge, .tag')).map(tag => tag.textContent.trim());
-                }}
+                let tagsElement = card.querySelector(TAGS_SELECTOR);
+                if (tagsElement) {
+                    tags = Array.from(tagsElement.querySelectorAll(TAG_SELECTOR)).map(tag => tag.textContent.trim());
+                }
                 
                 // Try to get deadline
                 let deadline = '';
-                let deadlineElement = card.querySelector('.competition-deadline, .deadline, [data-deadline]');
-                if (deadlineElement) {{
-                    deadline = deadlineElement.textContent.trim();
-                }} else if (card.querySelector('[data-deadline]')) {{
-                    deadline = card.querySelector('[data-deadline]').getAttribute('data-deadline');
-                }}
+                let deadlineElement = card.querySelector(DEADLINE_SELECTOR);
+                if (deadlineElement) {
+                    deadline = deadlineElement.textContent.trim() || deadlineElement.getAttribute('data-deadline') || '';
+                }
                 
                 // Try to get prize info
                 let prize = '';
-                let prizeElement = card.querySelector('.prizes-awarded, .prize, [data-prize]');
-                if (prizeElement) {{
+                let prizeElement = card.querySelector(PRIZE_SELECTOR);
+                if (prizeElement) {
                     prize = prizeElement.textContent.trim();
-                }}
+                }
                 
                 // Try to get team info
                 let teams = '';
-                let teamElement = card.querySelector('.team-count, .teams');
-                if (teamElement) {{
+                let teamElement = card.querySelector(TEAMS_SELECTOR);
+                if (teamElement) {
                     teams = teamElement.textContent.trim();
-                }}
+                }
                 
                 // Try to get organizer
                 let organizer = '';
-                let organizerElement = card.querySelector('.competition-organizer, .organizer');
-                if (organizerElement) {{
+                let organizerElement = card.querySelector(ORGANIZER_SELECTOR);
+                if (organizerElement) {
                     organizer = organizerElement.textContent.trim();
-                }}
+                }
                 
                 // Extract logo image from the listing page - NEW CODE
                 let image_url = '';
                 
                 // First check for the specific structure provided in the example
-                let logoWrapper = card.querySelector('.sc-kJZLhT, [class*="sc-"]');
-                if (logoWrapper) {{
+                let logoWrapper = card.querySelector(LOGO_WRAPPER_SELECTOR);
+                if (logoWrapper) {
                     let logoImg = logoWrapper.querySelector('img');
-                    if (logoImg && logoImg.src) {{
+                    if (logoImg && logoImg.src) {
                         image_url = logoImg.src;
-                    }}
-                }}
+                    }
+                }
                 
                 // Fallback to other potential selectors if the specific one doesn't work
-                if (!image_url) {{
-                    let imageElement = card.querySelector('img[src*="logos"], img[src*="thumb"], .competition-logo img, img.competition-image');
-                    if (imageElement && imageElement.src) {{
+                if (!image_url) {
+                    let imageElement = card.querySelector(LOGO_IMAGE_SELECTOR);
+                    if (imageElement && imageElement.src) {
                         image_url = imageElement.src;
-                    }}
-                }}
+                    }
+                }
                 
                 // Generic fallback for any image
-                if (!image_url) {{
+                if (!image_url) {
                     let imageElement = card.querySelector('img');
-                    if (imageElement && imageElement.src) {{
+                    if (imageElement && imageElement.src) {
                         image_url = imageElement.src;
-                    }}
-                }}
+                    }
+                }
                 
                 // Only add if we have at least a URL or title
-                if (url || title) {{
-                    competitions.push({{
+                if (url || title) {
+                    competitions.push({
                         title: title,
                         url: url,
                         description: description,
@@ -803,16 +812,28 @@ async def extract_competition_links(page):
                         teams: teams,
                         organizer: organizer,
                         logo_url: image_url  // Store the logo URL
-                    }});
-                }}
-            }});
+                    });
+                }
+            });
             
             return competitions;
-        }}""", used_selector)
+        }""", used_selector)
         
         # Log the results
         print(f"Found {len(competition_data)} competitions")
         
+        # Canonicalise card URLs and keep one card per competition
+        unique_competitions = []
+        seen_urls = set()
+        for comp in competition_data:
+            if comp.get("url"):
+                comp["url"] = normalize_competition_url(comp["url"])
+                if comp["url"] in seen_urls:
+                    continue
+                seen_urls.add(comp["url"])
+            unique_competitions.append(comp)
+        competition_data = unique_competitions
+        
         # Get just the URLs for simplified return
         competition_links = [comp["url"] for comp in competition_data if comp.get("url")]
         
@@ -820,178 +841,54 @@ async def extract_competition_links(page):
         if not competition_links:
             print("No competition links found with primary selectors, trying fallback extraction...")
             
-            # Extract all links that look like competition links
-            competition_links = await page.evaluate("""() => {
-                const links = Array.from(document.querySelectorAll('a[href*="/c/"], a[href*="/competitions/"]'))
-                    .filter(a => {
-                        const href = a.getAttribute('href');
-                        // Filter out links to the competition listing page itself
-                        return href && 
-                               !href.includes('/competitions?') && 
-                               !href.includes('/competitions/list') &&
-                               !href.includes('listOption=');
-                    })
-                    .map(a => {
-                        // Ensure full URLs
-                        let href = a.getAttribute('href');
-                        if (href.startsWith('/')) {
-                            href = 'https://www.kaggle.com' + href;
-                        }
-                        return href;
-                    });
-                
-                // Remove duplicates
-                return [...new Set(links)];
-            }""")
-            
-            print(f"Found {len(competition_links)} competition links by URL pattern")
-            
-            # Try an entirely different approach: full DOM scan for logos
+            # Collect links by URL pattern and run the full DOM logo scans in one round-trip
             scan_results = await page.evaluate("""() => {
                 // Create a map to store competition slugs and their logos
                 const competitionLogoMap = {};
                 
-                // Function to extract the competition slug from a URL
+                // Compiled once per evaluate instead of per call
+                const SLUG_RE = /\\/competitions\\/([a-zA-Z0-9\\-_]+)/;
+                
+                // Function to extract the competition slug from a URL, memoized per URL
+                const slugCache = new Map();
                 function getCompetitionSlugFromUrl(url) {
                     if (!url) return null;
-                    const match = url.match(/\\/competitions\\/([a-zA-Z0-9-_]+)/);
-                    return match ? match[1] : null;
-                }
-                
-                // 1. First scan: Find all images and check if they're near competition links
-                const allImages = document.querySelectorAll('img');
-                
-                for (const img of allImages) {
-                    // Skip if no src
-                    if (!img.src) continue;
-                    
-                    // Skip very small images (less than 20px)
-                    if (img.width < 20 || img.height < 20) continue;
-                    
-                    // Look for competition links nearby - traverse up
-                    let current = img.parentElement;
-                    let foundCompetitionSlug = null;
-                    
-                    // Check up to 5 levels up
-                    for (let i = 0; i < 5 && current; i++) {
-                        // If we find an anchor with competition URL
-                        const anchors = current.querySelectorAll('a[href*="/competitions/"]');
-                        for (const anchor of anchors) {
-                            const slug = getCompetitionSlugFromUrl(anchor.href);
-                            if (slug) {
-                                foundCompetitionSlug = slug;
-                                break;
-                            }
-                        }
-                        
-                        // Also check the element itself if it's an anchor
-                        if (current.tagName === 'A' && current.href && current.href.includes('/competitions/')) {
-                            const slug = getCompetitionSlugFromUrl(current.href);
-                            if (slug) {
-                                foundCompetitionSlug = slug;
-                                break;
-                            }
-                        }
-                        
-                        if (foundCompetitionSlug) break;
-                        current = current.parentElement;
-                    }
-                    
-                    if (foundCompetitionSlug) {
-                        // Check if it looks like a logo
-                        const isLikelyLogo = 
-                            img.src.includes('logo') || 
-                            img.src.includes('thumb') || 
-                            img.src.includes('icon') ||
-                            img.src.includes('badges') ||
-                            (img.width <= 100 && img.height <= 100) ||
-                            img.width === img.height; // Square images are often logos
-                        
-                        if (isLikelyLogo) {
-                            competitionLogoMap[foundCompetitionSlug] = img.src;
-                        }
+                    if (!slugCache.has(url)) {
+                        const match = url.match(SLUG_RE);
+                        slugCache.set(url, match ? match[1] : null);
                     }
+                    return slugCache.get(url);
                 }
                 
-                // 2. Second scan: Look specifically for cards and then any images inside them
-                const possibleCards = document.querySelectorAll('div[class*="card"], div[class*="item"], div[class*="container"]');
+                // Query the anchors once and share them between all the scans below
+                const competitionAnchors = Array.from(document.querySelectorAll('a[href*="/competitions/"]'));
                 
-                for (const card of possibleCards) {
-                    // Check if the card contains a competition link
-                    const competitionLinks = card.querySelectorAll('a[href*="/competitions/"]');
-                    if (competitionLinks.length === 0) continue;
-                    
-                    // Get the competition slug
-                    const href = competitionLinks[0].href;
-                    const slug = getCompetitionSlugFromUrl(href);
-                    if (!slug) continue;
-                    
-                    // Already found a logo for this competition
-                    if (competitionLogoMap[slug]) continue;
-                    
-                    // Look for images in this card
-                    const images = card.querySelectorAll('img');
-                    if (images.length > 0) {
-                        // Prioritize images that look like logos
-                        let logoFound = false;
-                        
-                        for (const img of images) {
-                            if (!img.src) continue;
-                            
-                            const isLikelyLogo = 
-                                img.src.includes('logo') || 
-                                img.src.includes('thumb') || 
-                                img.src.includes('icon') ||
-                                img.src.includes('badges') ||
-                                (img.width <= 100 && img.height <= 100) ||
-                                img.width === img.height; // Square images are often logos
-                            
-                            if (isLikelyLogo) {
-                                competitionLogoMap[slug] = img.src;
-                                logoFound = true;
-                                break;
-                            }
-                        }
-                        
-                        // If no logo-like image was found, use the first image
-                        if (!logoFound && images[0].src) {
-                            competitionLogoMap[slug] = images[0].src;
-                        }
-                    }
-                }
+                // 0. Extract all links that look like competition links
+                const competitionLinks = window.__extractCompetitionLinks();
                 
-                // Convert from slug-based map to URL-based map
-                const result = {};
-                for (const [slug, logoUrl] of Object.entries(competitionLogoMap)) {
-                    const fullUrl = `https://www.kaggle.com/competitions/${slug}`;
-                    result[fullUrl] = logoUrl;
+                // Logo hints in the image URL, one regex pass instead of chained includes()
+                const LOGO_HINT_RE = /logo|thumb|icon|badges/;
+                const CARD_LOGO_HINT_RE = /logo|thumb|icon/;
+                
+                function isLikelyLogo(info) {
+                    // Small or square images are often logos
+                    const isSquareSmall = info.width === info.height || (info.width <= 100 && info.height <= 100);
+                    return isSquareSmall || LOGO_HINT_RE.test(info.src);
                 }
                 
-                return {
-                    logoMap: result,
-                    stats: {
-                        totalLogosFound: Object.keys(result).length
-                    }
-                };
-            }""")
-            
-            print(f"Full DOM scan found logos for {scan_results['stats']['totalLogosFound']} competitions")
-            
-            # Extract logo images from the first approach
-            logo_images = await page.evaluate("""() => {
-                // For direct mapping from URLs to logos
-                const logoMap = {};
+                // 1. Per-card scan: direct mapping from card URLs to logos, the cheapest pass
+                const cardLogoMap = {};
                 
                 // Find all competition card elements or containers
-                const competitionCards = document.querySelectorAll('a[href*="/competitions/"]');
+                const competitionCards = competitionAnchors;
                 
                 competitionCards.forEach(card => {
                     try {
-                        // Get the URL (key)
-                        let href = card.getAttribute('href');
-                        if (href.startsWith('/')) {
-                            href = 'https://www.kaggle.com' + href;
-                        }
+                        // Get the canonical competition URL (key)
+                        const slug = getCompetitionSlugFromUrl(card.href);
+                        if (!slug) return;
+                        const href = `https://www.kaggle.com/competitions/${slug}`;
+                        if (cardLogoMap[href]) return;
                         
                         // APPROACH 1: Look for the specific structure mentioned by the user
                         // <div class="sc-kJZLhT jvoaUf"><img src="...">
@@ -1004,7 +901,7 @@ async def extract_competition_links(page):
                                 if (imgSrc.startsWith('/')) {
                                     imgSrc = 'https://www.kaggle.com' + imgSrc;
                                 }
-                                logoMap[href] = imgSrc;
+                                cardLogoMap[href] = imgSrc;
                                 return; // Found logo, skip other approaches
                             }
                         }
@@ -1017,7 +914,7 @@ async def extract_competition_links(page):
                             if (imgSrc.startsWith('/')) {
                                 imgSrc = 'https://www.kaggle.com' + imgSrc;
                             }
-                            logoMap[href] = imgSrc;
+                            cardLogoMap[href] = imgSrc;
                             return; // Found logo, skip other approaches
                         }
                         
@@ -1026,9 +923,7 @@ async def extract_competition_links(page):
                         for (const img of imgs) {
                             if (img.src) {
                                 // Check for logo indicators in the src URL
-                                if (img.src.includes('logo') || 
-                                    img.src.includes('thumb') || 
-                                    img.src.includes('icon') || 
+                                if (CARD_LOGO_HINT_RE.test(img.src) || 
                                     (img.width > 0 && img.width < 100) ||  // Small images are likely logos
                                     (img.height > 0 && img.height < 100)) {
                                     // Ensure absolute URL
@@ -1036,75 +931,198 @@ async def extract_competition_links(page):
                                     if (imgSrc.startsWith('/')) {
                                         imgSrc = 'https://www.kaggle.com' + imgSrc;
                                     }
-                                    logoMap[href] = imgSrc;
+                                    cardLogoMap[href] = imgSrc;
                                     break;
                                 }
                             }
                         }
                         
                         // APPROACH 4: Fall back to any image if nothing else worked
-                        if (!logoMap[href] && imgs.length > 0 && imgs[0].src) {
+                        if (!cardLogoMap[href] && imgs.length > 0 && imgs[0].src) {
                             // Ensure absolute URL
                             let imgSrc = imgs[0].src;
                             if (imgSrc.startsWith('/')) {
                                 imgSrc = 'https://www.kaggle.com' + imgSrc;
                             }
-                            logoMap[href] = imgSrc;
+                            cardLogoMap[href] = imgSrc;
                         }
                     } catch (e) {
                         console.error('Error extracting logo for card:', e);
                     }
                 });
                 
-                // Log the results for debugging
-                console.log('Found logos for', Object.keys(logoMap).length, 'competitions');
-                return logoMap;
+                // Only competitions the per-card scan couldn't cover need the full DOM scans
+                const missingSlugs = new Set();
+                for (const link of competitionLinks) {
+                    if (!cardLogoMap[link]) {
+                        missingSlugs.add(getCompetitionSlugFromUrl(link));
+                    }
+                }
+                if (missingSlugs.size === 0) {
+                    return {
+                        competitionLinks,
+                        logoMap: cardLogoMap,
+                        stats: {
+                            totalLogosFound: 0,
+                            cardLogosFound: Object.keys(cardLogoMap).length
+                        }
+                    };
+                }
+                
+                // Map every element to the first competition slug in its subtree with one
+                // upward pass per anchor, stopping where an earlier anchor already claimed it
+                const slugWithin = new WeakMap();
+                for (const anchor of competitionAnchors) {
+                    const slug = getCompetitionSlugFromUrl(anchor.href);
+                    if (!slug) continue;
+                    for (let node = anchor; node && !slugWithin.has(node); node = node.parentElement) {
+                        slugWithin.set(node, slug);
+                    }
+                }
+                
+                // Read every image's src and size in one batch before making any decisions,
+                // so the loops below only touch cached values
+                const imageInfo = new Map();
+                for (const img of document.querySelectorAll('img')) {
+                    // Intrinsic size doesn't depend on layout; fall back to the rendered size
+                    // when the image hasn't loaded
+                    imageInfo.set(img, {
+                        src: img.src,
+                        width: img.naturalWidth || img.width,
+                        height: img.naturalHeight || img.height
+                    });
+                }
+                
+                // 2. Image scan: Find all images and check if they're near competition links
+                for (const [img, info] of imageInfo) {
+                    // Skip if no src
+                    if (!info.src) continue;
+                    
+                    // Skip very small images (less than 20px)
+                    if (info.width < 20 || info.height < 20) continue;
+                    
+                    // Look for competition links nearby - traverse up, checking up to 5 levels
+                    let current = img.parentElement;
+                    let foundCompetitionSlug = null;
+                    for (let i = 0; i < 5 && current && !foundCompetitionSlug; i++) {
+                        foundCompetitionSlug = slugWithin.get(current) || null;
+                        current = current.parentElement;
+                    }
+                    
+                    if (foundCompetitionSlug && missingSlugs.has(foundCompetitionSlug)) {
+                        // Check if it looks like a logo
+                        if (isLikelyLogo(info)) {
+                            competitionLogoMap[foundCompetitionSlug] = info.src;
+                        }
+                    }
+                }
+                
+                // 3. Card scan: Look specifically for cards and then any images inside them
+                const possibleCards = document.querySelectorAll('div[class*="card"], div[class*="item"], div[class*="container"]');
+                
+                for (const card of possibleCards) {
+                    // Get the slug of the first competition link inside the card from the
+                    // ancestor map instead of re-running a selector per card
+                    const slug = slugWithin.get(card);
+                    if (!slug || !missingSlugs.has(slug)) continue;
+                    
+                    // Already found a logo for this competition
+                    if (competitionLogoMap[slug]) continue;
+                    
+                    // Look for images in this card
+                    const images = card.querySelectorAll('img');
+                    if (images.length > 0) {
+                        // Prioritize images that look like logos
+                        let logoFound = false;
+                        
+                        for (const img of images) {
+                            const info = imageInfo.get(img);
+                            if (!info.src) continue;
+                            
+                            if (isLikelyLogo(info)) {
+                                competitionLogoMap[slug] = info.src;
+                                logoFound = true;
+                                break;
+                            }
+                        }
+                        
+                        // If no logo-like image was found, use the first image
+                        if (!logoFound && imageInfo.get(images[0]).src) {
+                            competitionLogoMap[slug] = imageInfo.get(images[0]).src;
+                        }
+                    }
+                }
+                
+                // Convert from slug-based map to URL-based map
+                const result = {};
+                for (const [slug, logoUrl] of Object.entries(competitionLogoMap)) {
+                    const fullUrl = `https://www.kaggle.com/competitions/${slug}`;
+                    result[fullUrl] = logoUrl;
+                }
+                
+                return {
+                    competitionLinks,
+                    // The slug scans only ran for competitions without a per-card logo
+                    logoMap: Object.assign({}, cardLogoMap, result),
+                    stats: {
+                        totalLogosFound: Object.keys(result).length,
+                        cardLogosFound: Object.keys(cardLogoMap).length
+                    }
+                };
             }""")
             
-            # Combine the two approaches
-            combined_logo_map = {**logo_images, **scan_results['logoMap']}
+            competition_links = scan_results['competitionLinks']
+            print(f"Found {len(competition_links)} competition links by URL pattern")
+            print(f"Full DOM scan found logos for {scan_results['stats']['totalLogosFound']} competitions")
+            
+            # The per-card and slug-based logo maps were already merged in the page
+            combined_logo_map = scan_results['logoMap']
             
             # Create minimal placeholder data for these links
             competition_data = []
             for link in competition_links:
+                slug = competition_id_from_url(link)
                 logo_url = combined_logo_map.get(link, "")
-                if logo_url:
-                    print(f"Found logo for {link.split('/')[-1]}: {logo_url[:60]}...")
+                if logo_url and DEBUG_MODE:
+                    print(f"Found logo for {slug}: {logo_url[:60]}...")
                 
                 competition_data.append({
                     "url": link,
-                    "title": link.split('/').pop(),  # Use the last part of the URL as a title placeholder
+                    "title": slug,  # Use the competition slug as a title placeholder
                     "logo_url": logo_url  # Add logo URL if found
                 })
         
         # Save the detailed listing data for use in detail extraction
-        with open('competition_listing_data.json', 'w') as f:
-            json.dump(competition_data, f, indent=2)
+        with open('competition_listing_data.json', 'wb') as f:
+            f.write(orjson.dumps(competition_data, option=orjson.OPT_INDENT_2))
         
         # Upload logo images to Cloudinary if enabled
         if CLOUDINARY_ENABLED:
-            updated_competition_data = []
-            for item in competition_data:
-                if item.get('logo_url'):
-                    # Extract competition ID from URL
-                    competition_id = item.get('url', '').split('/')[-1]
-                    if not competition_id:
-                        competition_id = item.get('title', '').lower().replace(' ', '_')
-                    
-                    # Upload logo to Cloudinary
-                    item['logo_url'] = await upload_image_to_cloudinary(
-                        item['logo_url'],
-                        competition_id,
-                        'logo_listing'
-                    )
-                updated_competition_data.append(item)
+            items_with_logos = [item for item in competition_data if item.get('logo_url')]
+            upload_tasks = []
+            for item in items_with_logos:
+                # Extract competition ID from URL
+                competition_id = competition_id_from_url(item.get('url', ''))
+                if not competition_id:
+                    competition_id = item.get('title', '').lower().replace(' ', '_')
+                
+                upload_tasks.append(upload_image_to_cloudinary(
+                    item['logo_url'],
+                    competition_id,
+                    'logo_listing'
+                ))
             
-            # Replace with updated data
-            competition_data = updated_competition_data
+            # Upload all logos concurrently, bounded by the Cloudinary semaphore
+            upload_results = await asyncio.gather(*upload_tasks, return_exceptions=True)
+            for item, cloudinary_url in zip(items_with_logos, upload_results):
+                if isinstance(cloudinary_url, Exception):
+                    print(f"Error uploading logo for {item.get('url')}: {cloudinary_url}")
+                else:
+                    item['logo_url'] = cloudinary_url
             
             # Save updated data with Cloudinary URLs
-            with open('competition_listing_data_cloudinary.json', 'w') as f:
-                json.dump(competition_data, f, indent=2)
+            with open('competition_listing_data_cloudinary.json', 'wb') as f:
+                f.write(orjson.dumps(competition_data, option=orjson.OPT_INDENT_2))
         
         return competition_links, competition_data
     
@@ -1115,31 +1133,7 @@ async def extract_competition_links(page):
         # Try a last-resort approach to find competition links
         try:
             print("Attempting last-resort extraction of competition links...")
-            competition_links = await page.evaluate("""() => {
-                // Get all links on the page
-                const allLinks = Array.from(document.querySelectorAll('a[href]'));
-                
-                // Filter for likely competition links
-                const competitionLinks = allLinks
-                    .filter(a => {
-                        const href = a.getAttribute('href');
-                        return href && 
-                               (href.includes('/c/') || href.includes('/competitions/')) &&
-                               !href.includes('/competitions?') && 
-                               !href.includes('/competitions/list') &&
-                               !href.includes('listOption=');
-                    })
-                    .map(a => {
-                        let href = a.getAttribute('href');
-                        if (href.startsWith('/')) {
-                            href = 'https://www.kaggle.com' + href;
-                        }
-                        return href;
-                    });
-                
-                // Remove duplicates
-                return [...new Set(competitionLinks)];
-            }""")
+            competition_links = await page.evaluate("window.__extractCompetitionLinks()")
             
             print(f"Last-resort extraction found {len(competition_links)} links")
             
@@ -1148,7 +1142,7 @@ async def extract_competition_links(page):
             for link in competition_links:
                 competition_data.append({
                     "url": link,
-                    "title": link.split('/').pop(),  # Use the last part of the URL as a title placeholder
+                    "title": competition_id_from_url(link),  # Use the competition slug as a title placeholder
                 })
                 
             return competition_links, competition_data
@@ -1157,453 +1151,512 @@ async def extract_competition_links(page):
             print(f"Last-resort extraction also failed: {fallback_error}")
             return [], []
 
-async def extract_competition_details(page, url, listing_data=None):
-    """Extract detailed information from a competition page by visiting specific section URLs."""
-    try:
-        print(f"Extracting details from: {url}")
+# Basic information from the main competition page: title, banner, logo,
+# organizer, participation stats and tags
+MAIN_PAGE_EXTRACTOR_SCRIPT = """() => {
+    const data = {};
+    
+    // Compiled once per call instead of per element
+    const BACKGROUND_URL_RE = /url\\(["']?([^"'\\)]+)["']?\\)/;
+    
+    try {
+        // Title
+        const titleElement = document.querySelector('h1.competition-name');
+        if (titleElement) {
+            data.title = titleElement.textContent.trim();
+        }
         
-        # Set a competition ID for debugging purposes
-        competition_id = url.split('/')[-1]
+        // Banner image - with specific selector for the pattern provided
+        let bannerElement = document.querySelector('div[class*="sc-"] img[src*="/competitions/"][src*="/images/header"]');
+        if (bannerElement) {
+            // Make sure the URL is absolute
+            let bannerSrc = bannerElement.src;
+            if (bannerSrc.startsWith('/')) {
+                bannerSrc = 'https://www.kaggle.com' + bannerSrc;
+            }
+            data.banner_url = bannerSrc;
+        }
         
-        # Use listing data if available
-        competition_details = {}
-        if listing_data and isinstance(listing_data, dict):
-            # Get data for this URL if available
-            url_data = listing_data.get(url, {})
-            if url_data:
-                competition_details = url_data.copy()
-                print(f"Found listing data for {url}")
-                # Explicitly log if we found a logo URL in the listing data
-                if "logo_url" in url_data and url_data["logo_url"]:
-                    print(f"Using logo URL from listing: {url_data['logo_url']}")
+        // If not found, try generic selectors as fallback
+        if (!data.banner_url) {
+            bannerElement = document.querySelector('.competition-banner img, .competition-header-bg img, .header-image img, .banner img');
+            if (bannerElement) {
+                let bannerSrc = bannerElement.src;
+                if (bannerSrc.startsWith('/')) {
+                    bannerSrc = 'https://www.kaggle.com' + bannerSrc;
+                }
+                data.banner_url = bannerSrc;
+            }
+        }
         
-        # Define section URLs to visit
-        section_urls = {
-            "abstract": f"{url}/overview/abstract",
-            "description": f"{url}/overview/description",
-            "timeline": f"{url}/overview/timeline",
-            "prizes": f"{url}/overview/prizes"
+        // If still not found, try any large image near the top of the page
+        if (!data.banner_url) {
+            const allImages = document.querySelectorAll('img');
+            // Look at the first 10 images, as banner is likely at the top
+            for (let i = 0; i < Math.min(10, allImages.length); i++) {
+                const img = allImages[i];
+                // If the image is large, it might be a banner
+                if (img.width > 400 || img.height > 150) {
+                    let imgSrc = img.src;
+                    if (imgSrc.startsWith('/')) {
+                        imgSrc = 'https://www.kaggle.com' + imgSrc;
+                    }
+                    data.banner_url = imgSrc;
+                    break;
+                }
+            }
         }
         
-        # First visit the main page to get the banner and other basic details
-        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-        await page.wait_for_load_state("networkidle", timeout=30000)
+        // Logo - only get this if we don't already have it from the listing page
+        const logoElement = document.querySelector('.competition-header-logo img, .competition-logo img');
+        if (logoElement) {
+            data.detail_page_logo_url = logoElement.src;
+        }
         
-        # Take a screenshot of the main page
-        if DEBUG_MODE:
-            await take_screenshot(page, f"competition_{competition_id}_main.png")
+        // Extract host/organizer information
+        try {
+            const organizerElement = document.querySelector('p.sc-gQaihK, .competition-organizer, .organizer-name');
+            if (organizerElement) {
+                data.organizer = organizerElement.textContent.trim();
+            }
             
-            # Save HTML for debugging
-            html_content = await page.content()
-            os.makedirs(f"debug/competitions", exist_ok=True)
-            with open(f"debug/competitions/{competition_id}_main.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-        
-        # Extract basic information from the main page
-        main_page_info = await page.evaluate("""() => {
-            const data = {};
+            // Try to get host avatar/image
+            const hostAvatarElement = document.querySelector('div[data-testid="avatar-image"], div[style*="background-image"]');
+            if (hostAvatarElement) {
+                // Extract background-image URL from style
+                const bgImageStyle = hostAvatarElement.style.backgroundImage;
+                if (bgImageStyle) {
+                    // Extract URL from style="background-image: url("URL")"
+                    const match = bgImageStyle.match(BACKGROUND_URL_RE);
+                    if (match && match[1]) {
+                        data.organizer_logo_url = match[1];
+                    }
+                }
+            }
+        } catch (e) {
+            console.error('Error extracting organizer info:', e);
+        }
+        
+        // Extract participation stats and tags from the sidebar with one DOM query,
+        // sorting each node into its bucket and reading its text only once
+        try {
+            const PARTICIPATION_SELECTOR = '.sc-ifbJqq .sc-fkSjGX p.sc-gQaihK';
+            // Use more specific tag selectors like in the old approach
+            const TAG_SELECTOR = 'a[href*="tagIds"], div[class*="sc-fIOXfZ"] span, .sc-eUlrpB';
+            // Old structure for tags, used only if the specific selectors find nothing
+            const FALLBACK_TAG_SELECTOR = '.competition-tags .badge, .competition-categories .badge';
+            const COUNT_RE = /(\\d[\\d,]*)/;
             
-            try {
-                // Title
-                const titleElement = document.querySelector('h1.competition-name');
-                if (titleElement) {
-                    data.title = titleElement.textContent.trim();
+            const participationStats = {};
+            const tags = [];
+            // Fallback tag text is only read if the specific selectors find nothing
+            const fallbackTagNodes = [];
+            const sidebarNodes = document.querySelectorAll(
+                [PARTICIPATION_SELECTOR, TAG_SELECTOR, FALLBACK_TAG_SELECTOR].join(', ')
+            );
+            
+            for (const el of sidebarNodes) {
+                const isParticipation = el.matches(PARTICIPATION_SELECTOR);
+                const isTag = el.matches(TAG_SELECTOR);
+                if (!isParticipation && !isTag) {
+                    // Only the fallback selector matched
+                    fallbackTagNodes.push(el);
+                    continue;
                 }
                 
-                // Banner image - with specific selector for the pattern provided
-                let bannerElement = document.querySelector('div[class*="sc-"] img[src*="/competitions/"][src*="/images/header"]');
-                if (bannerElement) {
-                    // Make sure the URL is absolute
-                    let bannerSrc = bannerElement.src;
-                    if (bannerSrc.startsWith('/')) {
-                        bannerSrc = 'https://www.kaggle.com' + bannerSrc;
-                    }
-                    data.banner_url = bannerSrc;
-                }
+                const text = el.textContent.trim();
                 
-                // If not found, try generic selectors as fallback
-                if (!data.banner_url) {
-                    bannerElement = document.querySelector('.competition-banner img, .competition-header-bg img, .header-image img, .banner img');
-                    if (bannerElement) {
-                        let bannerSrc = bannerElement.src;
-                        if (bannerSrc.startsWith('/')) {
-                            bannerSrc = 'https://www.kaggle.com' + bannerSrc;
-                        }
-                        data.banner_url = bannerSrc;
+                if (isParticipation) {
+                    const match = text.match(COUNT_RE);
+                    if (match) {
+                        if (text.includes('Entrants')) participationStats.entrants = match[0];
+                        else if (text.includes('Participants')) participationStats.participants = match[0];
+                        else if (text.includes('Teams')) participationStats.teams = match[0];
+                        else if (text.includes('Submissions')) participationStats.submissions = match[0];
                     }
                 }
-                
-                // If still not found, try any large image near the top of the page
-                if (!data.banner_url) {
-                    const allImages = document.querySelectorAll('img');
-                    // Look at the first 10 images, as banner is likely at the top
-                    for (let i = 0; i < Math.min(10, allImages.length); i++) {
-                        const img = allImages[i];
-                        // If the image is large, it might be a banner
-                        if (img.width > 400 || img.height > 150) {
-                            let imgSrc = img.src;
-                            if (imgSrc.startsWith('/')) {
-                                imgSrc = 'https://www.kaggle.com' + imgSrc;
-                            }
-                            data.banner_url = imgSrc;
-                            break;
-                        }
-                    }
+                if (isTag) {
+                    if (text) tags.push(text);
                 }
-                
-                // Logo - only get this if we don't already have it from the listing page
-                const logoElement = document.querySelector('.competition-header-logo img, .competition-logo img');
-                if (logoElement) {
-                    data.detail_page_logo_url = logoElement.src;
+                if (el.matches(FALLBACK_TAG_SELECTOR)) {
+                    fallbackTagNodes.push(el);
                 }
-                
-                // Extract host/organizer information
-                try {
-                    const organizerElement = document.querySelector('p.sc-gQaihK, .competition-organizer, .organizer-name');
-                    if (organizerElement) {
-                        data.organizer = organizerElement.textContent.trim();
-                    }
-                    
-                    // Try to get host avatar/image
-                    const hostAvatarElement = document.querySelector('div[data-testid="avatar-image"], div[style*="background-image"]');
-                    if (hostAvatarElement) {
-                        // Extract background-image URL from style
-                        const bgImageStyle = hostAvatarElement.style.backgroundImage;
-                        if (bgImageStyle) {
-                            // Extract URL from style="background-image: url("URL")"
-                            const match = bgImageStyle.match(/url\\(["']?([^"'\\)]+)["']?\\)/);
-                            if (match && match[1]) {
-                                data.organizer_logo_url = match[1];
-                            }
+            }
+            
+            if (Object.keys(participationStats).length > 0) {
+                data.participation_stats = participationStats;
+            }
+            
+            if (tags.length > 0) {
+                data.tags = tags;
+            } else if (fallbackTagNodes.length > 0) {
+                data.tags = fallbackTagNodes.map(el => el.textContent.trim());
+            }
+            
+            // Also check for tags in a section specifically for tags
+            if (!data.tags) {
+                // Find sections with tag headings
+                const sections = document.querySelectorAll('div[class*="sc-gzFJfr"], div[class*="sc-"] > div');
+                for (const section of sections) {
+                    const headingElement = section.querySelector('h2, h3');
+                    if (headingElement && headingElement.textContent.trim().includes('Tags')) {
+                        const sectionTagElements = section.querySelectorAll('a[href*="tagIds"], span[class*="sc-"]');
+                        if (sectionTagElements.length > 0) {
+                            data.tags = Array.from(sectionTagElements).map(tag => tag.textContent.trim())
+                                .filter(tag => tag); // Filter out empty strings
+                            break;
                         }
                     }
-                } catch (e) {
-                    console.error('Error extracting organizer info:', e);
                 }
-                
-                // Extract participation stats from the sidebar
-                try {
-                    // Look for participation section in the sidebar
-                    const participationElements = document.querySelectorAll('.sc-ifbJqq .sc-fkSjGX p.sc-gQaihK');
-                    const participationStats = {};
-                    
-                    participationElements.forEach(el => {
-                        const text = el.textContent.trim();
-                        
-                        if (text.includes('Entrants')) {
-                            const match = text.match(/(\\d[\\d,]*)/);
-                            if (match) participationStats.entrants = match[0];
-                        }
-                        else if (text.includes('Participants')) {
-                            const match = text.match(/(\\d[\\d,]*)/);
-                            if (match) participationStats.participants = match[0];
-                        }
-                        else if (text.includes('Teams')) {
-                            const match = text.match(/(\\d[\\d,]*)/);
-                            if (match) participationStats.teams = match[0];
-                        }
-                        else if (text.includes('Submissions')) {
-                            const match = text.match(/(\\d[\\d,]*)/);
-                            if (match) participationStats.submissions = match[0];
-                        }
-                    });
+            }
+        } catch (e) {
+            console.error('Error extracting participation stats and tags:', e);
+        }
+    } catch (e) {
+        console.error('Error extracting basic information:', e);
+    }
+    
+    return data;
+}"""
+
+# Placeholders for required fields that no page provided
+DETAIL_FIELD_DEFAULTS = {
+    "start_date": "Unknown",
+    "end_date": "Unknown",
+    "prize_pool": "See competition details",
+}
+
+# Overview sections read for every competition, in merge order. Each one lives at
+# <competition url>/overview/<name> when it isn't already on the main page.
+OVERVIEW_SECTIONS = ("abstract", "description", "timeline", "prizes")
+
+# Sections whose navigation can be skipped when the listing API supplied these fields
+API_SECTION_FIELDS = {
+    "timeline": ("start_date", "end_date"),
+    "prizes": ("prize_pool",),
+}
+
+# One extractor for every overview section. It runs on whatever page is loaded and
+# reports which section containers it found, so sections already present on the
+# main competition page don't need their own navigation.
+SECTION_EXTRACTOR_SCRIPT = """(sections) => {
+    const results = {};
+    
+    // Compiled once per call instead of per list item
+    const TIMELINE_DATE_RE = /(\\w+ \\d+, \\d{4})\\s*(?:-|–|—)\\s*(.*)/;
+    const START_EVENT_RE = /start|launch|begins/;
+    const END_EVENT_RE = /final submission|deadline|close|end/;
+    const TOTAL_PRIZE_RE = /TOTAL PRIZES AVAILABLE:\\s*\\$(\\d[\\d,]*(?:\\.\\d+)?)/i;
+    const DOLLAR_RE = /\\$(\\d[\\d,]*(?:\\.\\d+)?)/;
+    const PRIZE_RANK_RE = /(First|Second|Third|Fourth|Fifth|\\d+(?:st|nd|rd|th))[^:]*:\\s*\\$(\\d[\\d,]*(?:\\.\\d+)?)/i;
+    const KNOWLEDGE_RE = /knowledge/i;
+    
+    // Abstract content
+    function extractAbstract() {
+        const data = {};
+        const abstractSection = document.querySelector('#abstract');
+        if (abstractSection) {
+            const paragraphs = abstractSection.querySelectorAll('p');
+            if (paragraphs.length > 0) {
+                data.abstract = Array.from(paragraphs)
+                    .map(p => p.textContent.trim())
+                    .join('\\n\\n');
+            }
+        }
+        return data;
+    }
+    
+    // Description content
+    function extractDescription() {
+        const data = {};
+        const descriptionSection = document.querySelector('#description .sc-ePpfBx');
+        if (descriptionSection) {
+            data.description = descriptionSection.textContent.trim();
+        }
+        return data;
+    }
+    
+    // Timeline content
+    function extractTimeline() {
+        const data = {};
+        const timelineSection = document.querySelector('#timeline .sc-ePpfBx');
+        if (timelineSection) {
+            const timelineItems = timelineSection.querySelectorAll('li');
+            if (timelineItems.length > 0) {
+                const timeline = [];
+                
+                timelineItems.forEach(item => {
+                    const text = item.textContent.trim();
                     
-                    if (Object.keys(participationStats).length > 0) {
-                        data.participation_stats = participationStats;
+                    // Extract date and event description
+                    // Format is typically: "Date - Description"
+                    const dateMatch = text.match(TIMELINE_DATE_RE);
+                    if (dateMatch) {
+                        timeline.push({
+                            date: dateMatch[1],
+                            event: dateMatch[2].trim()
+                        });
+                    } else {
+                        timeline.push({
+                            text: text
+                        });
                     }
-                } catch (e) {
-                    console.error('Error extracting participation stats:', e);
-                }
+                });
                 
-                // Extract tags from the sidebar
-                try {
-                    // Use more specific tag selectors like in the old approach
-                    const tagElements = document.querySelectorAll('a[href*="tagIds"], div[class*="sc-fIOXfZ"] span, .sc-eUlrpB');
-                    if (tagElements.length > 0) {
-                        const tags = [];
-                        tagElements.forEach(el => {
-                            const tagText = el.textContent.trim();
-                            if (tagText) tags.push(tagText);
-                        });
-                        
-                        if (tags.length > 0) {
-                            data.tags = tags;
-                        }
+                data.timeline = timeline;
+                
+                // Extract start date and end date from timeline
+                for (const item of timeline) {
+                    if (!item.event) continue;
+                    const event = item.event.toLowerCase();
+                    if (START_EVENT_RE.test(event)) {
+                        data.start_date = item.date;
                     }
-                    
-                    // Fall back to old structure for tags if not found
-                    if (!data.tags) {
-                        const tagElements = document.querySelectorAll('.competition-tags .badge, .competition-categories .badge');
-                        if (tagElements.length > 0) {
-                            data.tags = Array.from(tagElements).map(tag => tag.textContent.trim());
-                        }
+                    else if (END_EVENT_RE.test(event)) {
+                        data.end_date = item.date;
                     }
-                    
-                    // Also check for tags in a section specifically for tags
-                    if (!data.tags) {
-                        // Find sections with tag headings
-                        const sections = document.querySelectorAll('div[class*="sc-gzFJfr"], div[class*="sc-"] > div');
-                        for (const section of sections) {
-                            const headingElement = section.querySelector('h2, h3');
-                            if (headingElement && headingElement.textContent.trim().includes('Tags')) {
-                                const sectionTagElements = section.querySelectorAll('a[href*="tagIds"], span[class*="sc-"]');
-                                if (sectionTagElements.length > 0) {
-                                    data.tags = Array.from(sectionTagElements).map(tag => tag.textContent.trim())
-                                        .filter(tag => tag); // Filter out empty strings
-                                    break;
-                                }
-                            }
-                        }
+                }
+            }
+        }
+        
+        // If start date wasn't found, check the sidebar
+        if (!data.start_date) {
+            const startElement = document.querySelector('.sc-JEPTY .sc-ffwOux:first-child .sc-hbtGpV');
+            if (startElement) {
+                const startText = startElement.textContent.trim();
+                if (startText) {
+                    data.start_date = startText;
+                }
+            }
+        }
+        
+        // If end date wasn't found, check the sidebar
+        if (!data.end_date) {
+            const endElement = document.querySelector('.sc-JEPTY .sc-ffwOux:last-child .sc-hbtGpV');
+            if (endElement) {
+                const endText = endElement.textContent.trim();
+                if (endText) {
+                    data.end_date = endText;
+                }
+            }
+        }
+        return data;
+    }
+    
+    // Prizes content
+    function extractPrizes() {
+        const data = {};
+        const prizesSection = document.querySelector('#prizes .sc-ePpfBx');
+        if (prizesSection) {
+            // Get the full prize text
+            const prizesText = prizesSection.textContent;
+            data.prize_details = prizesText.trim();
+            
+            // Try to extract just the main prize amount
+            const totalPrizeMatch = prizesText.match(TOTAL_PRIZE_RE);
+            if (totalPrizeMatch) {
+                data.prize_pool = '$' + totalPrizeMatch[1];
+            } else {
+                // Look for dollar amounts
+                const dollarMatch = prizesText.match(DOLLAR_RE);
+                if (dollarMatch) {
+                    data.prize_pool = '$' + dollarMatch[1];
+                } else {
+                    // Check if it's a learning/knowledge competition
+                    if (KNOWLEDGE_RE.test(prizesText)) {
+                        data.prize_pool = 'Knowledge';
+                    } else {
+                        data.prize_pool = 'See competition details';
                     }
-                } catch (e) {
-                    console.error('Error extracting tags:', e);
                 }
-            } catch (e) {
-                console.error('Error extracting basic information:', e);
             }
             
-            return data;
-        }""")
+            // Extract prize breakdown
+            const prizeItems = [];
+            const liElements = prizesSection.querySelectorAll('li');
+            
+            for (const li of liElements) {
+                // Look for patterns like "First Prize: $X,XXX"
+                const prizeMatch = li.textContent.match(PRIZE_RANK_RE);
+                if (prizeMatch) {
+                    prizeItems.push({
+                        rank: prizeMatch[1].trim(),
+                        amount: '$' + prizeMatch[2]
+                    });
+                }
+            }
+            
+            if (prizeItems.length > 0) {
+                data.prize_breakdown = prizeItems;
+            }
+        }
+        return data;
+    }
+    
+    const extractors = {
+        abstract: extractAbstract,
+        description: extractDescription,
+        timeline: extractTimeline,
+        prizes: extractPrizes
+    };
+    
+    for (const name of sections) {
+        try {
+            results[name] = {
+                found: document.querySelector('#' + name) !== null,
+                data: extractors[name]()
+            };
+        } catch (e) {
+            console.error('Error extracting ' + name + ':', e);
+            results[name] = {found: false, data: {}};
+        }
+    }
+    
+    return results;
+}"""
+
+async def extract_competition_details(page, url, listing_data=None):
+    """Extract detailed information from a competition page by visiting specific section URLs."""
+    try:
+        if DEBUG_MODE:
+            print(f"Extracting details from: {url}")
+        
+        # Set a competition ID for debugging purposes
+        competition_id = competition_id_from_url(url)
+        
+        # Reuse the details scraped by an earlier run while they are still fresh
+        cached_details = load_cached_competition(competition_id)
+        if cached_details is not None:
+            print(f"Using cached details for {competition_id}")
+            return cached_details
+        
+        # Use listing data if available
+        competition_details = {}
+        if listing_data and isinstance(listing_data, dict):
+            # Get data for this URL if available
+            url_data = listing_data.get(url, {})
+            if url_data:
+                competition_details = url_data.copy()
+                if DEBUG_MODE:
+                    print(f"Found listing data for {url}")
+                # Explicitly log if we found a logo URL in the listing data
+                if DEBUG_MODE and url_data.get("logo_url"):
+                    print(f"Using logo URL from listing: {url_data['logo_url']}")
+        
+        # Fill the gaps from the listing API, which ships dates and rewards the
+        # card markup doesn't show
+        api_details = listing_api_data.get(normalize_competition_url(url), {})
+        for field, value in api_details.items():
+            if not competition_details.get(field):
+                competition_details[field] = value
+        
+        # The listing card already has the core fields, so skip the page loads
+        if is_complete_competition(competition_details, DETAIL_COMPLETE_FIELDS):
+            print(f"Listing data for {competition_id} is complete, skipping detail pages")
+            for field, default in DETAIL_FIELD_DEFAULTS.items():
+                if not competition_details.get(field):
+                    competition_details[field] = default
+            competition_details['url'] = url
+            competition_details['source_platform'] = 'kaggle'
+            return competition_details
+        
+        # The main page is always loaded: it is the only source of the description,
+        # tags, banner and organizer
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        
+        # Wait for the header to render rather than for the network to go quiet
+        try:
+            await page.wait_for_selector(DETAIL_READY_SELECTOR, state="attached", timeout=DETAIL_READY_TIMEOUT)
+        except PlaywrightTimeoutError:
+            print(f"Timed out waiting for the competition header on {url}, continuing anyway")
+        
+        # Take a screenshot of the main page
+        if DEBUG_MODE:
+            await take_screenshot(page, f"competition_{competition_id}_main.png")
+            
+            # Save HTML for debugging
+            await dump_page_html(page, f"debug/competitions/{competition_id}_main.html", competition_id)
+        
+        # Extract basic information from the main page
+        main_page_info = await page.evaluate(MAIN_PAGE_EXTRACTOR_SCRIPT)
         
         # Update competition details with main page info
         competition_details.update(main_page_info)
         
-        # Process each section URL
-        for section_name, section_url in section_urls.items():
-            print(f"Visiting section: {section_name} at {section_url}")
+        # Visit the section pages concurrently on sibling pages of the same context,
+        # so cookies and the browser cache are shared with the main page
+        async def visit_section(section_page, section_name, section_url):
+            if DEBUG_MODE:
+                print(f"Visiting section: {section_name} at {section_url}")
             
             try:
                 # Navigate to section page
-                await page.goto(section_url, wait_until="domcontentloaded", timeout=60000)
-                await page.wait_for_load_state("networkidle", timeout=30000)
+                await section_page.goto(section_url, wait_until="domcontentloaded", timeout=60000)
+                
+                # Wait only for the section container the extractor reads
+                try:
+                    await section_page.wait_for_selector(f"#{section_name}", state="attached", timeout=DETAIL_READY_TIMEOUT)
+                except PlaywrightTimeoutError:
+                    print(f"Timed out waiting for the {section_name} section, continuing anyway")
                 
                 # Take screenshots for debugging
                 if DEBUG_MODE:
-                    await take_screenshot(page, f"competition_{competition_id}_{section_name}.png")
+                    await take_screenshot(section_page, f"competition_{competition_id}_{section_name}.png")
                     
                     # Save HTML for debugging
-                    html_content = await page.content()
-                    os.makedirs(f"debug/competitions", exist_ok=True)
-                    with open(f"debug/competitions/{competition_id}_{section_name}.html", "w", encoding="utf-8") as f:
-                        f.write(html_content)
+                    await dump_page_html(section_page, f"debug/competitions/{competition_id}_{section_name}.html", competition_id)
                 
                 # Extract section data
-                if section_name == "abstract":
-                    # Extract abstract section
-                    abstract_data = await page.evaluate("""() => {
-                        const data = {};
-                        
-                        try {
-                            // Abstract content
-                            const abstractSection = document.querySelector('#abstract');
-                            if (abstractSection) {
-                                const paragraphs = abstractSection.querySelectorAll('p');
-                                if (paragraphs.length > 0) {
-                                    data.abstract = Array.from(paragraphs)
-                                        .map(p => p.textContent.trim())
-                                        .join('\\n\\n');
-                                }
-                            }
-                        } catch (e) {
-                            console.error('Error extracting abstract:', e);
-                        }
-                        
-                        return data;
-                    }""")
-                    
-                    # Update with abstract data
-                    competition_details.update(abstract_data)
-                
-                elif section_name == "description":
-                    # Extract description section
-                    description_data = await page.evaluate("""() => {
-                        const data = {};
-                        
-                        try {
-                            // Description content
-                            const descriptionSection = document.querySelector('#description .sc-ePpfBx');
-                            if (descriptionSection) {
-                                data.description = descriptionSection.textContent.trim();
-                            }
-                        } catch (e) {
-                            console.error('Error extracting description:', e);
-                        }
-                        
-                        return data;
-                    }""")
-                    
-                    # Update with description data
-                    competition_details.update(description_data)
-                
-                elif section_name == "timeline":
-                    # Extract timeline section
-                    timeline_data = await page.evaluate("""() => {
-                        const data = {};
-                        
-                        try {
-                            // Timeline content
-                            const timelineSection = document.querySelector('#timeline .sc-ePpfBx');
-                            if (timelineSection) {
-                                const timelineItems = timelineSection.querySelectorAll('li');
-                                if (timelineItems.length > 0) {
-                                    const timeline = [];
-                                    
-                                    timelineItems.forEach(item => {
-                                        const text = item.textContent.trim();
-                                        
-                                        // Extract date and event description
-                                        // Format is typically: "Date - Description"
-                                        const dateMatch = text.match(/(\\w+ \\d+, \\d{4})\\s*(?:-|–|—)\\s*(.*)/);
-                                        if (dateMatch) {
-                                            timeline.push({
-                                                date: dateMatch[1],
-                                                event: dateMatch[2].trim()
-                                            });
-                                        } else {
-                                            timeline.push({
-                                                text: text
-                                            });
-                                        }
-                                    });
-                                    
-                                    data.timeline = timeline;
-                                    
-                                    // Extract start date and end date from timeline
-                                    for (const item of timeline) {
-                                        if (item.event && (
-                                            item.event.toLowerCase().includes('start') || 
-                                            item.event.toLowerCase().includes('launch') ||
-                                            item.event.toLowerCase().includes('begins'))) {
-                                            data.start_date = item.date;
-                                        }
-                                        else if (item.event && (
-                                            item.event.toLowerCase().includes('final submission') || 
-                                            item.event.toLowerCase().includes('deadline') ||
-                                            item.event.toLowerCase().includes('close') ||
-                                            item.event.toLowerCase().includes('end'))) {
-                                            data.end_date = item.date;
-                                        }
-                                    }
-                                }
-                            }
-                            
-                            // If start date wasn't found, check the sidebar
-                            if (!data.start_date) {
-                                const startElement = document.querySelector('.sc-JEPTY .sc-ffwOux:first-child .sc-hbtGpV');
-                                if (startElement) {
-                                    const startText = startElement.textContent.trim();
-                                    if (startText) {
-                                        data.start_date = startText;
-                                    }
-                                }
-                            }
-                            
-                            // If end date wasn't found, check the sidebar
-                            if (!data.end_date) {
-                                const endElement = document.querySelector('.sc-JEPTY .sc-ffwOux:last-child .sc-hbtGpV');
-                                if (endElement) {
-                                    const endText = endElement.textContent.trim();
-                                    if (endText) {
-                                        data.end_date = endText;
-                                    }
-                                }
-                            }
-                        } catch (e) {
-                            console.error('Error extracting timeline:', e);
-                        }
-                        
-                        return data;
-                    }""")
-                    
-                    # Update with timeline data
-                    competition_details.update(timeline_data)
-                
-                elif section_name == "prizes":
-                    # Extract prizes section
-                    prize_data = await page.evaluate("""() => {
-                        const data = {};
-                        
-                        try {
-                            // Prizes content
-                            const prizesSection = document.querySelector('#prizes .sc-ePpfBx');
-                            if (prizesSection) {
-                                // Get the full prize text
-                                data.prize_details = prizesSection.textContent.trim();
-                                
-                                // Try to extract just the main prize amount
-                                const totalPrizeMatch = prizesSection.textContent.match(/TOTAL PRIZES AVAILABLE:\\s*\\$(\\d[\\d,]*(?:\\.\\d+)?)/i);
-                                if (totalPrizeMatch) {
-                                    data.prize_pool = '$' + totalPrizeMatch[1];
-                                } else {
-                                    // Look for dollar amounts
-                                    const dollarMatch = prizesSection.textContent.match(/\\$(\\d[\\d,]*(?:\\.\\d+)?)/);
-                                    if (dollarMatch) {
-                                        data.prize_pool = '$' + dollarMatch[1];
-                                    } else {
-                                        // Check if it's a learning/knowledge competition
-                                        if (prizesSection.textContent.toLowerCase().includes('knowledge')) {
-                                            data.prize_pool = 'Knowledge';
-                                        } else {
-                                            data.prize_pool = 'See competition details';
-                                        }
-                                    }
-                                }
-                                
-                                // Extract prize breakdown
-                                const prizeItems = [];
-                                const liElements = prizesSection.querySelectorAll('li');
-                                
-                                liElements.forEach(li => {
-                                    const text = li.textContent.trim();
-                                    // Look for patterns like "First Prize: $X,XXX"
-                                    const prizeMatch = text.match(/(First|Second|Third|Fourth|Fifth|\\d+(?:st|nd|rd|th))[^:]*:\\s*\\$(\\d[\\d,]*(?:\\.\\d+)?)/i);
-                                    if (prizeMatch) {
-                                        prizeItems.push({
-                                            rank: prizeMatch[1].trim(),
-                                            amount: '$' + prizeMatch[2]
-                                        });
-                                    }
-                                });
-                                
-                                if (prizeItems.length > 0) {
-                                    data.prize_breakdown = prizeItems;
-                                }
-                            }
-                        } catch (e) {
-                            console.error('Error extracting prizes:', e);
-                        }
-                        
-                        return data;
-                    }""")
-                    
-                    # Update with prize data
-                    competition_details.update(prize_data)
+                section_results = await section_page.evaluate(SECTION_EXTRACTOR_SCRIPT, [section_name])
+                return section_results[section_name]['data']
             
             except Exception as section_error:
                 print(f"Error processing section {section_name}: {section_error}")
+            
+            return {}
+        
+        # Most overview sections are already in the main page's DOM; read those
+        # in place and only navigate to the ones that are missing
+        main_sections = await page.evaluate(SECTION_EXTRACTOR_SCRIPT, list(OVERVIEW_SECTIONS))
+        # Sections whose fields the listing API already supplied don't need a navigation either
+        api_sections = {name for name, fields in API_SECTION_FIELDS.items()
+                        if all(api_details.get(field) for field in fields)}
+        missing_sections = {name: f"{url}/overview/{name}" for name in OVERVIEW_SECTIONS
+                            if not main_sections[name]['found'] and name not in api_sections}
+        
+        section_pages = [page] + [await page.context.new_page() for _ in range(len(missing_sections) - 1)]
+        try:
+            visited_sections = await asyncio.gather(*(
+                visit_section(section_page, section_name, section_url)
+                for section_page, (section_name, section_url) in zip(section_pages, missing_sections.items())
+            ))
+        finally:
+            for section_page in section_pages[1:]:
+                await section_page.close()
+        visited_sections = dict(zip(missing_sections, visited_sections))
+        section_results = [
+            visited_sections[name] if name in visited_sections else main_sections[name]['data']
+            for name in OVERVIEW_SECTIONS
+        ]
+        
+        # Merge in section order so the result doesn't depend on which page finished first
+        for section_data in section_results:
+            competition_details.update(section_data)
         
         # Preserve logo_url from the listing page if we have it
         # If we don't have a logo_url from the listing, but found one on the detail page,
         # use the detail page version
-        if 'detail_page_logo_url' in main_page_info and not competition_details.get('logo_url'):
-            competition_details['logo_url'] = main_page_info['detail_page_logo_url']
-            del competition_details['detail_page_logo_url']
-        elif 'detail_page_logo_url' in main_page_info:
-            # We already have a logo from the listing, remove the duplicate
-            del competition_details['detail_page_logo_url']
+        detail_page_logo_url = competition_details.pop('detail_page_logo_url', None)
+        if detail_page_logo_url and not competition_details.get('logo_url'):
+            competition_details['logo_url'] = detail_page_logo_url
         
         # Ensure required fields are present
         if not competition_details.get('title'):
             competition_details['title'] = competition_id
         
-        if not competition_details.get('start_date'):
-            competition_details['start_date'] = 'Unknown'
-        
-        if not competition_details.get('end_date'):
-            competition_details['end_date'] = 'Unknown'
-        
-        if not competition_details.get('prize_pool'):
-            competition_details['prize_pool'] = 'See competition details'
+        for field, default in DETAIL_FIELD_DEFAULTS.items():
+            if not competition_details.get(field):
+                competition_details[field] = default
         
         # URL is always known
         competition_details['url'] = url
@@ -1613,29 +1666,26 @@ async def extract_competition_details(page, url, listing_data=None):
         
         # Upload images to Cloudinary if enabled
         if CLOUDINARY_ENABLED:
-            # Upload logo image if available
-            if competition_details.get('logo_url'):
-                competition_details['logo_url'] = await upload_image_to_cloudinary(
-                    competition_details['logo_url'],
-                    competition_id,
-                    'logo'
-                )
-            
-            # Upload banner image if available
-            if competition_details.get('banner_url'):
-                competition_details['banner_url'] = await upload_image_to_cloudinary(
-                    competition_details['banner_url'],
+            # Logo, banner and organizer logo are independent, so upload them concurrently
+            image_fields = [
+                field for field in ('logo_url', 'banner_url', 'organizer_logo_url')
+                if competition_details.get(field)
+            ]
+            upload_results = await asyncio.gather(*(
+                upload_image_to_cloudinary(
+                    competition_details[field],
                     competition_id,
-                    'banner'
-                )
-            
-            # Upload organizer logo if available
-            if competition_details.get('organizer_logo_url'):
-                competition_details['organizer_logo_url'] = await upload_image_to_cloudinary(
-                    competition_details['organizer_logo_url'],
-                    competition_id,
-                    'organizer_logo'
+                    field[:-len('_url')]
                 )
+                for field in image_fields
+            ), return_exceptions=True)
+            for field, cloudinary_url in zip(image_fields, upload_results):
+                if isinstance(cloudinary_url, Exception):
+                    print(f"Error uploading {field} for {competition_id}: {cloudinary_url}")
+                else:
+                    competition_details[field] = cloudinary_url
+        
+        save_cached_competition(competition_id, competition_details)
         
         print(f"Extracted details for: {competition_details.get('title', 'Unknown competition')}")
         return competition_details
@@ -1655,60 +1705,240 @@ async def extract_competition_details(page, url, listing_data=None):
 
 def is_complete_competition(competition: Dict[str, Any], required_fields: List[str]) -> bool:
     """Check if a competition has all required fields."""
-    for field in required_fields:
-        if field not in competition or not competition[field]:
-            return False
-    return True
+    return all(competition.get(field) for field in required_fields)
+
+def iter_competitions_jsonl(filename: str) -> Iterator[Dict[str, Any]]:
+    """Yield the competitions stored in a JSON Lines file one at a time."""
+    with open(filename, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+def save_competitions_to_csv(competitions: Iterable[Dict[str, Any]], filename: str,
+                             fieldnames: Optional[Set[str]] = None) -> None:
+    """Save competitions to a CSV file.
+    
+    competitions may be a one-shot iterator when fieldnames is given, so
+    records streamed from disk are written without being loaded all at once.
+    """
+    if fieldnames is None:
+        competitions = list(competitions)
+        if not competitions:
+            print("No competitions to save")
+            return
+        
+        # Collect all fields from all competitions
+        fieldnames = set()
+        for competition in competitions:
+            fieldnames.update(competition.keys())
+    
+    # Ensure the logo_url field exists
+    fieldnames = set(fieldnames) | {'logo_url'}
+    
+    # Required fields come first, then the remaining fields alphabetically
+    ordered_fieldnames = [field for field in REQUIRED_FIELDS if field in fieldnames]
+    ordered_fieldnames.extend(sorted(fieldnames.difference(REQUIRED_FIELDS)))
+    
+    # Write to CSV, one row at a time, building each row as a list in header order
+    saved_count = 0
+    with_logos = 0
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(ordered_fieldnames)
+        for competition in competitions:
+            row = []
+            for field in ordered_fieldnames:
+                value = competition.get(field, "")
+                # Convert any dict/list fields to JSON strings for CSV compatibility
+                if isinstance(value, (dict, list)):
+                    value = orjson.dumps(value).decode("utf-8")
+                row.append(value)
+            writer.writerow(row)
+            saved_count += 1
+            if competition.get('logo_url'):
+                with_logos += 1
+    
+    print(f"Saved {saved_count} competitions to '{filename}'")
+    
+    # Print statistics about logo URLs
+    print(f"Competitions with logo URLs: {with_logos}/{saved_count}")
+
+class PagePool:
+    """A fixed set of pages from one browser context, lent out one caller at a time.
+    
+    The pages live as long as the context, so callers never pay for opening a
+    new page or context per competition.
+    """
+    
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.free_pages = asyncio.Queue()
+        for page in self.pages:
+            self.free_pages.put_nowait(page)
+    
+    async def acquire(self):
+        """Wait for a free page and take it."""
+        return await self.free_pages.get()
+    
+    def release(self, page):
+        """Return a page to the pool."""
+        self.free_pages.put_nowait(page)
+
+async def block_listing_resources(route):
+    """Abort requests for resources the listing scans never look at."""
+    if route.request.resource_type in LISTING_BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def block_detail_resources(route):
+    """Abort third-party assets and analytics pings; Kaggle's own requests pass."""
+    request = route.request
+    host = urlsplit(request.url).hostname or ""
+    if host.endswith(DETAIL_BLOCKED_HOSTS) or (
+        request.resource_type in DETAIL_BLOCKED_RESOURCES and not host.endswith("kaggle.com")
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Competition fields harvested from the listing API, keyed by canonical competition URL
+listing_api_data = {}
+
+def format_api_date(value):
+    """Turn an API timestamp such as '2025-03-15T23:59:00Z' into 'March 15, 2025'."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%B %d, %Y")
+    except (AttributeError, ValueError):
+        return None
 
-def save_competitions_to_csv(competitions: List[Dict[str, Any]], filename: str) -> None:
-    """Save competitions to a CSV file."""
-    if not competitions:
-        print("No competitions to save")
+def format_api_reward(reward):
+    """Turn the API reward into the same text the prizes section yields."""
+    if isinstance(reward, dict):
+        quantity = reward.get("quantity")
+        if isinstance(quantity, (int, float)) and quantity > 0 and reward.get("type", "USD") == "USD":
+            return f"${quantity:,.0f}"
+        return None
+    if isinstance(reward, str) and reward.strip():
+        return reward.strip()
+    return None
+
+async def capture_listing_api_response(response):
+    """Remember dates and rewards from the listing API so section pages can be skipped."""
+    if LISTING_API_MARKER not in response.url or not response.ok:
+        return
+    try:
+        payload = orjson.loads(await response.body())
+    except (PlaywrightError, ValueError):
         return
     
-    # Prepare data for CSV
-    cleaned_competitions = []
-    for competition in competitions:
-        # Convert any dict/list fields to JSON strings for CSV compatibility
-        cleaned_competition = {}
-        for key, value in competition.items():
-            if isinstance(value, (dict, list)):
-                cleaned_competition[key] = json.dumps(value)
-            else:
-                cleaned_competition[key] = value
-                
-        # Ensure the logo_url field exists
-        if 'logo_url' not in cleaned_competition:
-            cleaned_competition['logo_url'] = ""
-            
-        cleaned_competitions.append(cleaned_competition)
+    for item in payload.get("competitions", []) if isinstance(payload, dict) else []:
+        slug = item.get("competitionName") or slug_from_url(item.get("competitionUrl") or "")
+        if not slug:
+            continue
+        fields = {
+            "title": item.get("title"),
+            "start_date": format_api_date(item.get("enabledDate") or item.get("dateEnabled")),
+            "end_date": format_api_date(item.get("deadline")),
+            "prize_pool": format_api_reward(item.get("reward")),
+        }
+        listing_api_data[f"{BASE_URL}/{slug}"] = {key: value for key, value in fields.items() if value}
+
+async def crawl_listing_pages(context, page_urls, concurrency=LISTING_CONCURRENCY, on_page_ready=None):
+    """Crawl listing pages with a pool of pages fed from a shared queue.
     
-    # Collect all fields from all competitions
-    fieldnames = set()
-    for competition in cleaned_competitions:
-        fieldnames.update(competition.keys())
+    Returns (page_links, page_data_array) tuples in page order, stopping at the
+    first page that had no competitions, like sequential pagination would.
     
-    # Ensure required fields are at the beginning
-    ordered_fieldnames = []
-    for field in REQUIRED_FIELDS:
-        if field in fieldnames:
-            ordered_fieldnames.append(field)
-            fieldnames.remove(field)
+    If given, on_page_ready(page_links, page_data_array) is called for each of
+    those pages in the same order as soon as it and every earlier page are done,
+    so callers can start on the first pages while later ones are still loading.
+    """
+    queue = asyncio.Queue()
+    for page_num, page_url in enumerate(page_urls, start=1):
+        queue.put_nowait((page_num, page_url))
     
-    # Add remaining fields
-    ordered_fieldnames.extend(sorted(fieldnames))
+    results = {}
+    settled_pages = set()
+    next_ready_page = 1
+    last_page = len(page_urls)
+    found = 0
     
-    # Write to CSV
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=ordered_fieldnames)
-        writer.writeheader()
-        writer.writerows(cleaned_competitions)
+    def hand_over_ready_pages():
+        nonlocal next_ready_page
+        while next_ready_page <= last_page and next_ready_page in settled_pages:
+            if next_ready_page in results and on_page_ready is not None:
+                on_page_ready(*results[next_ready_page])
+            next_ready_page += 1
     
-    print(f"Saved {len(competitions)} competitions to '{filename}'")
+    async def worker(page):
+        nonlocal last_page, found
+        while not queue.empty():
+            page_num, page_url = queue.get_nowait()
+            
+            # Another worker already found the end of the listing
+            if page_num > last_page:
+                continue
+            
+            print(f"\nProcessing page {page_num}: {page_url}")
+            
+            try:
+                # Navigate to the competitions page; extract_competition_links
+                # waits for the cards themselves
+                await page.goto(page_url, wait_until="domcontentloaded")
+            except PlaywrightError as e:
+                # Skip slow or failed pages (timeouts, net::ERR_*, aborted
+                # navigations) instead of stalling or aborting the whole pool
+                print(f"Error loading page {page_num}, skipping it: {e}")
+                settled_pages.add(page_num)
+                hand_over_ready_pages()
+                continue
+            
+            # Take a screenshot of each page
+            if DEBUG_MODE:
+                await take_screenshot(page, f"competition_page_{page_num}.png")
+            
+            # Extract competition links and listing data
+            page_links, page_data_array = await extract_competition_links(page)
+            results[page_num] = (page_links, page_data_array)
+            settled_pages.add(page_num)
+            
+            # Check if we found any competitions on this page
+            if len(page_links) == 0:
+                print(f"No competitions found on page {page_num}, stopping pagination")
+                last_page = min(last_page, page_num)
+                hand_over_ready_pages()
+                continue
+            
+            found += len(page_links)
+            print(f"Found {len(page_links)} competitions on page {page_num}")
+            
+            # Check if we've reached our max competitions
+            if found >= MAX_COMPETITIONS:
+                print(f"Reached maximum number of competitions ({MAX_COMPETITIONS})")
+                last_page = min(last_page, page_num)
+            
+            hand_over_ready_pages()
+            if page_num >= last_page:
+                continue
+            
+            # Small delay between pages
+            await smart_wait()
     
-    # Print statistics about logo URLs
-    with_logos = sum(1 for comp in cleaned_competitions if comp.get('logo_url'))
-    print(f"Competitions with logo URLs: {with_logos}/{len(cleaned_competitions)}")
+    pages = []
+    try:
+        for _ in range(max(1, min(concurrency, len(page_urls)))):
+            listing_page = await context.new_page()
+            listing_page.set_default_navigation_timeout(LISTING_NAVIGATION_TIMEOUT)
+            await listing_page.route("**/*", block_listing_resources)
+            pages.append(listing_page)
+        
+        await asyncio.gather(*(worker(listing_page) for listing_page in pages))
+    finally:
+        for listing_page in pages:
+            await listing_page.close()
+    
+    return [results[page_num] for page_num in sorted(results) if page_num <= last_page]
 
 async def crawl_kaggle_competitions():
     """Main function to crawl Kaggle competitions."""
@@ -1719,145 +1949,176 @@ async def crawl_kaggle_competitions():
         browser = await p.chromium.launch(headless=not DEBUG_MODE)
         context = await browser.new_context(
             viewport={'width': 1280, 'height': 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            # Reuse the previous run's cookies to skip consent and bot-check redirects
+            storage_state=STORAGE_STATE_FILE if os.path.exists(STORAGE_STATE_FILE) else None,
+            # Service workers would bypass the context's request routing
+            service_workers="block"
         )
         
         # Set default timeout
         context.set_default_timeout(60000)  # 60 seconds
         
-        page = await context.new_page()
+        # Make the shared link extractor available on every page of the context
+        await context.add_init_script(COMPETITION_LINKS_INIT_SCRIPT)
+        
+        # Context-wide blocking; listing pages add their own stricter route,
+        # which takes precedence over this one
+        await context.route("**/*", block_detail_resources)
+        
+        # Collect structured competition data from the listing's own API calls
+        context.on("response", capture_listing_api_response)
+        
+        # Detail worker pages; the listing crawl manages its own pages
+        pages = []
+        detail_tasks = []
         all_competition_links = []
+        seen_links = set()
         all_listing_data = {}
         
         try:
-            # Process each page of results
-            for page_num in range(1, MAX_PAGES + 1):
-                # Construct URL with page parameter (page=1 is implicit in the base URL)
-                page_param = f"&page={page_num}" if page_num > 1 else ""
-                page_url = f"{BASE_URL}{DEFAULT_PARAMS}{page_param}"
-                
-                print(f"\nProcessing page {page_num}: {page_url}")
-                
-                # Navigate to the competitions page
-                await page.goto(page_url, wait_until="domcontentloaded")
-                await page.wait_for_load_state("networkidle")
-                
-                # Take a screenshot of each page
-                if DEBUG_MODE:
-                    await take_screenshot(page, f"competition_page_{page_num}.png")
-                
-                # Extract competition links and listing data
-                page_links, page_data_array = await extract_competition_links(page)
-                
-                # Convert listing_data_array to dict for this page
-                page_data = {item["url"]: item for item in page_data_array if "url" in item}
-                
-                # Check if we found any competitions on this page
-                if len(page_links) == 0:
-                    print(f"No competitions found on page {page_num}, stopping pagination")
-                    break
-                
-                # Add these links to our collection
-                all_competition_links.extend(page_links)
-                all_listing_data.update(page_data)
-                
-                print(f"Found {len(page_links)} competitions on page {page_num}")
-                print(f"Total competitions found so far: {len(all_competition_links)}")
-                
-                # Check if we've reached our max competitions
-                if len(all_competition_links) >= MAX_COMPETITIONS:
-                    print(f"Reached maximum number of competitions ({MAX_COMPETITIONS})")
-                    break
-                
-                # Small delay between pages
-                await smart_wait()
+            # Build every listing URL up front (page=1 is implicit in the base URL)
+            page_urls = [
+                f"{BASE_URL}{DEFAULT_PARAMS}" + (f"&page={page_num}" if page_num > 1 else "")
+                for page_num in range(1, MAX_PAGES + 1)
+            ]
+            
+            # One independent page per detail worker in the shared context. They
+            # are opened up front so details are fetched while later listing
+            # pages are still loading
+            for _ in range(DETAIL_CONCURRENCY):
+                pages.append(await context.new_page())
+            
+            # Each competition takes a free page from the pool as soon as one is
+            # released, instead of waiting for the slowest page of a fixed batch
+            page_pool = PagePool(pages)
+            
+            # Output filenames share the run timestamp baked into OUTPUT_CSV
+            filename = OUTPUT_CSV
+            output_stem = filename[:-len('.csv')]
+            jsonl_filename = f"{output_stem}.jsonl"
+            
+            # Each competition is appended to a JSON Lines file as soon as it is
+            # extracted, so progress survives a crash and results are not held in memory
+            fieldnames = set()
+            extracted_count = 0
+            complete_count = 0
+            missing_counts = dict.fromkeys(REQUIRED_FIELDS, 0)
             
-            # Limit the total number of competitions if needed
-            if MAX_COMPETITIONS and len(all_competition_links) > MAX_COMPETITIONS:
-                print(f"Limiting to {MAX_COMPETITIONS} competitions out of {len(all_competition_links)}")
-                all_competition_links = all_competition_links[:MAX_COMPETITIONS]
+            with open(jsonl_filename, 'wb') as jsonl_file:
+                def record_competition(competition):
+                    nonlocal extracted_count, complete_count
+                    jsonl_file.write(orjson.dumps(competition))
+                    jsonl_file.write(b"\n")
+                    jsonl_file.flush()
+                    fieldnames.update(competition.keys())
+                    extracted_count += 1
+                    # One pass over the required fields feeds both summary counts
+                    missing_fields = [field for field in REQUIRED_FIELDS if not competition.get(field)]
+                    if not missing_fields:
+                        complete_count += 1
+                    for field in missing_fields:
+                        missing_counts[field] += 1
+                
+                async def fetch_details(url):
+                    competition_page = await page_pool.acquire()
+                    try:
+                        competition = await extract_competition_details(competition_page, url, all_listing_data)
+                    finally:
+                        # Small per-page delay to avoid rate limiting
+                        await smart_wait()
+                        page_pool.release(competition_page)
+                    if competition:  # If not None
+                        record_competition(competition)
+                
+                def queue_listing_page(page_links, page_data_array):
+                    # Convert listing_data_array to dict for this page
+                    all_listing_data.update(
+                        (item["url"], item) for item in page_data_array if "url" in item
+                    )
+                    
+                    # Start fetching details for new links right away, skipping
+                    # competitions that shifted onto a later page while we were crawling
+                    for link in page_links:
+                        if link in seen_links:
+                            continue
+                        # Limit the total number of competitions if needed
+                        if MAX_COMPETITIONS and len(all_competition_links) >= MAX_COMPETITIONS:
+                            print(f"Limiting to {MAX_COMPETITIONS} competitions")
+                            return
+                        seen_links.add(link)
+                        all_competition_links.append(link)
+                        detail_tasks.append(asyncio.create_task(fetch_details(link)))
+                
+                # Crawl the listing pages concurrently on the shared browser,
+                # handing each page's competitions to the detail workers in page order
+                await crawl_listing_pages(context, page_urls, on_page_ready=queue_listing_page)
+                
+                print(f"Total competitions found: {len(all_competition_links)}")
+                if all_competition_links:
+                    print(f"\nProcessing {len(all_competition_links)} competitions...")
+                
+                results = await asyncio.gather(*detail_tasks, return_exceptions=True)
             
             # Check if we found any competitions
             if not all_competition_links:
                 print("No competition links found. Exiting.")
+                os.remove(jsonl_filename)
                 return
             
-            # Process each competition in parallel
-            print(f"\nProcessing {len(all_competition_links)} competitions...")
-            
-            # Create a pool of pages for parallel processing
-            concurrency = min(5, len(all_competition_links))
-            # Ensure concurrency is at least 1 to avoid division by zero
-            concurrency = max(1, concurrency)
+            # Report failures
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Error during extraction: {result}")
             
-            pages = [page]  # Reuse the initial page
-            
-            for _ in range(concurrency - 1):
-                pages.append(await context.new_page())
-            
-            # Process competitions in batches
-            all_competitions = []
-            for i in range(0, len(all_competition_links), concurrency):
-                batch = all_competition_links[i:i+concurrency]
-                tasks = []
-                
-                for j, url in enumerate(batch):
-                    # Use the appropriate page from the pool
-                    competition_page = pages[j % len(pages)]
-                    
-                    # Create the task with appropriate listing data
-                    tasks.append(extract_competition_details(competition_page, url, all_listing_data))
-                
-                # Wait for all tasks in this batch to complete
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        print(f"Error during extraction: {result}")
-                    elif result:  # If not None
-                        all_competitions.append(result)
-                
-                print(f"Processed batch {i//concurrency + 1}, total competitions so far: {len(all_competitions)}")
-                
-                # Add a small delay between batches to avoid rate limiting
-                await smart_wait(2, 4)
+            print(f"Processed {len(all_competition_links)} competitions, extracted {extracted_count}")
             
             # Save results to CSV
-            if all_competitions:
-                # Generate timestamp for the filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"kaggle_competitions_{timestamp}.csv"
-                
-                # Save to CSV
-                save_competitions_to_csv(all_competitions, filename)
+            if extracted_count:
+                # Stream the records back from the JSON Lines file
+                save_competitions_to_csv(iter_competitions_jsonl(jsonl_filename), filename, fieldnames)
                 
                 # Also save as JSON for easier inspection
-                json_filename = filename.replace('.csv', '.json')
-                with open(json_filename, 'w', encoding='utf-8') as f:
-                    json.dump(all_competitions, f, indent=2)
+                json_filename = f"{output_stem}.json"
+                with open(json_filename, 'wb') as f:
+                    f.write(b"[\n")
+                    for index, competition in enumerate(iter_competitions_jsonl(jsonl_filename)):
+                        if index:
+                            f.write(b",\n")
+                        f.write(orjson.dumps(competition, option=orjson.OPT_INDENT_2))
+                    f.write(b"\n]\n")
                 
                 # Print summary of complete vs incomplete competitions
-                complete_competitions = [c for c in all_competitions if is_complete_competition(c, REQUIRED_FIELDS)]
-                print(f"Complete competitions: {len(complete_competitions)}/{len(all_competitions)}")
+                print(f"Complete competitions: {complete_count}/{extracted_count}")
                 
                 for field in REQUIRED_FIELDS:
-                    missing_field = sum(1 for c in all_competitions if field not in c or not c[field])
-                    print(f"Competitions missing {field}: {missing_field}")
+                    print(f"Competitions missing {field}: {missing_counts[field]}")
             else:
                 print("No competitions were found.")
                 
         except Exception as e:
             print(f"Error during crawling: {e}")
             traceback.print_exc()
-            if DEBUG_MODE:
-                await take_screenshot(page, "error_state.png")
+            if DEBUG_MODE and pages:
+                await take_screenshot(pages[0], "error_state.png")
             
         finally:
+            # Stop detail fetches still running after a failure
+            for task in detail_tasks:
+                task.cancel()
+            
+            # Save cookies and local storage for the next run
+            try:
+                os.makedirs(os.path.dirname(STORAGE_STATE_FILE) or ".", exist_ok=True)
+                await context.storage_state(path=STORAGE_STATE_FILE)
+            except (PlaywrightError, OSError) as e:
+                print(f"Error saving browser storage state: {e}")
+            
             # Close browser
-            for p in pages[1:]:  # Close additional pages
-                await p.close()
+            for worker_page in pages:
+                await worker_page.close()
             await browser.close()
+            await close_session()
 
 if __name__ == "__main__":
     asyncio.run(crawl_kaggle_competitions())
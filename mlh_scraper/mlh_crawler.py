@@ -1,13 +1,15 @@
 import asyncio
 import csv
+import hashlib
 import json
 import os
 import time
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright, Error as PlaywrightError
-import pandas as pd
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set
+from pathlib import Path
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 from dotenv import load_dotenv
 import traceback
 
@@ -20,37 +22,87 @@ OUTPUT_CSV = f"mlh_hackathons_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 REQUIRED_FIELDS = ["title", "start_date", "end_date", "mode", "location"]
 MAX_HACKATHONS = 100
 DEBUG_MODE = True
-MAX_RETRIES = 3
-MIN_RATE_LIMIT_DELAY = 1
-MAX_RATE_LIMIT_DELAY = 3
+DETAIL_CONCURRENCY = 5  # Number of hackathon detail pages scraped at the same time
+REQUESTS_PER_SECOND = 2  # Sustained rate of event page navigations to any one host
+RATE_LIMIT_PAUSE = 10  # Seconds to hold all navigations after a 429 without Retry-After
+SERVER_ERROR_STATUSES = {502, 503, 504}  # Gateway errors worth a single reload of the event page
+SERVER_ERROR_RELOAD_DELAY = 5  # Seconds to wait before reloading after a gateway error
+NAVIGATION_TIMEOUT = 15000  # Milliseconds allowed for a page to reach domcontentloaded
+# MLH pages keep analytics connections open, so wait for the elements the
+# extractors read instead of for the network to go idle
+LISTING_READY_SELECTOR = '.event'
+DETAIL_READY_SELECTOR = 'h1, .event-title'
+READY_TIMEOUT = 8000  # Milliseconds to wait for the ready selector before extracting anyway
+EXTRACT_TIMEOUT = 5  # Seconds an extractor script may run before the page is given up on
+# The events listing is server-rendered: the extractor only reads text, meta tags
+# and img.src from the HTML document, so everything the page would load on top of
+# it (images, styles, and scripts plus the requests they make) is skipped
+LISTING_BLOCKED_RESOURCES = {"image", "font", "media", "stylesheet", "script", "xhr", "fetch"}
+# Event pages keep images and styles because the banner fallback relies on rendered image sizes
+DETAIL_BLOCKED_RESOURCES = {"font", "media"}
+TRACKER_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "facebook.net", "facebook.com", "hotjar.com")
+BROWSER_ARGS = ["--disable-dev-shm-usage", "--disable-gpu"]  # Keep Chromium stable in containers
+CONTEXT_OPTIONS = {
+    "viewport": {'width': 1280, 'height': 800},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
 
 # Create directories for debugging
 os.makedirs("screenshots", exist_ok=True)
 os.makedirs("debug", exist_ok=True)
 
+# Extracted event details from earlier runs, one JSON file per event URL
+HACKATHON_CACHE_DIR = Path("cache/mlh")
+HACKATHON_CACHE_TTL = 24 * 60 * 60  # Seconds before a cached upcoming event is scraped again
+HACKATHON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
 # Get current date for reference only
 CURRENT_DATE = datetime.now()
+NOW_TS = int(CURRENT_DATE.timestamp())  # Compared against the end_ts epoch seconds extracted in the browser
 print(f"Current date: {CURRENT_DATE}")
 
-def is_upcoming_event(end_date_str):
-    """Check if an event is upcoming based on its end date."""
+# Date formats tried in order when checking whether an event is upcoming
+DATE_FORMATS = (
+    "%B %d, %Y",       # March 15, 2025
+    "%b %d, %Y",       # Mar 15, 2025
+    "%d %B %Y",        # 15 March 2025
+    "%d %b %Y",        # 15 Mar 2025
+    "%m/%d/%Y"         # 03/15/2025
+)
+YEAR_RE = re.compile(r'20\d\d')
+PAST_YEARS = {2023, 2024}  # Years that mark a date as past wherever they appear in it
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:$|T)')
+
+def is_upcoming_event(end_date_str, end_ts=0):
+    """Check if an event is upcoming based on its end date.
+    
+    end_ts is the end date in epoch seconds when the page provided one; the
+    string is only parsed for events without it.
+    """
+    if end_ts:
+        return end_ts >= NOW_TS
+    
     if not end_date_str or end_date_str == 'See event website':
         # If no valid end date, we need to be more permissive to avoid filtering out valid events
         print(f"No specific end date: '{end_date_str}' - marking as upcoming by default")
         return True
         
     try:
+        # ISO dates (2025-03-15) go through the C-implemented fromisoformat,
+        # skipping the strptime loop and its ValueError per miss
+        if ISO_DATE_RE.match(end_date_str):
+            try:
+                end_date = datetime.fromisoformat(end_date_str[:10])
+            except ValueError:
+                # Out-of-range values like 2025-13-45 fall through to the other checks
+                pass
+            else:
+                is_upcoming = end_date >= CURRENT_DATE
+                print(f"Successfully parsed date '{end_date_str}' as {end_date}, upcoming: {is_upcoming}")
+                return is_upcoming
+        
         # Try various date formats
-        date_formats = [
-            "%B %d, %Y",       # March 15, 2025
-            "%b %d, %Y",       # Mar 15, 2025
-            "%d %B %Y",        # 15 March 2025
-            "%d %b %Y",        # 15 Mar 2025
-            "%Y-%m-%d",        # 2025-03-15
-            "%m/%d/%Y"         # 03/15/2025
-        ]
-        
-        for date_format in date_formats:
+        for date_format in DATE_FORMATS:
             try:
                 end_date = datetime.strptime(end_date_str, date_format)
                 # Event is upcoming if end date is in the future
@@ -62,10 +114,11 @@ def is_upcoming_event(end_date_str):
                 
         # If we've tried all formats and couldn't parse the date
         # Check if the string contains a year that's this year or later
+        # One scan collects every year in the string for both checks below
         current_year = CURRENT_DATE.year
-        year_match = re.search(r'20\d\d', end_date_str)
-        if year_match:
-            year = int(year_match.group(0))
+        years = [int(year) for year in YEAR_RE.findall(end_date_str)]
+        if years:
+            year = years[0]
             if year < current_year:
                 print(f"Date '{end_date_str}' contains past year {year}, marking as not upcoming")
                 return False
@@ -74,7 +127,7 @@ def is_upcoming_event(end_date_str):
                 return True
                 
         # As a last resort, check if the string has year indicators
-        if '2023' in end_date_str or '2024' in end_date_str or 'last year' in end_date_str.lower():
+        if not PAST_YEARS.isdisjoint(years) or 'last year' in end_date_str.lower():
             print(f"Date '{end_date_str}' appears to be from a past year, marking as not upcoming")
             return False
             
@@ -84,33 +137,56 @@ def is_upcoming_event(end_date_str):
         print(f"Error parsing date '{end_date_str}': {e} - marking as not upcoming")
         return False  # Changed to be conservative
 
-async def smart_wait(min_delay=MIN_RATE_LIMIT_DELAY, max_delay=MAX_RATE_LIMIT_DELAY):
-    """Wait for a random amount of time to avoid rate limiting."""
-    import random
-    delay = random.uniform(min_delay, max_delay)
-    print(f"Waiting for {delay:.2f} seconds to avoid rate limiting...")
-    await asyncio.sleep(delay)
+def parse_event_date(date_str):
+    """Parse an event date in any of the known formats, or return None."""
+    if not date_str:
+        return None
+    if ISO_DATE_RE.match(date_str):
+        try:
+            return datetime.fromisoformat(date_str[:10])
+        except ValueError:
+            pass
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return None
+
+def hackathon_cache_path(url):
+    """Return the cache file for an event URL (MLH links point at each event's own site)."""
+    return HACKATHON_CACHE_DIR / f"{hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()}.json"
 
-async def retry_with_backoff(coroutine, max_retries=MAX_RETRIES, start_delay=5):
-    """Retry a coroutine with exponential backoff for rate limiting"""
-    retries = 0
-    delay = start_delay
+def load_cached_hackathon(url):
+    """Return cached details for an event, or None if missing or stale.
     
-    while retries < max_retries:
-        try:
-            return await coroutine
-        except PlaywrightError as e:
-            if "429" in str(e) or "Too Many Requests" in str(e) or "timeout" in str(e).lower():
-                retries += 1
-                if retries >= max_retries:
-                    print(f"Max retries ({max_retries}) reached, giving up.")
-                    raise
-                
-                wait_time = delay * (2 ** (retries - 1))  # Exponential backoff
-                print(f"Rate limited or timeout (attempt {retries}/{max_retries}). Waiting {wait_time} seconds...")
-                await asyncio.sleep(wait_time)
-            else:
-                raise
+    Ended events no longer change, so their cache entries never expire.
+    """
+    cache_path = hackathon_cache_path(url)
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            hackathon = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    end_ts = hackathon.get("end_ts")
+    if end_ts:
+        if end_ts < NOW_TS:
+            return hackathon
+    else:
+        end_date = parse_event_date(hackathon.get("end_date"))
+        if end_date and end_date < CURRENT_DATE:
+            return hackathon
+    return hackathon if age < HACKATHON_CACHE_TTL else None
+
+def save_cached_hackathon(url, hackathon):
+    """Store extracted details so the next run can skip this event."""
+    try:
+        with open(hackathon_cache_path(url), 'w', encoding='utf-8') as f:
+            json.dump(hackathon, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Error caching event {url}: {e}")
 
 async def take_screenshot(page, filename):
     """Take a screenshot for debugging purposes"""
@@ -120,367 +196,415 @@ async def take_screenshot(page, filename):
     except Exception as e:
         print(f"Error taking screenshot: {e}")
 
-async def extract_hackathon_links(page):
-    """Extract links to individual hackathon pages from the listing page."""
-    print(f"Extracting hackathon links from: {page.url}")
+# Listing extractor. Card extraction lives in one function that first runs over the
+# cards in the "Upcoming Events" section and, only if that finds nothing, over every
+# .event card on the page, so both passes share a single evaluate round trip.
+LISTING_EXTRACTOR_SCRIPT = """() => {
+    // Date format on MLH is typically "Apr 26th - 27th"
+    const DATE_RANGE_RE = /([A-Za-z]{3,}) (\\d{1,2})(?:st|nd|rd|th)? *- *(\\d{1,2})(?:st|nd|rd|th)?/i;
+    const DATE_FORMAT = {month: 'long', day: 'numeric', year: 'numeric'};
+    const currentYear = new Date().getFullYear();
     
-    # Take a screenshot for debugging
-    if DEBUG_MODE:
-        await take_screenshot(page, "mlh_listing.png")
+    function extractCard(eventCard) {
+        // Extract title
+        let title = '';
+        const titleElement = eventCard.querySelector('.event-name');
+        if (titleElement) {
+            title = titleElement.textContent.trim();
+        }
         
-        # Save HTML for debugging
-        html_content = await page.content()
-        with open("debug/mlh_listing.html", "w", encoding="utf-8") as f:
-            f.write(html_content)
-        print("Saved HTML content for debugging")
-    
-    try:
-        # Wait for the page to load completely
-        await page.wait_for_load_state("networkidle", timeout=30000)
+        // Extract URL
+        let url = '';
+        const linkElement = eventCard.querySelector('a.event-link');
+        if (linkElement) {
+            url = linkElement.href;
+        }
         
-        # Extract hackathon cards specifically from the "Upcoming Events" section
-        hackathon_data = await page.evaluate("""() => {
-            const hackathons = [];
-            
-            // Look for the "Upcoming Events" heading
-            const upcomingHeading = Array.from(document.querySelectorAll('h3')).find(
-                h => h.textContent.trim().includes('Upcoming Events')
-            );
-            
-            if (!upcomingHeading) {
-                console.log('Could not find "Upcoming Events" heading');
-                return hackathons;
-            }
-            
-            console.log('Found "Upcoming Events" heading');
-            
-            // Get all event cards that come after the "Upcoming Events" heading
-            // We'll collect all .event divs until we hit another h3 (which would be "Past Events")
-            let currentElement = upcomingHeading.nextElementSibling;
-            while (currentElement && !currentElement.matches('h3')) {
-                if (currentElement.classList.contains('event')) {
-                    try {
-                        // Extract the event data
-                        const eventCard = currentElement;
-                        
-                        // Extract title
-                        let title = '';
-                        const titleElement = eventCard.querySelector('.event-name');
-                        if (titleElement) {
-                            title = titleElement.textContent.trim();
-                        }
-                        
-                        // Extract URL
-                        let url = '';
-                        const linkElement = eventCard.querySelector('a.event-link');
-                        if (linkElement) {
-                            url = linkElement.href;
-                        }
-                        
-                        // Extract logo
-                        let logo_url = '';
-                        const logoElement = eventCard.querySelector('.event-logo img');
-                        if (logoElement && logoElement.src) {
-                            logo_url = logoElement.src;
-                        }
-                        
-                        // Extract banner/splash image
-                        let banner_url = '';
-                        const bannerElement = eventCard.querySelector('.image-wrap img');
-                        if (bannerElement && bannerElement.src) {
-                            banner_url = bannerElement.src;
-                        }
-                        
-                        // Extract dates from meta tags when available (most accurate)
-                        let start_date = '';
-                        let end_date = '';
-                        const startDateMeta = eventCard.querySelector('meta[itemprop="startDate"]');
-                        const endDateMeta = eventCard.querySelector('meta[itemprop="endDate"]');
-                        
-                        if (startDateMeta && startDateMeta.content) {
-                            // Convert ISO format to more readable format
-                            const startDate = new Date(startDateMeta.content);
-                            start_date = startDate.toLocaleDateString('en-US', {
-                                month: 'long',
-                                day: 'numeric',
-                                year: 'numeric'
-                            });
-                        }
-                        
-                        if (endDateMeta && endDateMeta.content) {
-                            const endDate = new Date(endDateMeta.content);
-                            end_date = endDate.toLocaleDateString('en-US', {
-                                month: 'long',
-                                day: 'numeric',
-                                year: 'numeric'
-                            });
-                        }
-                        
-                        // Fallback to text date if meta not available
-                        if (!start_date || !end_date) {
-                            const dateElement = eventCard.querySelector('.event-date');
-                            if (dateElement) {
-                                const dateText = dateElement.textContent.trim();
-                                
-                                // Try to parse the date text
-                                const monthNames = [
-                                    'January', 'February', 'March', 'April', 'May', 'June', 'July',
-                                    'August', 'September', 'October', 'November', 'December',
-                                    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'
-                                ];
-                                
-                                // Date format on MLH is typically "Apr 26th - 27th"
-                                const dateRegex = /([A-Za-z]{3,}) (\d{1,2})(?:st|nd|rd|th)? *- *(\d{1,2})(?:st|nd|rd|th)?/i;
-                                const match = dateText.match(dateRegex);
-                                
-                                if (match) {
-                                    const month = match[1];
-                                    const startDay = match[2];
-                                    const endDay = match[3];
-                                    const year = new Date().getFullYear(); // Default to current year if not specified
-                                    
-                                    if (!start_date) {
-                                        start_date = `${month} ${startDay}, ${year}`;
-                                    }
-                                    
-                                    if (!end_date) {
-                                        end_date = `${month} ${endDay}, ${year}`;
-                                    }
-                                } else {
-                                    // Just use the date text as is
-                                    if (!start_date && !end_date) {
-                                        start_date = dateText;
-                                        end_date = dateText;
-                                    }
-                                }
-                            }
-                        }
-                        
-                        // Extract location
-                        let location = '';
-                        let city = '';
-                        let state = '';
-                        const cityElement = eventCard.querySelector('[itemprop="city"]');
-                        const stateElement = eventCard.querySelector('[itemprop="state"]');
-                        
-                        if (cityElement) {
-                            city = cityElement.textContent.trim();
-                        }
-                        
-                        if (stateElement) {
-                            state = stateElement.textContent.trim();
-                        }
-                        
-                        if (city && state) {
-                            location = `${city}, ${state}`;
-                        } else if (city) {
-                            location = city;
-                        } else if (state) {
-                            location = state;
-                        }
-                        
-                        // Extract event mode (in-person, digital, hybrid)
-                        let mode = 'N/A';
-                        const modeElement = eventCard.querySelector('.event-hybrid-notes span');
-                        if (modeElement) {
-                            const modeText = modeElement.textContent.trim().toLowerCase();
-                            if (modeText.includes('in-person')) {
-                                mode = 'offline';
-                            } else if (modeText.includes('digital')) {
-                                mode = 'online';
-                            } else if (modeText.includes('hybrid')) {
-                                mode = 'hybrid';
-                            }
-                        }
-                        
-                        // Check for any special tags such as "HIGH SCHOOL" or "DIVERSITY"
-                        let tags = [];
-                        const ribbonElement = eventCard.querySelector('.ribbon');
-                        if (ribbonElement) {
-                            const ribbonText = ribbonElement.textContent.trim();
-                            if (ribbonText.includes('HIGH SCHOOL')) {
-                                tags.push('high school');
-                            }
-                            if (ribbonText.includes('DIVERSITY')) {
-                                tags.push('diversity');
-                            }
-                        }
-                        
-                        // Only add if we have at least a title or URL
-                        if (title || url) {
-                            hackathons.push({
-                                title,
-                                url,
-                                logo_url,
-                                banner_url,
-                                start_date,
-                                end_date,
-                                location,
-                                mode,
-                                tags: tags.join(', '),
-                                source_platform: 'mlh'
-                            });
-                        }
-                    } catch (e) {
-                        console.error('Error processing event card:', e);
+        // Only keep cards with at least a title or URL
+        if (!title && !url) {
+            return null;
+        }
+        
+        // Extract logo
+        let logo_url = '';
+        const logoElement = eventCard.querySelector('.event-logo img');
+        if (logoElement && logoElement.src) {
+            logo_url = logoElement.src;
+        }
+        
+        // Extract banner/splash image
+        let banner_url = '';
+        const bannerElement = eventCard.querySelector('.image-wrap img');
+        if (bannerElement && bannerElement.src) {
+            banner_url = bannerElement.src;
+        }
+        
+        // Extract dates from meta tags when available (most accurate)
+        let start_date = '';
+        let end_date = '';
+        const startDateMeta = eventCard.querySelector('meta[itemprop="startDate"]');
+        const endDateMeta = eventCard.querySelector('meta[itemprop="endDate"]');
+        
+        if (startDateMeta && startDateMeta.content) {
+            // Convert ISO format to more readable format
+            start_date = new Date(startDateMeta.content).toLocaleDateString('en-US', DATE_FORMAT);
+        }
+        
+        // Epoch seconds of the end date, so Python compares integers instead of parsing strings
+        let end_ts = 0;
+        if (endDateMeta && endDateMeta.content) {
+            const endDate = new Date(endDateMeta.content);
+            end_date = endDate.toLocaleDateString('en-US', DATE_FORMAT);
+            end_ts = endDate.getTime() / 1000 | 0;
+        }
+        
+        // Fallback to text date if meta not available
+        if (!start_date || !end_date) {
+            const dateElement = eventCard.querySelector('.event-date');
+            if (dateElement) {
+                const dateText = dateElement.textContent.trim();
+                
+                // Try to parse the date text
+                const match = dateText.match(DATE_RANGE_RE);
+                
+                if (match) {
+                    const month = match[1];
+                    const startDay = match[2];
+                    const endDay = match[3];
+                    const year = currentYear; // Default to current year if not specified
+                    
+                    if (!start_date) {
+                        start_date = `${month} ${startDay}, ${year}`;
                     }
+                    
+                    if (!end_date) {
+                        end_date = `${month} ${endDay}, ${year}`;
+                    }
+                } else if (!start_date && !end_date) {
+                    // Just use the date text as is
+                    start_date = dateText;
+                    end_date = dateText;
                 }
-                
-                // Move to the next element
-                currentElement = currentElement.nextElementSibling;
             }
-            
-            return hackathons;
-        }""")
+        }
         
-        if not hackathon_data:
-            print("No hackathon data found in the 'Upcoming Events' section. Trying alternate approach...")
-            
-            # If the targeted approach didn't work, try a more general approach to find event cards
-            hackathon_data = await page.evaluate("""() => {
-                const hackathons = [];
-                
-                // Get all event cards on the page
-                const eventCards = document.querySelectorAll('.event');
-                
-                eventCards.forEach(eventCard => {
-                    try {
-                        // Extract title
-                        let title = '';
-                        const titleElement = eventCard.querySelector('.event-name');
-                        if (titleElement) {
-                            title = titleElement.textContent.trim();
-                        }
-                        
-                        // Extract URL
-                        let url = '';
-                        const linkElement = eventCard.querySelector('a.event-link');
-                        if (linkElement) {
-                            url = linkElement.href;
-                        }
-                        
-                        // Extract logo
-                        let logo_url = '';
-                        const logoElement = eventCard.querySelector('.event-logo img');
-                        if (logoElement && logoElement.src) {
-                            logo_url = logoElement.src;
-                        }
-                        
-                        // Extract banner/splash image
-                        let banner_url = '';
-                        const bannerElement = eventCard.querySelector('.image-wrap img');
-                        if (bannerElement && bannerElement.src) {
-                            banner_url = bannerElement.src;
-                        }
-                        
-                        // Extract dates from meta tags when available
-                        let start_date = '';
-                        let end_date = '';
-                        const startDateMeta = eventCard.querySelector('meta[itemprop="startDate"]');
-                        const endDateMeta = eventCard.querySelector('meta[itemprop="endDate"]');
-                        
-                        if (startDateMeta && startDateMeta.content) {
-                            const startDate = new Date(startDateMeta.content);
-                            start_date = startDate.toLocaleDateString('en-US', {
-                                month: 'long',
-                                day: 'numeric',
-                                year: 'numeric'
-                            });
-                        }
-                        
-                        if (endDateMeta && endDateMeta.content) {
-                            const endDate = new Date(endDateMeta.content);
-                            end_date = endDate.toLocaleDateString('en-US', {
-                                month: 'long',
-                                day: 'numeric',
-                                year: 'numeric'
-                            });
-                        }
-                        
-                        // Fallback to text date
-                        if (!start_date || !end_date) {
-                            const dateElement = eventCard.querySelector('.event-date');
-                            if (dateElement) {
-                                const dateText = dateElement.textContent.trim();
-                                if (!start_date && !end_date) {
-                                    start_date = dateText;
-                                    end_date = dateText;
-                                }
-                            }
-                        }
-                        
-                        // Extract location
-                        let location = '';
-                        let city = '';
-                        let state = '';
-                        const cityElement = eventCard.querySelector('[itemprop="city"]');
-                        const stateElement = eventCard.querySelector('[itemprop="state"]');
-                        
-                        if (cityElement) {
-                            city = cityElement.textContent.trim();
-                        }
-                        
-                        if (stateElement) {
-                            state = stateElement.textContent.trim();
-                        }
-                        
-                        if (city && state) {
-                            location = `${city}, ${state}`;
-                        } else if (city) {
-                            location = city;
-                        } else if (state) {
-                            location = state;
-                        }
-                        
-                        // Extract event mode
-                        let mode = 'N/A';
-                        const modeElement = eventCard.querySelector('.event-hybrid-notes span');
-                        if (modeElement) {
-                            const modeText = modeElement.textContent.trim().toLowerCase();
-                            if (modeText.includes('in-person')) {
-                                mode = 'offline';
-                            } else if (modeText.includes('digital')) {
-                                mode = 'online';
-                            } else if (modeText.includes('hybrid')) {
-                                mode = 'hybrid';
-                            }
-                        }
-                        
-                        // Check for any special tags
-                        let tags = [];
-                        const ribbonElement = eventCard.querySelector('.ribbon');
-                        if (ribbonElement) {
-                            const ribbonText = ribbonElement.textContent.trim();
-                            if (ribbonText.includes('HIGH SCHOOL')) {
-                                tags.push('high school');
-                            }
-                            if (ribbonText.includes('DIVERSITY')) {
-                                tags.push('diversity');
-                            }
-                        }
-                        
-                        // Only add if we have at least a title or URL
-                        if (title || url) {
-                            hackathons.push({
-                                title,
-                                url,
-                                logo_url,
-                                banner_url,
-                                start_date,
-                                end_date,
-                                location,
-                                mode,
-                                tags: tags.join(', '),
-                                source_platform: 'mlh'
-                            });
-                        }
-                    } catch (e) {
-                        console.error('Error processing event card:', e);
+        // Extract location
+        let location = '';
+        let city = '';
+        let state = '';
+        const cityElement = eventCard.querySelector('[itemprop="city"]');
+        const stateElement = eventCard.querySelector('[itemprop="state"]');
+        
+        if (cityElement) {
+            city = cityElement.textContent.trim();
+        }
+        
+        if (stateElement) {
+            state = stateElement.textContent.trim();
+        }
+        
+        if (city && state) {
+            location = `${city}, ${state}`;
+        } else if (city) {
+            location = city;
+        } else if (state) {
+            location = state;
+        }
+        
+        // Extract event mode (in-person, digital, hybrid)
+        let mode = 'N/A';
+        const modeElement = eventCard.querySelector('.event-hybrid-notes span');
+        if (modeElement) {
+            const modeText = modeElement.textContent.trim().toLowerCase();
+            if (modeText.includes('in-person')) {
+                mode = 'offline';
+            } else if (modeText.includes('digital')) {
+                mode = 'online';
+            } else if (modeText.includes('hybrid')) {
+                mode = 'hybrid';
+            }
+        }
+        
+        // Check for any special tags such as "HIGH SCHOOL" or "DIVERSITY"
+        let tags = [];
+        const ribbonElement = eventCard.querySelector('.ribbon');
+        if (ribbonElement) {
+            const ribbonText = ribbonElement.textContent.trim();
+            if (ribbonText.includes('HIGH SCHOOL')) {
+                tags.push('high school');
+            }
+            if (ribbonText.includes('DIVERSITY')) {
+                tags.push('diversity');
+            }
+        }
+        
+        return {
+            title,
+            url,
+            logo_url,
+            banner_url,
+            start_date,
+            end_date,
+            end_ts,
+            location,
+            mode,
+            tags: tags.join(', '),
+            source_platform: 'mlh'
+        };
+    }
+    
+    function extractCards(eventCards) {
+        const hackathons = [];
+        for (const eventCard of eventCards) {
+            try {
+                const hackathon = extractCard(eventCard);
+                if (hackathon) {
+                    hackathons.push(hackathon);
+                }
+            } catch (e) {
+                console.error('Error processing event card:', e);
+            }
+        }
+        return hackathons;
+    }
+    
+    // Collect the .event cards that come after the "Upcoming Events" heading,
+    // up to the next h3 (which would be "Past Events")
+    const upcomingCards = [];
+    const upcomingHeading = Array.from(document.querySelectorAll('h3')).find(
+        h => h.textContent.trim().includes('Upcoming Events')
+    );
+    if (upcomingHeading) {
+        let currentElement = upcomingHeading.nextElementSibling;
+        while (currentElement && !currentElement.matches('h3')) {
+            if (currentElement.classList.contains('event')) {
+                upcomingCards.push(currentElement);
+            }
+            currentElement = currentElement.nextElementSibling;
+        }
+    }
+    
+    const upcoming = extractCards(upcomingCards);
+    if (upcoming.length > 0) {
+        return {scope: 'upcoming', hackathons: upcoming};
+    }
+    
+    // The targeted approach found nothing, so fall back to every event card on the page
+    return {scope: 'all', hackathons: extractCards(document.querySelectorAll('.event'))};
+}"""
+
+# Detail extractor, run once per event page
+DETAIL_EXTRACTOR_SCRIPT = """() => {
+    const data = {};
+
+    try {
+        // Title - try different selectors
+        const titleElement = document.querySelector('h1, .event-title, .title');
+        if (titleElement) {
+            data.title = titleElement.textContent.trim();
+        }
+
+        // Logo
+        const logoElement = document.querySelector('.event-logo, img[alt*="logo"], header img');
+        if (logoElement && logoElement.src) {
+            data.logo_url = logoElement.src;
+        }
+
+        // Banner image
+        const bannerElement = document.querySelector('.event-banner, .banner-image, .hero-image, header img[class*="banner"]');
+        if (bannerElement && bannerElement.src) {
+            data.banner_url = bannerElement.src;
+        } else if (!data.banner_url) {
+            // Try to find any large image that might be a banner
+            const images = document.querySelectorAll('img');
+            for (const img of images) {
+                if (img.width > 600 || img.height > 300) {
+                    data.banner_url = img.src;
+                    break;
+                }
+            }
+        }
+
+        // Dates - look for date information
+        const dateElement = document.querySelector('.event-date, .date, time, [datetime]');
+        if (dateElement) {
+            // Try to get directly from datetime attribute
+            const datetime = dateElement.getAttribute('datetime');
+            if (datetime) {
+                const date = new Date(datetime);
+                data.start_date = date.toLocaleDateString('en-US', {month: 'long', day: 'numeric', year: 'numeric'});
+            } else {
+                // Extract from text content
+                const dateText = dateElement.textContent.trim();
+                // Look for patterns in the text
+                const datePattern1 = /([A-Za-z]+)\\s+(\\d{1,2})\\s*-\\s*(\\d{1,2}),?\\s*(\\d{4})/i; // Month Day-Day, Year
+                const datePattern2 = /([A-Za-z]+)\\s+(\\d{1,2})\\s*-\\s*([A-Za-z]+)\\s+(\\d{1,2}),?\\s*(\\d{4})/i; // Month Day - Month Day, Year
+
+                const match1 = dateText.match(datePattern1);
+                const match2 = dateText.match(datePattern2);
+
+                if (match1) {
+                    const month = match1[1];
+                    const startDay = match1[2];
+                    const endDay = match1[3];
+                    const year = match1[4];
+
+                    data.start_date = `${month} ${startDay}, ${year}`;
+                    data.end_date = `${month} ${endDay}, ${year}`;
+                    data.end_ts = new Date(data.end_date).getTime() / 1000 | 0;
+                } else if (match2) {
+                    const startMonth = match2[1];
+                    const startDay = match2[2];
+                    const endMonth = match2[3];
+                    const endDay = match2[4];
+                    const year = match2[5];
+
+                    data.start_date = `${startMonth} ${startDay}, ${year}`;
+                    data.end_date = `${endMonth} ${endDay}, ${year}`;
+                    data.end_ts = new Date(data.end_date).getTime() / 1000 | 0;
+                }
+            }
+        }
+
+        // Location and mode
+        const locationElement = document.querySelector('.event-location, .location, [class*="location"]');
+        if (locationElement) {
+            data.location = locationElement.textContent.trim();
+
+            // Determine mode based on location text
+            const locationText = data.location.toLowerCase();
+            if (locationText.includes('online') || locationText.includes('virtual')) {
+                data.mode = 'online';
+            } else if (locationText.includes('hybrid')) {
+                data.mode = 'hybrid';
+            } else {
+                data.mode = 'offline';
+            }
+        }
+
+        // Description
+        const descriptionElement = document.querySelector('.event-description, .description, section p');
+        if (descriptionElement) {
+            data.description = descriptionElement.textContent.trim();
+        } else {
+            // Try to find any paragraph that might be a description
+            const paragraphs = document.querySelectorAll('main p, article p, section p');
+            if (paragraphs.length > 0) {
+                // Take the longest paragraph as the description
+                let longestText = '';
+                paragraphs.forEach(p => {
+                    const text = p.textContent.trim();
+                    if (text.length > longestText.length) {
+                        longestText = text;
                     }
                 });
-                
-                return hackathons;
-            }""")
+
+                if (longestText) {
+                    data.description = longestText;
+                }
+            }
+        }
+
+        // Check for registration link
+        const registrationElement = document.querySelector('a[href*="register"], a.register-button, a[class*="register"]');
+        if (registrationElement) {
+            data.registration_url = registrationElement.href;
+        }
+
+        // Organizer information
+        const organizerElement = document.querySelector('.organizer, .host, .university');
+        if (organizerElement) {
+            data.organizer = organizerElement.textContent.trim();
+        }
+
+        // Try to extract other useful information
+        // Prizes
+        const prizeElement = document.querySelector('[class*="prize"], [id*="prize"], h2:contains("Prize"), h3:contains("Prize")');
+        if (prizeElement) {
+            data.prize_pool = prizeElement.textContent.trim();
+        }
+
+        // Tags
+        const tagElements = document.querySelectorAll('.tag, .badge, [class*="tag"]');
+        if (tagElements.length > 0) {
+            data.tags = Array.from(tagElements).map(tag => tag.textContent.trim()).join(', ');
+        }
+    } catch (e) {
+        console.error('Error extracting event details:', e);
+    }
+
+    return data;
+}"""
+
+# Event pages get the detail extractor installed as a named function before any of
+# their own scripts run, so each extraction sends only a short call over CDP
+DETAIL_EXTRACTOR_INIT_SCRIPT = f"window.extractHackathonDetails = {DETAIL_EXTRACTOR_SCRIPT};"
+DETAIL_EXTRACTOR_CALL = "() => window.extractHackathonDetails()"
+
+# Last-resort link scan used when the listing extractor fails
+EVENT_LINKS_SCRIPT = """() => {
+    // Get all links on the page
+    return Array.from(document.querySelectorAll('a[href]'))
+        .map(a => a.href)
+        .filter(href => 
+            href.includes('mlh.io') && 
+            (href.includes('hackathon') || href.includes('event') || href.includes('hack'))
+        );
+}"""
+
+async def dump_page_html(page, path):
+    """Save the page's HTML for debugging without blocking the event loop"""
+    html_content = await page.content()
+    await asyncio.to_thread(os.makedirs, os.path.dirname(path), exist_ok=True)
+    await asyncio.to_thread(Path(path).write_text, html_content, encoding="utf-8")
+    print(f"Saved HTML content to {path}")
+
+async def capture_failure(page, screenshot_name, html_path):
+    """Save a screenshot and the HTML of a page that could not be extracted.
+    
+    Only failed pages are captured, so successful runs pay nothing for debugging.
+    """
+    if not DEBUG_MODE:
+        return
+    # The screenshot and the HTML snapshot are independent round trips, so run them together
+    _, html_result = await asyncio.gather(
+        take_screenshot(page, screenshot_name),
+        dump_page_html(page, html_path),
+        return_exceptions=True
+    )
+    if isinstance(html_result, Exception):
+        print(f"Error saving HTML content to {html_path}: {html_result}")
+
+async def reset_page(page):
+    """Move a page off a document whose script is stuck, closing it if that fails."""
+    try:
+        await page.goto("about:blank", timeout=NAVIGATION_TIMEOUT)
+    except PlaywrightError as e:
+        print(f"Could not reset page, closing it: {e}")
+        await page.close()
+
+async def extract_hackathon_links(page):
+    """Extract links to individual hackathon pages from the listing page."""
+    print(f"Extracting hackathon links from: {page.url}")
+    
+    try:
+        # Wait for the event cards rather than for the network to go quiet
+        try:
+            await page.wait_for_selector(LISTING_READY_SELECTOR, state="attached", timeout=READY_TIMEOUT)
+        except PlaywrightTimeoutError:
+            print("Timed out waiting for event cards, extracting anyway")
+        
+        # Extract hackathon cards from the "Upcoming Events" section, falling
+        # back to every event card on the page in the same evaluate
+        listing = await asyncio.wait_for(page.evaluate(LISTING_EXTRACTOR_SCRIPT), EXTRACT_TIMEOUT)
+        hackathon_data = listing["hackathons"]
+        if listing["scope"] != "upcoming":
+            print("No hackathon data found in the 'Upcoming Events' section. Used all event cards instead.")
+            # Every card includes the season's past events, so keep only the upcoming ones
+            hackathon_data = [
+                hack for hack in hackathon_data
+                if is_upcoming_event(hack.get("end_date"), hack.get("end_ts", 0))
+            ]
         
         # Log the results
         print(f"Found {len(hackathon_data)} hackathons from the MLH website")
@@ -508,18 +632,27 @@ async def extract_hackathon_links(page):
         print(f"Error extracting hackathon links: {e}")
         traceback.print_exc()
         
+        if isinstance(e, asyncio.TimeoutError):
+            # The extractor may still be running, so reload the listing before
+            # touching the page again
+            print("Listing extraction timed out, reloading the page")
+            try:
+                await page.reload(wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT)
+            except PlaywrightError as reload_error:
+                print(f"Listing page is unresponsive, skipping last-resort extraction: {reload_error}")
+                return [], []
+        else:
+            try:
+                await asyncio.wait_for(
+                    capture_failure(page, "mlh_listing.png", "debug/mlh_listing.html"), EXTRACT_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                print("Timed out capturing the listing page for debugging")
+        
         # Try a last-resort approach to find event links
         try:
             print("Attempting last-resort extraction of event links...")
-            event_links_raw = await page.evaluate("""() => {
-                // Get all links on the page
-                return Array.from(document.querySelectorAll('a[href]'))
-                    .map(a => a.href)
-                    .filter(href => 
-                        href.includes('mlh.io') && 
-                        (href.includes('hackathon') || href.includes('event') || href.includes('hack'))
-                    );
-            }""")
+            event_links_raw = await asyncio.wait_for(page.evaluate(EVENT_LINKS_SCRIPT), EXTRACT_TIMEOUT)
             
             event_links = [{"url": url, "title": url.split('/')[-1].replace('-', ' ').title(), "source_platform": "mlh"} 
                            for url in event_links_raw]
@@ -551,167 +684,44 @@ async def extract_hackathon_details(page, url, listing_data=None):
     try:
         # Navigate to the event page
         try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            await page.wait_for_load_state("networkidle", timeout=30000)
+            try:
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT)
+                # Gateway errors are usually momentary, so reload once after a
+                # short fixed delay instead of giving up on the event
+                if response and response.status in SERVER_ERROR_STATUSES:
+                    print(f"{url} returned {response.status}, reloading in {SERVER_ERROR_RELOAD_DELAY} seconds")
+                    await asyncio.sleep(SERVER_ERROR_RELOAD_DELAY)
+                    await page.reload(wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT)
+            except PlaywrightTimeoutError:
+                # A slow subresource can hold up domcontentloaded after the
+                # content we need has already arrived
+                if not await page.query_selector(DETAIL_READY_SELECTOR):
+                    raise
+                print(f"Navigation to {url} timed out, but the page content is present")
+            
+            try:
+                await page.wait_for_selector(DETAIL_READY_SELECTOR, state="attached", timeout=READY_TIMEOUT)
+            except PlaywrightTimeoutError:
+                print(f"Timed out waiting for the event header on {url}, continuing anyway")
         except Exception as e:
             print(f"Navigation error: {e}")
             # If navigation fails but we have listing data, we can still return that
             if event_details:
                 print("Using listing data despite navigation error")
+                await capture_failure(page, f"mlh_event_{event_id}.png", f"debug/events/{event_id}.html")
                 return event_details
             else:
                 raise  # Re-raise if we don't have listing data
         
-        # Take a screenshot of the event page
-        if DEBUG_MODE:
-            await take_screenshot(page, f"mlh_event_{event_id}.png")
-            
-            # Save HTML for debugging
-            html_content = await page.content()
-            os.makedirs("debug/events", exist_ok=True)
-            with open(f"debug/events/{event_id}.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-        
-        # Extract event details from the page
-        page_details = await page.evaluate("""() => {
-            const data = {};
-            
-            try {
-                // Title - try different selectors
-                const titleElement = document.querySelector('h1, .event-title, .title');
-                if (titleElement) {
-                    data.title = titleElement.textContent.trim();
-                }
-                
-                // Logo
-                const logoElement = document.querySelector('.event-logo, img[alt*="logo"], header img');
-                if (logoElement && logoElement.src) {
-                    data.logo_url = logoElement.src;
-                }
-                
-                // Banner image
-                const bannerElement = document.querySelector('.event-banner, .banner-image, .hero-image, header img[class*="banner"]');
-                if (bannerElement && bannerElement.src) {
-                    data.banner_url = bannerElement.src;
-                } else if (!data.banner_url) {
-                    // Try to find any large image that might be a banner
-                    const images = document.querySelectorAll('img');
-                    for (const img of images) {
-                        if (img.width > 600 || img.height > 300) {
-                            data.banner_url = img.src;
-                            break;
-                        }
-                    }
-                }
-                
-                // Dates - look for date information
-                const dateElement = document.querySelector('.event-date, .date, time, [datetime]');
-                if (dateElement) {
-                    // Try to get directly from datetime attribute
-                    const datetime = dateElement.getAttribute('datetime');
-                    if (datetime) {
-                        const date = new Date(datetime);
-                        data.start_date = date.toLocaleDateString('en-US', {month: 'long', day: 'numeric', year: 'numeric'});
-                    } else {
-                        // Extract from text content
-                        const dateText = dateElement.textContent.trim();
-                        // Look for patterns in the text
-                        const datePattern1 = /([A-Za-z]+)\\s+(\\d{1,2})\\s*-\\s*(\\d{1,2}),?\\s*(\\d{4})/i; // Month Day-Day, Year
-                        const datePattern2 = /([A-Za-z]+)\\s+(\\d{1,2})\\s*-\\s*([A-Za-z]+)\\s+(\\d{1,2}),?\\s*(\\d{4})/i; // Month Day - Month Day, Year
-                        
-                        const match1 = dateText.match(datePattern1);
-                        const match2 = dateText.match(datePattern2);
-                        
-                        if (match1) {
-                            const month = match1[1];
-                            const startDay = match1[2];
-                            const endDay = match1[3];
-                            const year = match1[4];
-                            
-                            data.start_date = `${month} ${startDay}, ${year}`;
-                            data.end_date = `${month} ${endDay}, ${year}`;
-                        } else if (match2) {
-                            const startMonth = match2[1];
-                            const startDay = match2[2];
-                            const endMonth = match2[3];
-                            const endDay = match2[4];
-                            const year = match2[5];
-                            
-                            data.start_date = `${startMonth} ${startDay}, ${year}`;
-                            data.end_date = `${endMonth} ${endDay}, ${year}`;
-                        }
-                    }
-                }
-                
-                // Location and mode
-                const locationElement = document.querySelector('.event-location, .location, [class*="location"]');
-                if (locationElement) {
-                    data.location = locationElement.textContent.trim();
-                    
-                    // Determine mode based on location text
-                    const locationText = data.location.toLowerCase();
-                    if (locationText.includes('online') || locationText.includes('virtual')) {
-                        data.mode = 'online';
-                    } else if (locationText.includes('hybrid')) {
-                        data.mode = 'hybrid';
-                    } else {
-                        data.mode = 'offline';
-                    }
-                }
-                
-                // Description
-                const descriptionElement = document.querySelector('.event-description, .description, section p');
-                if (descriptionElement) {
-                    data.description = descriptionElement.textContent.trim();
-                } else {
-                    // Try to find any paragraph that might be a description
-                    const paragraphs = document.querySelectorAll('main p, article p, section p');
-                    if (paragraphs.length > 0) {
-                        // Take the longest paragraph as the description
-                        let longestText = '';
-                        paragraphs.forEach(p => {
-                            const text = p.textContent.trim();
-                            if (text.length > longestText.length) {
-                                longestText = text;
-                            }
-                        });
-                        
-                        if (longestText) {
-                            data.description = longestText;
-                        }
-                    }
-                }
-                
-                // Check for registration link
-                const registrationElement = document.querySelector('a[href*="register"], a.register-button, a[class*="register"]');
-                if (registrationElement) {
-                    data.registration_url = registrationElement.href;
-                }
-                
-                // Organizer information
-                const organizerElement = document.querySelector('.organizer, .host, .university');
-                if (organizerElement) {
-                    data.organizer = organizerElement.textContent.trim();
-                }
-                
-                // Try to extract other useful information
-                // Prizes
-                const prizeElement = document.querySelector('[class*="prize"], [id*="prize"], h2:contains("Prize"), h3:contains("Prize")');
-                if (prizeElement) {
-                    data.prize_pool = prizeElement.textContent.trim();
-                }
-                
-                // Tags
-                const tagElements = document.querySelectorAll('.tag, .badge, [class*="tag"]');
-                if (tagElements.length > 0) {
-                    data.tags = Array.from(tagElements).map(tag => tag.textContent.trim()).join(', ');
-                }
-            } catch (e) {
-                console.error('Error extracting event details:', e);
-            }
-            
-            return data;
-        }""")
+        # Extract event details from the page. A runaway script on a malformed
+        # page fails this event instead of holding its worker indefinitely
+        try:
+            page_details = await asyncio.wait_for(page.evaluate(DETAIL_EXTRACTOR_CALL), EXTRACT_TIMEOUT)
+        except asyncio.TimeoutError:
+            # The script may still be running, so leave the page before it goes back to the pool
+            print(f"Extraction timed out on {url}, resetting the page")
+            await reset_page(page)
+            raise
         
         # Merge page details with listing data, prioritizing page details where available
         if page_details:
@@ -742,11 +752,15 @@ async def extract_hackathon_details(page, url, listing_data=None):
         event_details['source_platform'] = 'mlh'
         
         print(f"Extracted details for: {event_details.get('title', 'Unknown event')}")
+        save_cached_hackathon(url, event_details)
         return event_details
         
     except Exception as e:
         print(f"Error extracting event details: {e}")
         traceback.print_exc()
+        # A timed-out page has already been reset, so there is nothing left to capture
+        if not isinstance(e, asyncio.TimeoutError):
+            await capture_failure(page, f"mlh_event_{event_id}.png", f"debug/events/{event_id}.html")
         
         # If we have listing data, return that rather than failing completely
         if event_details:
@@ -772,30 +786,33 @@ def is_complete_hackathon(hackathon: Dict[str, Any], required_fields: List[str])
             return False
     return True
 
-def save_hackathons_to_csv(hackathons: List[Dict[str, Any]], filename: str) -> None:
-    """Save hackathons to a CSV file."""
-    if not hackathons:
-        print("No hackathons to save")
-        return
-    
-    # Prepare data for CSV
-    cleaned_hackathons = []
-    for hackathon in hackathons:
-        # Convert any dict/list fields to JSON strings for CSV compatibility
-        cleaned_hackathon = {}
-        for key, value in hackathon.items():
-            if isinstance(value, (dict, list)):
-                cleaned_hackathon[key] = json.dumps(value)
-            else:
-                cleaned_hackathon[key] = value
-        cleaned_hackathons.append(cleaned_hackathon)
+def iter_hackathons_jsonl(filename: str) -> Iterator[Dict[str, Any]]:
+    """Yield the hackathons stored in a JSON Lines file one at a time."""
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def save_hackathons_to_csv(hackathons: Iterable[Dict[str, Any]], filename: str,
+                           fieldnames: Optional[Set[str]] = None) -> None:
+    """Save hackathons to a CSV file.
     
-    # Collect all fields from all hackathons
-    fieldnames = set()
-    for hackathon in cleaned_hackathons:
-        fieldnames.update(hackathon.keys())
+    hackathons may be a one-shot iterator when fieldnames is given, so
+    records streamed from disk are written without being loaded all at once.
+    """
+    if fieldnames is None:
+        hackathons = list(hackathons)
+        if not hackathons:
+            print("No hackathons to save")
+            return
+        
+        # Collect all fields from all hackathons
+        fieldnames = set()
+        for hackathon in hackathons:
+            fieldnames.update(hackathon.keys())
     
     # Ensure required fields are at the beginning
+    fieldnames = set(fieldnames)
     ordered_fieldnames = []
     for field in REQUIRED_FIELDS:
         if field in fieldnames:
@@ -806,12 +823,196 @@ def save_hackathons_to_csv(hackathons: List[Dict[str, Any]], filename: str) -> N
     ordered_fieldnames.extend(sorted(fieldnames))
     
     # Write to CSV
+    saved_count = 0
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=ordered_fieldnames)
-        writer.writeheader()
-        writer.writerows(cleaned_hackathons)
+        writer = csv.writer(csvfile)
+        writer.writerow(ordered_fieldnames)
+        for hackathon in hackathons:
+            # Convert any dict/list fields to JSON strings for CSV compatibility
+            writer.writerow([
+                json.dumps(value) if isinstance(value, (dict, list)) else value
+                for value in (hackathon.get(field, '') for field in ordered_fieldnames)
+            ])
+            saved_count += 1
+    
+    print(f"Saved {saved_count} hackathons to '{filename}'")
+
+def is_tracker_request(request):
+    """True for requests to analytics and ad hosts the extractors never need."""
+    host = urlsplit(request.url).hostname or ""
+    return host.endswith(TRACKER_HOSTS)
+
+async def block_listing_resources(route):
+    """Abort requests for resources the listing extractor never looks at."""
+    if route.request.resource_type in LISTING_BLOCKED_RESOURCES or is_tracker_request(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def block_detail_resources(route):
+    """Abort fonts, media and trackers on event pages."""
+    if route.request.resource_type in DETAIL_BLOCKED_RESOURCES or is_tracker_request(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class TokenBucket:
+    """Async token bucket: bursts of up to `capacity` requests, refilled at `rate` per second.
+    
+    Requests only wait when the budget is used up, or while the server has
+    asked the crawler to back off.
+    """
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
     
-    print(f"Saved {len(hackathons)} hackathons to '{filename}'")
+    def pause(self, seconds):
+        """Hold every request for the given number of seconds."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+class HostRateLimiter:
+    """One TokenBucket per host, created the first time the host is seen.
+    
+    Event pages live on each event's own site, so a 429 from one host only
+    slows down navigations to that host.
+    """
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets = {}
+    
+    def bucket(self, url):
+        """Return the bucket for the host of the given URL."""
+        host = urlsplit(url).hostname or ""
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.capacity)
+        return self.buckets[host]
+    
+    async def acquire(self, url):
+        """Wait until a navigation to the given URL may be sent."""
+        await self.bucket(url).acquire()
+
+def watch_rate_limits(limiter):
+    """Build a response handler that pauses a host's bucket when that host signals pressure."""
+    def on_response(response):
+        # Only the event pages themselves count; subresources and iframes come
+        # from CDNs and third parties that the crawler doesn't pace
+        if response.request.resource_type != "document" or response.frame.parent_frame is not None:
+            return
+        
+        bucket = limiter.bucket(response.url)
+        host = urlsplit(response.url).hostname or ""
+        if response.status == 429:
+            try:
+                delay = float(response.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                delay = RATE_LIMIT_PAUSE
+            print(f"Rate limited by {host}, pausing navigations to it for {delay:.0f} seconds")
+            bucket.pause(delay)
+        elif response.headers.get("x-ratelimit-remaining") == "0":
+            bucket.pause(1 / bucket.rate)
+    
+    return on_response
+
+class PagePool:
+    """A fixed set of pages from one browser context, lent out one task at a time.
+    
+    Event pages live on many different hosts, so little connection reuse happens
+    between them. A single context means only one context to create and configure,
+    with one HTTP cache and one cookie jar shared by every page.
+    """
+    
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.free_pages = asyncio.Queue()
+        for page in self.pages:
+            self.free_pages.put_nowait(page)
+    
+    async def acquire(self):
+        """Wait for a free page and take it."""
+        return await self.free_pages.get()
+    
+    async def release(self, page):
+        """Return a page to the pool, replacing it if it was closed while lent out."""
+        if page.is_closed():
+            replacement = await page.context.new_page()
+            self.pages[self.pages.index(page)] = replacement
+            page = replacement
+        self.free_pages.put_nowait(page)
+
+async def new_detail_context(browser, limiter):
+    """Create a browser context configured for event pages."""
+    context = await browser.new_context(**CONTEXT_OPTIONS)
+    context.set_default_timeout(60000)  # 60 seconds
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+    await context.route("**/*", block_detail_resources)
+    await context.add_init_script(script=DETAIL_EXTRACTOR_INIT_SCRIPT)
+    context.on("response", watch_rate_limits(limiter))
+    return context
+
+async def scrape_all(urls, listing_data, browser, max_concurrency=DETAIL_CONCURRENCY, on_result=None):
+    """Scrape hackathon detail pages concurrently on one shared browser.
+    
+    Up to max_concurrency pages of a single context scrape events at once.
+    Returns one result per URL in input order, with failures returned as exceptions.
+    If given, on_result(hackathon) is called for each event as soon as it is scraped.
+    """
+    # Navigations run at full speed until a host's request budget or the host says otherwise
+    limiter = HostRateLimiter(REQUESTS_PER_SECOND, max_concurrency)
+    context = await new_detail_context(browser, limiter)
+    
+    async def scrape_one(url):
+        # Cached events skip both the page pool and the request budget
+        hackathon = load_cached_hackathon(url)
+        if hackathon:
+            print(f"Using cached details for: {hackathon.get('title', url)}")
+            if on_result is not None:
+                on_result(hackathon)
+            return hackathon
+        
+        # Wait for the host's budget before taking a page, so a paused host
+        # doesn't keep pages away from events on other hosts
+        await limiter.acquire(url)
+        page = await pool.acquire()
+        try:
+            hackathon = await extract_hackathon_details(page, url, listing_data)
+            if hackathon and on_result is not None:
+                on_result(hackathon)
+            return hackathon
+        finally:
+            await pool.release(page)
+    
+    try:
+        pool = PagePool([
+            await context.new_page()
+            for _ in range(max(1, min(max_concurrency, len(urls))))
+        ])
+        return await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+    finally:
+        await context.close()
 
 async def crawl_mlh_hackathons():
     """Main function to crawl MLH hackathons."""
@@ -820,25 +1021,22 @@ async def crawl_mlh_hackathons():
     
     async with async_playwright() as p:
         # Launch browser
-        browser = await p.chromium.launch(headless=not DEBUG_MODE)
-        context = await browser.new_context(
-            viewport={'width': 1280, 'height': 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        )
+        browser = await p.chromium.launch(headless=not DEBUG_MODE, args=BROWSER_ARGS)
+        context = await browser.new_context(**CONTEXT_OPTIONS)
         
-        # Set default timeout
+        # Set default timeouts
         context.set_default_timeout(60000)  # 60 seconds
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
         
-        page = await context.new_page()
+        # The listing context only serves the events page
+        await context.route("**/*", block_listing_resources)
         
-        # Initialize pages list with the main page to fix UnboundLocalError in finally block
-        pages = [page]
+        page = await context.new_page()
         
         try:
             # Navigate to the MLH events page
             print(f"Navigating to: {BASE_URL}")
             await page.goto(BASE_URL, wait_until="domcontentloaded")
-            await page.wait_for_load_state("networkidle")
             
             # Extract hackathon links and listing data
             hackathon_links, listing_data = await extract_hackathon_links(page)
@@ -859,78 +1057,75 @@ async def crawl_mlh_hackathons():
                     listing_data = [data for data in listing_data 
                                   if data.get("url") in hackathon_links]
             
-            # Check if we already have all the data from the listing page
-            all_data_available = all(
-                item.get("title") and item.get("start_date") and item.get("end_date") and item.get("mode")
-                for item in listing_data if isinstance(item, dict)
-            )
+            # Generate timestamp for the output filenames
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"mlh_upcoming_hackathons_{timestamp}.csv"
+            jsonl_filename = filename.replace('.csv', '.jsonl')
             
-            if all_data_available and len(listing_data) == len(hackathon_links):
-                print("All required data already extracted from listing page, skipping individual page visits")
-                all_hackathons = listing_data
-            else:
-                # Process each hackathon page
-                print(f"Processing {len(hackathon_links)} individual hackathon pages...")
-                
-                # Create a pool of pages for parallel processing
-                concurrency = min(5, len(hackathon_links))
-                # Ensure concurrency is at least 1 to avoid division by zero
-                concurrency = max(1, concurrency)
-                
-                # pages list already initialized at the beginning with the main page
+            # Each hackathon is appended to a JSON Lines file as soon as it is
+            # scraped, so progress survives a crash and results are not held in memory
+            fieldnames = set()
+            saved_count = 0
+            complete_count = 0
+            missing_counts = dict.fromkeys(REQUIRED_FIELDS, 0)
+            
+            with open(jsonl_filename, 'w', encoding='utf-8') as jsonl_file:
+                def record_hackathon(hackathon):
+                    nonlocal saved_count, complete_count
+                    jsonl_file.write(json.dumps(hackathon) + "\n")
+                    jsonl_file.flush()
+                    fieldnames.update(hackathon.keys())
+                    saved_count += 1
+                    if is_complete_hackathon(hackathon, REQUIRED_FIELDS):
+                        complete_count += 1
+                    for field in REQUIRED_FIELDS:
+                        if not hackathon.get(field):
+                            missing_counts[field] += 1
                 
-                for _ in range(concurrency - 1):
-                    pages.append(await context.new_page())
+                # Check if we already have all the data from the listing page
+                all_data_available = all(
+                    item.get("title") and item.get("start_date") and item.get("end_date") and item.get("mode")
+                    for item in listing_data if isinstance(item, dict)
+                )
                 
-                # Process hackathons in batches
-                all_hackathons = []
-                for i in range(0, len(hackathon_links), concurrency):
-                    batch = hackathon_links[i:i+concurrency]
-                    tasks = []
+                if all_data_available and len(listing_data) == len(hackathon_links):
+                    print("All required data already extracted from listing page, skipping individual page visits")
+                    for hackathon in listing_data:
+                        record_hackathon(hackathon)
+                else:
+                    # Process each hackathon page
+                    print(f"Processing {len(hackathon_links)} individual hackathon pages...")
                     
-                    for j, url in enumerate(batch):
-                        # Use the appropriate page from the pool
-                        hackathon_page = pages[j % len(pages)]
-                        
-                        # Create the task with listing data
-                        tasks.append(extract_hackathon_details(hackathon_page, url, listing_data))
+                    # Scrape all pages concurrently, bounded by DETAIL_CONCURRENCY
+                    results = await scrape_all(hackathon_links, listing_data, browser, on_result=record_hackathon)
                     
-                    # Wait for all tasks in this batch to complete
-                    batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # Process results
-                    for result in batch_results:
+                    # Report failures
+                    for result in results:
                         if isinstance(result, Exception):
                             print(f"Error during extraction: {result}")
-                        elif result:  # If not None
-                            all_hackathons.append(result)
-                    
-                    print(f"Processed batch {i//concurrency + 1}, total upcoming hackathons so far: {len(all_hackathons)}")
                     
-                    # Add a small delay between batches to avoid rate limiting
-                    await smart_wait(2, 4)
+                    print(f"Processed {len(hackathon_links)} hackathon pages, extracted {saved_count}")
             
             # Save results to CSV
-            if all_hackathons:
-                # Generate timestamp for the filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"mlh_upcoming_hackathons_{timestamp}.csv"
-                
-                # Save to CSV
-                save_hackathons_to_csv(all_hackathons, filename)
+            if saved_count:
+                # Stream the records back from the JSON Lines file
+                save_hackathons_to_csv(iter_hackathons_jsonl(jsonl_filename), filename, fieldnames)
                 
                 # Also save as JSON for easier inspection
                 json_filename = filename.replace('.csv', '.json')
                 with open(json_filename, 'w', encoding='utf-8') as f:
-                    json.dump(all_hackathons, f, indent=2)
+                    f.write("[\n")
+                    for index, hackathon in enumerate(iter_hackathons_jsonl(jsonl_filename)):
+                        if index:
+                            f.write(",\n")
+                        f.write(json.dumps(hackathon, indent=2))
+                    f.write("\n]\n")
                 
                 # Print summary of complete vs incomplete hackathons
-                complete_hackathons = [h for h in all_hackathons if is_complete_hackathon(h, REQUIRED_FIELDS)]
-                print(f"Complete hackathons: {len(complete_hackathons)}/{len(all_hackathons)}")
+                print(f"Complete hackathons: {complete_count}/{saved_count}")
                 
                 for field in REQUIRED_FIELDS:
-                    missing_field = sum(1 for h in all_hackathons if field not in h or not h[field])
-                    print(f"Hackathons missing {field}: {missing_field}")
+                    print(f"Hackathons missing {field}: {missing_counts[field]}")
             else:
                 print("No upcoming hackathons were found.")
                 
@@ -942,8 +1137,6 @@ async def crawl_mlh_hackathons():
             
         finally:
             # Close browser
-            for p in pages[1:]:  # Close additional pages
-                await p.close()
             await browser.close()
 
 if __name__ == "__main__":
@@ -1,23 +1,29 @@
 import os
 import csv
 import json
+import asyncio
 import argparse
 from dotenv import load_dotenv
-from groq import Groq
+from groq import AsyncGroq
 
 # Load environment variables
 load_dotenv()
 
 # Initialize Groq client
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
 
-def process_hackathon_data(file_path):
+GROQ_CONCURRENCY = 10  # Number of hackathons sent to the Groq API at the same time
+
+async def process_hackathon_data(file_path):
     """
     Process the hackathon CSV file, extract prize and schedule data,
     and use Groq API to return just the extracted information.
+    
+    Up to GROQ_CONCURRENCY requests are in flight at once; results keep the
+    order of the rows in the input file.
     """
-    # Initialize a list to store processed hackathons
-    processed_hackathons = []
+    # Initialize a list of the hackathons to send to Groq
+    pending_hackathons = []
     
     # Read the CSV file
     with open(file_path, 'r', encoding='utf-8') as csvfile:
@@ -52,9 +58,18 @@ def process_hackathon_data(file_path):
                 'schedule_details': schedule_details
             }
             
-            # Process with Groq API
-            processed_data = extract_info_with_groq(hackathon_data)
-            processed_hackathons.append(processed_data)
+            pending_hackathons.append(hackathon_data)
+    
+    # Process with Groq API
+    semaphore = asyncio.Semaphore(GROQ_CONCURRENCY)
+    
+    async def extract_limited(hackathon_data):
+        async with semaphore:
+            return await extract_info_with_groq(hackathon_data)
+    
+    processed_hackathons = await asyncio.gather(
+        *(extract_limited(hackathon_data) for hackathon_data in pending_hackathons)
+    )
     
     # Save processed data to new CSV
     output_file = file_path.replace('.csv', '_processed.csv')
@@ -62,7 +77,7 @@ def process_hackathon_data(file_path):
     
     return processed_hackathons
 
-def extract_info_with_groq(hackathon_data):
+async def extract_info_with_groq(hackathon_data):
     """
     Use Groq API to extract just the prize and schedule information from the hackathon data.
     """
@@ -87,7 +102,7 @@ def extract_info_with_groq(hackathon_data):
     
     try:
         # Call Groq API with the prompt
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="llama3-8b-8192",  # Using a currently supported model
             messages=[
                 {"role": "system", "content": "You are a precise data extraction assistant that extracts exact prize details and schedule information from hackathon data."},
@@ -162,7 +177,7 @@ def main():
         return
     
     print(f"Processing hackathon data from: {args.input}")
-    processed_data = process_hackathon_data(args.input)
+    processed_data = asyncio.run(process_hackathon_data(args.input))
     print(f"Processed {len(processed_data)} hackathons")
 
 if __name__ == "__main__":
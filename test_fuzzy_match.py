@@ -1,17 +1,26 @@
 import re
+from collections import Counter, defaultdict
+from functools import lru_cache
 
+# Common words that don't help with matching
+COMMON_WORDS = ['hackathon', 'challenge', 'competition', 'the', 'a', 'an', 'and', 'at', 'in', 'on', 'by', 'for', 'with', 'edition']
+
+# Patterns used by normalize_title, compiled once instead of on every call
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+COMMON_WORDS_RE = re.compile(r'\b(?:' + '|'.join(COMMON_WORDS) + r')\b')
+WHITESPACE_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=4096)
 def normalize_title(title):
     """Normalize a title for better comparison by removing common words and symbols"""
     # Convert to lowercase
     title = title.lower()
     # Remove special characters and replace with spaces
-    title = re.sub(r'[^\w\s]', ' ', title)
+    title = PUNCTUATION_RE.sub(' ', title)
     # Remove common words that don't help with matching
-    common_words = ['hackathon', 'challenge', 'competition', 'the', 'a', 'an', 'and', 'at', 'in', 'on', 'by', 'for', 'with', 'edition']
-    for word in common_words:
-        title = re.sub(r'\b' + word + r'\b', '', title)
+    title = COMMON_WORDS_RE.sub('', title)
     # Remove extra spaces
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = WHITESPACE_RE.sub(' ', title).strip()
     return title
 
 def title_similarity(title1, title2):
@@ -20,10 +29,14 @@ def title_similarity(title1, title2):
     if len(title1) < 10 or len(title2) < 10:
         return False
         
-    # Normalize both titles
-    norm1 = normalize_title(title1)
-    norm2 = normalize_title(title2)
+    return normalized_title_similarity(normalize_title(title1), normalize_title(title2))
+
+def normalized_title_similarity(norm1, norm2, words1=None, words2=None):
+    """Calculate similarity between two already normalized titles
     
+    words1 and words2 are the word sets of the normalized titles; callers that
+    compare one title many times can pass them in to skip re-splitting.
+    """
     # Don't compare normalized titles that are too short
     if len(norm1) < 5 or len(norm2) < 5:
         return False
@@ -33,8 +46,10 @@ def title_similarity(title1, title2):
         return True
     
     # Extract and compare words
-    words1 = set(norm1.split())
-    words2 = set(norm2.split())
+    if words1 is None:
+        words1 = set(norm1.split())
+    if words2 is None:
+        words2 = set(norm2.split())
     
     # Both should have some meaningful content
     if len(words1) < 2 or len(words2) < 2:
@@ -68,7 +83,9 @@ def title_similarity(title1, title2):
     return False
 
 def check_duplicates(titles):
-    seen_titles = {}  # Changed to dict to store original title and normalized version
+    seen_titles = {}  # Original title -> position in seen_entries
+    seen_entries = []  # (original title, normalized title, its word set), each computed once
+    word_to_titles = defaultdict(list)  # Normalized word -> positions of the seen titles containing it
     duplicates = []
     
     for title in titles:
@@ -84,20 +101,36 @@ def check_duplicates(titles):
         # Fuzzy matching for near-duplicates
         is_duplicate = False
         matching_title = None
+        norm_title = normalize_title(title)
+        words_title = set(norm_title.split())
         
-        for seen_title, norm_seen in seen_titles.items():
-            # Use our improved similarity function
-            if title_similarity(title, seen_title):
-                # Double-check with either the normalized title
-                # or with a character-level similarity as a safety check
-                is_duplicate = True
-                matching_title = seen_title
-                break
+        # Same short-title guards as title_similarity
+        if len(title) >= 10 and len(norm_title) >= 5:
+            # Word overlap only matters from two shared words up, so the full
+            # comparison runs just for titles the index says share at least two
+            shared_words = Counter(
+                position for word in words_title for position in word_to_titles.get(word, ())
+            )
+            
+            for position, (seen_title, norm_seen, words_seen) in enumerate(seen_entries):
+                if len(seen_title) < 10 or len(norm_seen) < 5:
+                    continue
+                
+                # Direct containment needs no shared words, so it is checked for every title
+                if (norm_title in norm_seen or norm_seen in norm_title
+                        or (shared_words[position] >= 2
+                            and normalized_title_similarity(norm_title, norm_seen, words_title, words_seen))):
+                    is_duplicate = True
+                    matching_title = seen_title
+                    break
         
         if is_duplicate:
             duplicates.append((title, matching_title, 'fuzzy'))
         else:
-            seen_titles[title] = normalize_title(title)
+            seen_titles[title] = len(seen_entries)
+            for word in words_title:
+                word_to_titles[word].append(len(seen_entries))
+            seen_entries.append((title, norm_title, words_title))
     
     return duplicates, list(seen_titles.keys())
 